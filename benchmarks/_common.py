@@ -0,0 +1,60 @@
+"""Shared helpers for the Auto-Calibrate benchmarks."""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Any
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"
+    ),
+)
+
+from _component import COMPONENT_DIR, REPO_ROOT, load_component_module
+
+__all__ = ["COMPONENT_DIR", "REPO_ROOT", "load_component_module"]
+
+
+def percentiles(samples: list[float], points: tuple[int, ...] = (50, 90, 99)) -> dict[str, float]:
+    """Return nearest-rank percentiles of the samples."""
+    if not samples:
+        return {f"p{point}": 0.0 for point in points}
+    ordered = sorted(samples)
+    return {
+        f"p{point}": ordered[min(len(ordered) - 1, len(ordered) * point // 100)]
+        for point in points
+    } | {"max": ordered[-1]}
+
+
+def git_revision() -> str | None:
+    """Return the current git commit of the repository."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path: str | None, benchmark: str, params: dict[str, Any], results: dict[str, Any]) -> None:
+    """Print the results and optionally save them as JSON."""
+    payload = {
+        "benchmark": benchmark,
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "params": params,
+        "results": results,
+    }
+    print(json.dumps(payload, indent=2))
+    if path:
+        with open(path, "w", encoding="utf-8") as result_file:
+            json.dump(payload, result_file, indent=2)
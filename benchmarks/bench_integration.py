@@ -0,0 +1,165 @@
+"""Benchmark the integration inside a Home Assistant test instance.
+
+Drives the real ``__init__.py`` and ``sensor.py`` through the state
+machine: startup of many config entries, a stream of source events and
+a reset storm. Requires ``pytest-homeassistant-custom-component``.
+
+    python benchmarks/bench_integration.py --sensors 200 --events 50 --output ha.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from _common import REPO_ROOT, percentiles, write_results
+
+sys.path.insert(0, REPO_ROOT)
+
+from homeassistant import loader
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.auto_calibrate.const import (
+    CONF_CUSTOM_NAME,
+    CONF_NAME,
+    CONF_SOURCE_ENTITY,
+    DOMAIN,
+    SERVICE_RESET,
+)
+
+
+def _entry(index: int, options: dict[str, object]) -> MockConfigEntry:
+    """Return the config entry of one calibrated sensor."""
+    source = f"sensor.bench_{index}"
+    return MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=source,
+        title=f"Bench {index} (calibrated)",
+        data={
+            CONF_SOURCE_ENTITY: source,
+            CONF_NAME: f"Bench {index} (calibrated)",
+            CONF_CUSTOM_NAME: "",
+            "source_device_identifiers": [],
+            "source_device_connections": [],
+            "entity_id_suffix": f"bench_{index}_calibrated",
+            "source_device_class": None,
+            "source_unit": None,
+            "source_display_precision": None,
+        },
+        options=options,
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, object]:
+    """Run all scenarios against one test instance."""
+    rng = random.Random(args.seed)
+    options = {"learning_mode": args.mode, "deadband": args.deadband}
+    results: dict[str, object] = {}
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            raws = [rng.uniform(200, 800) for _ in range(args.sensors)]
+            for index, raw in enumerate(raws):
+                hass.states.async_set(f"sensor.bench_{index}", str(round(raw, 1)))
+                _entry(index, options).add_to_hass(hass)
+
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            started = time.perf_counter()
+            assert await async_setup_component(hass, DOMAIN, {})
+            await hass.async_block_till_done()
+            startup = time.perf_counter() - started
+            memory = tracemalloc.get_traced_memory()[0] - baseline
+            tracemalloc.stop()
+            results["startup"] = {
+                "seconds": round(startup, 3),
+                "ms_per_entry": round(startup * 1000 / args.sensors, 3),
+                "memory_per_sensor_bytes": round(memory / args.sensors),
+            }
+
+            writes = 0
+
+            @callback
+            def _count_writes(event: Event) -> None:
+                nonlocal writes
+                if event.data["entity_id"].endswith("_calibrated"):
+                    writes += 1
+
+            unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_writes)
+            latencies: list[float] = []
+            started = time.perf_counter()
+            for _ in range(args.events):
+                for index in range(args.sensors):
+                    raws[index] += rng.gauss(0, 5)
+                    begin = time.perf_counter_ns()
+                    hass.states.async_set(
+                        f"sensor.bench_{index}", str(round(raws[index], 1))
+                    )
+                    latencies.append((time.perf_counter_ns() - begin) / 1000)
+            await hass.async_block_till_done()
+            elapsed = time.perf_counter() - started
+            events = args.sensors * args.events
+            results["events"] = {
+                "events_per_sec": round(events / elapsed),
+                "callback_latency_us": {
+                    k: round(v, 2) for k, v in percentiles(latencies).items()
+                },
+                "writes_per_event": round(writes / events, 3),
+            }
+
+            writes = 0
+            durations: list[float] = []
+            targets = [
+                f"sensor.bench_{index}_calibrated" for index in range(args.sensors)
+            ]
+            for _ in range(args.resets):
+                begin = time.perf_counter()
+                await hass.services.async_call(
+                    DOMAIN,
+                    SERVICE_RESET,
+                    {"entity_id": targets},
+                    blocking=True,
+                )
+                durations.append(time.perf_counter() - begin)
+            unsub()
+            results["reset_storm"] = {
+                "ms_per_reset": {
+                    k: round(v * 1000, 3) for k, v in percentiles(durations).items()
+                },
+                "writes_per_reset": round(writes / max(args.resets, 1), 1),
+            }
+
+            await hass.async_stop(force=True)
+
+    return results
+
+
+def main() -> None:
+    """Run the integration benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sensors", type=int, default=200)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--resets", type=int, default=10)
+    parser.add_argument("--mode", default="absolute")
+    parser.add_argument("--deadband", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    write_results(args.output, "integration", vars(args) | {"output": None}, results)
+
+
+if __name__ == "__main__":
+    main()
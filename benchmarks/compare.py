@@ -0,0 +1,49 @@
+"""Compare two benchmark result files.
+
+    python benchmarks/compare.py before.json after.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any
+
+
+def _flatten(data: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Flatten nested results into dotted metric names."""
+    flat: dict[str, float] = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def main() -> None:
+    """Print the change of every metric between two result files."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    with open(args.before, encoding="utf-8") as before_file:
+        before = json.load(before_file)
+    with open(args.after, encoding="utf-8") as after_file:
+        after = json.load(after_file)
+    if before["benchmark"] != after["benchmark"]:
+        parser.error("the files are results of different benchmarks")
+    if before["params"] != after["params"]:
+        print("warning: the benchmarks ran with different parameters")
+
+    old = _flatten(before["results"])
+    new = _flatten(after["results"])
+    print(f"{'metric':48} {before['revision'] or '?':>12} {after['revision'] or '?':>12}   change")
+    for name in sorted(old.keys() & new.keys()):
+        change = f"{(new[name] - old[name]) / old[name] * 100:+.1f}%" if old[name] else "n/a"
+        print(f"{name:48} {old[name]:>12g} {new[name]:>12g}   {change}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,478 @@
 """Auto-Calibrate Sensor Integration."""
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_STATE_CHANGED, Platform
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 import voluptuous as vol
 
-from .const import CONF_ENTITY_ID, DOMAIN, SERVICE_RESET
+from . import websocket_api
+from .config_flow import manifest_options_schema
+from .const import (
+    ATTR_MAX_RAW,
+    ATTR_MIN_RAW,
+    CONF_ATTRIBUTES,
+    CONF_BACKFILL_DAYS,
+    CONF_END,
+    CONF_ENTITY_ID,
+    CONF_MEMBERS,
+    CONF_NAME,
+    CONF_PATH,
+    CONF_PROFILE,
+    CONF_SOURCE_ENTITY,
+    CONF_START,
+    CONF_THRESHOLD,
+    DATA_DISPATCHER,
+    DATA_SENSORS,
+    DATA_STALE,
+    DATA_STARTUP,
+    DATA_STORE,
+    DEFAULT_THRESHOLD,
+    DOMAIN,
+    SERVICE_GET_FLIGHT_RECORDER,
+    SERVICE_IMPORT_MANIFEST,
+    SERVICE_RECOMPUTE_STATISTICS,
+    SERVICE_RESET,
+)
+from .engine import attribute_output_options, create_response_curve
+from .onboarding import (
+    CONF_DEFAULTS,
+    CONF_LIMITS,
+    CONF_OPTIONS,
+    CONF_SOURCES,
+    MANIFEST_SCHEMA,
+    async_import_sources,
+    load_manifest,
+)
+from .staleness import TimerWheel
+from .store import CalibrationStore
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+if TYPE_CHECKING:
+    from .sensor import AutoCalibrateSensor
 
+_LOGGER = logging.getLogger(__name__)
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Auto-Calibrate from a config entry."""
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SourceAction = Callable[[Event[EventStateChangedData]], None]
+StaleAction = Callable[[bool], None]
+
+STALE_RESOLUTION = 5
+
+
+class SourceDispatcher:
+    """Route source state changes to calibrated sensors from one listener.
+
+    A single ``state_changed`` listener is shared by every calibrated sensor.
+    The bus only invokes it for entities present in the index, and each
+    event is handed to the sensors registered for that source entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self._hass = hass
+        self._index: dict[str, tuple[SourceAction, ...]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, source_entity: str, action: SourceAction) -> CALLBACK_TYPE:
+        """Route state changes of a source entity to an action."""
+        self._index[source_entity] = self._index.get(source_entity, ()) + (action,)
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_dispatch,
+                event_filter=self._async_filter,
+            )
+
+        @callback
+        def _async_unregister() -> None:
+            actions = tuple(a for a in self._index.get(source_entity, ()) if a is not action)
+            if actions:
+                self._index[source_entity] = actions
+            else:
+                self._index.pop(source_entity, None)
+            if not self._index and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unregister
+
+    @callback
+    def _async_filter(self, event_data: EventStateChangedData) -> bool:
+        """Only let state changes of indexed source entities through."""
+        return event_data["entity_id"] in self._index
+
+    @callback
+    def _async_dispatch(self, event: Event[EventStateChangedData]) -> None:
+        """Hand a source state change to every sensor tracking it."""
+        for action in self._index.get(event.data["entity_id"], ()):
+            action(event)
+
+
+class StaleSourceMonitor:
+    """Flag calibrated sensors whose source stopped reporting, from one timer.
+
+    All sensors with a stale timeout share one ``TimerWheel`` and one
+    interval timer that only runs while a sensor is registered. Recording
+    a source report is a dict update; each tick only visits the wheel
+    buckets that came due.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self._hass = hass
+        self._wheel = TimerWheel(STALE_RESOLUTION)
+        self._actions: dict[Hashable, StaleAction] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self, key: Hashable, timeout: float, action: StaleAction
+    ) -> CALLBACK_TYPE:
+        """Call ``action(True)`` when ``key`` is not touched within ``timeout``.
+
+        ``action(False)`` is called when a stale key is touched again.
+        """
+        self._wheel.add(key, timeout, time.monotonic())
+        self._actions[key] = action
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self._hass, self._async_tick, timedelta(seconds=STALE_RESOLUTION)
+            )
+
+        @callback
+        def _async_unregister() -> None:
+            self._wheel.remove(key)
+            self._actions.pop(key, None)
+            if not self._actions and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return _async_unregister
+
+    @callback
+    def async_touch(self, key: Hashable) -> None:
+        """Record that the source of ``key`` reported."""
+        if self._wheel.touch(key, time.monotonic()):
+            self._actions[key](False)
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Flag the keys whose timeout passed since the previous tick."""
+        for key in self._wheel.advance(time.monotonic()):
+            self._actions[key](True)
+
+
+@callback
+def _async_migrate_entity_ids(hass: HomeAssistant) -> None:
+    """Rename calibrated sensors whose entity_id drifted from the expected one.
+
+    Runs once per startup for all config entries, before any platform is
+    set up.
+    """
+    ent_reg = er.async_get(hass)
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if CONF_MEMBERS in entry.data:
+            continue
+        source_entity: str = entry.data[CONF_SOURCE_ENTITY]
+        entity_id_suffix: str = entry.data.get(
+            "entity_id_suffix",
+            f"{source_entity.split('.', 1)[-1]}_calibrated",
+        )
+        expected_entity_id = f"sensor.{entity_id_suffix}"
+        existing_entity_id = ent_reg.async_get_entity_id(
+            "sensor", DOMAIN, f"auto_calibrate_{source_entity}"
+        )
+        if existing_entity_id is None or existing_entity_id == expected_entity_id:
+            continue
+        _LOGGER.info(
+            "Correcting entity_id from %s to %s",
+            existing_entity_id,
+            expected_entity_id,
+        )
+        try:
+            ent_reg.async_update_entity(
+                existing_entity_id,
+                new_entity_id=expected_entity_id,
+            )
+        except ValueError:
+            _LOGGER.warning(
+                "Could not update entity_id to %s (may already exist)",
+                expected_entity_id,
+            )
+
+
+@callback
+def _async_track_startup(hass: HomeAssistant, store_load: float, migration: float) -> None:
+    """Collect per-sensor setup timings and log them once Home Assistant started."""
+    timings: dict[str, float] = {"sensors": 0, "restore": 0.0, "subscribe": 0.0}
+    hass.data[DATA_STARTUP] = timings
+    begin = time.perf_counter()
+
+    @callback
+    def _async_log_startup(hass: HomeAssistant) -> None:
+        hass.data.pop(DATA_STARTUP, None)
+        _LOGGER.debug(
+            "Started %d calibrated sensors: store load %.1f ms, entity_id "
+            "migration %.1f ms, restore %.1f ms, source sync and subscribe "
+            "%.1f ms; Home Assistant started %.1f ms after domain setup",
+            timings["sensors"],
+            store_load * 1000,
+            migration * 1000,
+            timings["restore"] * 1000,
+            timings["subscribe"] * 1000,
+            (time.perf_counter() - begin) * 1000,
+        )
+
+    async_at_started(hass, _async_log_startup)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Auto-Calibrate domain and its services."""
+    begin = time.perf_counter()
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {}
+    hass.data[DATA_DISPATCHER] = SourceDispatcher(hass)
+    hass.data[DATA_SENSORS] = {}
+    hass.data[DATA_STALE] = StaleSourceMonitor(hass)
+    store = CalibrationStore(hass)
+    await store.async_load()
+    hass.data[DATA_STORE] = store
+    loaded = time.perf_counter()
+    _async_migrate_entity_ids(hass)
+    if not hass.is_running:
+        _async_track_startup(hass, loaded - begin, time.perf_counter() - loaded)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    @callback
+    def async_resolve_sensors(call: ServiceCall) -> list[AutoCalibrateSensor]:
+        """Return the calibrated sensors targeted by a service call."""
+        sensors: dict[str, AutoCalibrateSensor] = hass.data[DATA_SENSORS]
+        selected = async_extract_referenced_entity_ids(hass, call)
+        return [
+            sensors[entity_id]
+            for entity_id in selected.referenced | selected.indirectly_referenced
+            if entity_id in sensors
+        ]
 
-    async def handle_reset(call: ServiceCall) -> None:
+    async def handle_reset(call: ServiceCall) -> ServiceResponse:
         """Handle the reset service call."""
-        entity_ids: list[str] = call.data[CONF_ENTITY_ID]
-        for entity_id in entity_ids:
-            for entry_data in hass.data[DOMAIN].values():
-                sensor = entry_data.get("sensor")
-                if sensor is not None and sensor.entity_id == entity_id:
-                    sensor.reset_calibration()
-
-    if not hass.services.has_service(DOMAIN, SERVICE_RESET):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_RESET,
-            handle_reset,
-            schema=vol.Schema(
+        targets = async_resolve_sensors(call)
+
+        reset: list[dict[str, str | float | None]] = []
+        for sensor in targets:
+            reset.append(
                 {
-                    vol.Required(CONF_ENTITY_ID): cv.entity_ids,
+                    CONF_ENTITY_ID: sensor.entity_id,
+                    ATTR_MIN_RAW: sensor.min_raw,
+                    ATTR_MAX_RAW: sensor.max_raw,
                 }
-            ),
+            )
+            sensor.reset_calibration(write_state=False)
+        for sensor in targets:
+            sensor.async_write_ha_state()
+
+        if backfill_days := call.data.get(CONF_BACKFILL_DAYS):
+            for sensor in targets:
+                sensor.async_start_backfill(backfill_days)
+
+        if call.return_response:
+            return {"reset": reset}
+        return None
+
+    async def handle_recompute_statistics(call: ServiceCall) -> ServiceResponse:
+        """Handle the recompute_statistics service call."""
+        if "recorder" not in hass.config.components:
+            raise ServiceValidationError("The recorder is not loaded")
+        start = dt_util.as_utc(call.data[CONF_START])
+        end = dt_util.as_utc(call.data.get(CONF_END) or dt_util.utcnow())
+        if start >= end:
+            raise ServiceValidationError("The start must be before the end")
+
+        recomputed: list[dict[str, str | int]] = []
+        for sensor in async_resolve_sensors(call):
+            hours = await sensor.async_recompute_statistics(start, end)
+            recomputed.append({CONF_ENTITY_ID: sensor.entity_id, "hours": hours})
+
+        if call.return_response:
+            return {"recomputed": recomputed}
+        return None
+
+    async def handle_get_flight_recorder(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_flight_recorder service call."""
+        return {
+            "sensors": {
+                sensor.entity_id: sensor.flight_recorder.as_list()
+                for sensor in async_resolve_sensors(call)
+                if sensor.flight_recorder is not None
+            }
+        }
+
+    async def handle_import_manifest(call: ServiceCall) -> ServiceResponse:
+        """Handle the import_manifest service call."""
+        path: str | None = None
+        if CONF_PATH in call.data:
+            path = hass.config.path(call.data[CONF_PATH])
+            if not hass.config.is_allowed_path(path):
+                raise ServiceValidationError(f"Access to {path} is not allowed")
+        options_schema = manifest_options_schema()
+        try:
+            if path is not None:
+                manifest = await hass.async_add_executor_job(load_manifest, path)
+            else:
+                manifest = MANIFEST_SCHEMA({CONF_SOURCES: call.data[CONF_SOURCES]})
+            defaults = options_schema(manifest[CONF_DEFAULTS])
+            sources = [
+                (
+                    source[CONF_SOURCE_ENTITY],
+                    source[CONF_NAME],
+                    {**defaults, **options_schema(source[CONF_OPTIONS])},
+                )
+                for source in manifest[CONF_SOURCES]
+            ]
+            for _, _, options in sources:
+                create_response_curve(options)
+        except (OSError, ValueError, HomeAssistantError, vol.Invalid) as err:
+            raise ServiceValidationError(f"Invalid onboarding manifest: {err}") from err
+
+        created, skipped = await async_import_sources(
+            hass,
+            sources,
+            seeds={
+                source[CONF_SOURCE_ENTITY]: source[CONF_LIMITS]
+                for source in manifest[CONF_SOURCES]
+                if CONF_LIMITS in source
+            },
         )
 
+        if call.return_response:
+            return {"created": created, "skipped": skipped}
+        return None
+
+    websocket_api.async_setup(hass)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESET,
+        handle_reset,
+        schema=cv.make_entity_service_schema(
+            {
+                vol.Optional(CONF_BACKFILL_DAYS): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECOMPUTE_STATISTICS,
+        handle_recompute_statistics,
+        schema=cv.make_entity_service_schema(
+            {
+                vol.Required(CONF_START): cv.datetime,
+                vol.Optional(CONF_END): cv.datetime,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FLIGHT_RECORDER,
+        handle_get_flight_recorder,
+        schema=cv.make_entity_service_schema({}),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_MANIFEST,
+        handle_import_manifest,
+        schema=vol.All(
+            vol.Schema(
+                {
+                    vol.Exclusive(CONF_PATH, "manifest"): cv.string,
+                    vol.Exclusive(CONF_SOURCES, "manifest"): list,
+                }
+            ),
+            cv.has_at_least_one_key(CONF_PATH, CONF_SOURCES),
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     return True
 
 
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Auto-Calibrate from a config entry."""
+    hass.data[DOMAIN][entry.entry_id] = {}
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    return True
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running entities without a reload."""
+    entities: dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
+    if (group := entities.get("group")) is not None:
+        group.async_update(
+            entry.options.get(CONF_MEMBERS, entry.data[CONF_MEMBERS]),
+            entry.options.get(CONF_THRESHOLD, DEFAULT_THRESHOLD),
+        )
+        return
+    sensor: AutoCalibrateSensor | None = entities.get("sensor")
+    if sensor is None:
+        return
+    if not sensor.async_apply_options(entry.options):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    attribute_options = attribute_output_options(entry.options)
+    for output in entities.get("outputs", ()):
+        output.async_apply_options(attribute_options)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
-    if not hass.data[DOMAIN]:
-        hass.services.async_remove(DOMAIN, SERVICE_RESET)
-
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the learned calibration of a removed config entry."""
+    if CONF_MEMBERS in entry.data:
+        return
+    store: CalibrationStore = hass.data[DATA_STORE]
+    unique_id = f"auto_calibrate_{entry.data[CONF_SOURCE_ENTITY]}"
+    store.async_remove(unique_id)
+    if profile := entry.options.get(CONF_PROFILE):
+        store.async_update_profile(profile, unique_id, None, None)
+    for attribute in entry.options.get(CONF_ATTRIBUTES, []):
+        store.async_remove(f"{unique_id}_attribute_{attribute}")
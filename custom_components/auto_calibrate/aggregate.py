@@ -0,0 +1,88 @@
+"""Incrementally maintained statistics over a group of calibrated values."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+
+
+class RunningAggregate:
+    """Mean, min, max, median and count-below of a changing set of values.
+
+    A running sum gives the mean in O(1). The values are also kept in a
+    sorted list: a member change is a binary search plus one insert and one
+    delete, after which min, max and median are read by index and the count
+    below the threshold by one more binary search.
+    """
+
+    __slots__ = ("threshold", "_values", "_sorted", "_sum")
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize an empty aggregate."""
+        self.threshold = threshold
+        self._values: dict[str, float] = {}
+        self._sorted: list[float] = []
+        self._sum = 0.0
+
+    def update(self, key: str, value: float | None) -> bool:
+        """Set or clear (with ``None``) the value of one member.
+
+        Returns True if the set of values changed.
+        """
+        old = self._values.get(key)
+        if old == value:
+            return False
+        if old is not None:
+            del self._sorted[bisect_left(self._sorted, old)]
+            self._sum -= old
+        if value is None:
+            del self._values[key]
+            if not self._values:
+                self._sum = 0.0
+        else:
+            self._values[key] = value
+            insort(self._sorted, value)
+            self._sum += value
+        return True
+
+    def clear(self) -> None:
+        """Forget all member values."""
+        self._values.clear()
+        self._sorted.clear()
+        self._sum = 0.0
+
+    @property
+    def count(self) -> int:
+        """Return the number of members with a value."""
+        return len(self._sorted)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the member values."""
+        if not self._sorted:
+            return None
+        return self._sum / len(self._sorted)
+
+    @property
+    def min(self) -> float | None:
+        """Return the smallest member value."""
+        return self._sorted[0] if self._sorted else None
+
+    @property
+    def max(self) -> float | None:
+        """Return the largest member value."""
+        return self._sorted[-1] if self._sorted else None
+
+    @property
+    def median(self) -> float | None:
+        """Return the median of the member values."""
+        count = len(self._sorted)
+        if not count:
+            return None
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def count_below(self) -> int:
+        """Return the number of member values below the threshold."""
+        return bisect_left(self._sorted, self.threshold)
@@ -0,0 +1,139 @@
+"""Binary sensor platform for Auto-Calibrate."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    CONF_HYSTERESIS,
+    CONF_MEMBERS,
+    CONF_NAME,
+    CONF_SOURCE_ENTITY,
+    DEFAULT_HYSTERESIS,
+    DOMAIN,
+    THRESHOLD_KEYS,
+)
+from .sensor import entry_device_info
+
+ATTR_THRESHOLD = "threshold"
+ATTR_HYSTERESIS = "hysteresis"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the threshold binary sensors of a calibrated sensor entry."""
+    if CONF_MEMBERS in entry.data:
+        return
+
+    source_entity: str = entry.data[CONF_SOURCE_ENTITY]
+    entity_id_suffix: str = entry.data.get(
+        "entity_id_suffix",
+        f"{source_entity.split('.', 1)[-1]}_calibrated",
+    )
+    # Thresholds cleared in the options leave no orphaned entities behind.
+    ent_reg = er.async_get(hass)
+    for key, option in THRESHOLD_KEYS.items():
+        if entry.options.get(option) is None and (
+            entity_id := ent_reg.async_get_entity_id(
+                "binary_sensor", DOMAIN, f"auto_calibrate_{source_entity}_{key}"
+            )
+        ):
+            ent_reg.async_remove(entity_id)
+
+    thresholds: list[ThresholdBinarySensor] = hass.data[DOMAIN][
+        entry.entry_id
+    ].setdefault("thresholds", [])
+    async_add_entities(
+        ThresholdBinarySensor(
+            key,
+            source_entity,
+            entry.data[CONF_NAME],
+            entity_id_suffix,
+            entry_device_info(entry),
+            entry.options,
+            thresholds,
+        )
+        for key, option in THRESHOLD_KEYS.items()
+        if entry.options.get(option) is not None
+    )
+
+
+class ThresholdBinarySensor(BinarySensorEntity):
+    """On while the calibrated value is beyond a threshold, with hysteresis.
+
+    The ``low`` sensor turns on below its threshold and off again only
+    above threshold + hysteresis; the ``high`` sensor mirrors that. The
+    calibrated sensor evaluates it in the callback that updates its own
+    value, and the state is only written on transitions.
+    """
+
+    _attr_should_poll = False
+    _attr_has_entity_name = False
+
+    def __init__(
+        self,
+        key: str,
+        source_entity: str,
+        name: str,
+        entity_id_suffix: str,
+        device_info: DeviceInfo | None,
+        options: Mapping[str, Any],
+        thresholds: list[ThresholdBinarySensor],
+    ) -> None:
+        """Initialize the binary sensor."""
+        self.key = key
+        self._below = key == "low"
+        self._thresholds = thresholds
+        self._attr_name = f"{name} {key}"
+        self._attr_unique_id = f"auto_calibrate_{source_entity}_{key}"
+        self.entity_id = f"binary_sensor.{entity_id_suffix}_{key}"
+        self._attr_device_info = device_info
+        self.configure(options)
+
+    def configure(self, options: Mapping[str, Any]) -> None:
+        """Apply the threshold and hysteresis options."""
+        self._threshold: float = options[THRESHOLD_KEYS[self.key]]
+        self._hysteresis: float = options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
+        self._attr_extra_state_attributes = {
+            ATTR_THRESHOLD: self._threshold,
+            ATTR_HYSTERESIS: self._hysteresis,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the calibrated sensor of the entry while added."""
+        entry_id = self.platform.config_entry.entry_id
+        entities: dict[str, Any] = self.hass.data[DOMAIN][entry_id]
+        if (sensor := entities.get("sensor")) is not None:
+            self.async_evaluate(sensor.native_value, write_state=False)
+        self._thresholds.append(self)
+        self.async_on_remove(lambda: self._thresholds.remove(self))
+
+    @callback
+    def async_evaluate(self, value: float | None, write_state: bool = True) -> None:
+        """Update the state from the calibrated value, writing transitions."""
+        threshold = self._threshold
+        if value is None:
+            is_on = None
+        elif self._attr_is_on:
+            # Stay on until the value is back beyond the hysteresis band.
+            if self._below:
+                is_on = value <= threshold + self._hysteresis
+            else:
+                is_on = value >= threshold - self._hysteresis
+        else:
+            is_on = value < threshold if self._below else value > threshold
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
+        if write_state:
+            self.async_write_ha_state()
@@ -5,12 +5,504 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.helpers import entity_registry as er, device_registry as dr, selector
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import selector
 
-from .const import CONF_NAME, CONF_SOURCE_ENTITY, DOMAIN
+from .const import (
+    CONF_ATTRIBUTES,
+    CONF_BACKFILL_DAYS,
+    CONF_CURVE,
+    CONF_CURVE_PARAMETER,
+    CONF_CURVE_POINTS,
+    CONF_DEADBAND,
+    CONF_DISPLAY_PRECISION,
+    CONF_FLIGHT_RECORDER,
+    CONF_HALF_LIFE_DAYS,
+    CONF_HIGH_QUANTILE,
+    CONF_HIGH_THRESHOLD,
+    CONF_HYSTERESIS,
+    CONF_INSTRUMENTATION,
+    CONF_LEARNING_MODE,
+    CONF_LOCK_MAX,
+    CONF_LOCK_MIN,
+    CONF_LOW_QUANTILE,
+    CONF_LOW_THRESHOLD,
+    CONF_MAX_RAW,
+    CONF_MEMBERS,
+    CONF_MIN_INTERVAL,
+    CONF_MIN_RAW,
+    CONF_NAME,
+    CONF_PROFILE,
+    CONF_PROFILE_MODE,
+    CONF_REFERENCE_ENTITY,
+    CONF_REFERENCE_HALF_LIFE,
+    CONF_SKIP_UNCHANGED,
+    CONF_SOURCE_ENTITY,
+    CONF_STALE_TIMEOUT,
+    CONF_STALE_UNAVAILABLE,
+    CONF_THRESHOLD,
+    CONF_TREND_HALF_LIFE,
+    CONF_TREND_THRESHOLD,
+    CONF_UNIT_OF_MEASUREMENT,
+    CONF_WINDOW_DAYS,
+    DATA_STORE,
+    DEFAULT_BACKFILL_DAYS,
+    DEFAULT_CURVE,
+    DEFAULT_DEADBAND,
+    DEFAULT_FLIGHT_RECORDER,
+    DEFAULT_HALF_LIFE_DAYS,
+    DEFAULT_HIGH_QUANTILE,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_INSTRUMENTATION,
+    DEFAULT_LEARNING_MODE,
+    DEFAULT_LOW_QUANTILE,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_PROFILE_MODE,
+    DEFAULT_REFERENCE_HALF_LIFE,
+    DEFAULT_SKIP_UNCHANGED,
+    DEFAULT_STALE_TIMEOUT,
+    DEFAULT_STALE_UNAVAILABLE,
+    DEFAULT_THRESHOLD,
+    DEFAULT_TREND_HALF_LIFE,
+    DEFAULT_TREND_THRESHOLD,
+    DEFAULT_WINDOW_DAYS,
+    DOMAIN,
+)
+from .curves import CURVE_LINEAR, CURVE_LOG, CURVE_PIECEWISE, CURVE_POWER
+from .engine import create_response_curve
+from .limits import MODE_ABSOLUTE, MODE_DECAY, MODE_QUANTILE, MODE_WINDOW
+from .profiles import PROFILE_PRIOR, PROFILE_SHARED
+from .onboarding import (
+    CONF_OPTIONS,
+    async_import_sources,
+    resolve_source,
+    resolve_targets,
+    validate_source,
+)
 
-CONF_CUSTOM_NAME = "custom_name"
+CONF_ENTITIES = "entities"
+CONF_DEVICES = "devices"
+CONF_AREAS = "areas"
+CONF_LABELS = "labels"
+
+
+def settings_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the schema for the tunable calibration settings."""
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_LEARNING_MODE,
+                default=options.get(CONF_LEARNING_MODE, DEFAULT_LEARNING_MODE),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[MODE_ABSOLUTE, MODE_QUANTILE, MODE_WINDOW, MODE_DECAY],
+                    translation_key=CONF_LEARNING_MODE,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Optional(
+                CONF_LOW_QUANTILE,
+                default=options.get(CONF_LOW_QUANTILE, DEFAULT_LOW_QUANTILE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0.1,
+                    max=49.9,
+                    step=0.1,
+                    unit_of_measurement="%",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_HIGH_QUANTILE,
+                default=options.get(CONF_HIGH_QUANTILE, DEFAULT_HIGH_QUANTILE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=50.1,
+                    max=99.9,
+                    step=0.1,
+                    unit_of_measurement="%",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_WINDOW_DAYS,
+                default=options.get(CONF_WINDOW_DAYS, DEFAULT_WINDOW_DAYS),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=365,
+                    step=1,
+                    unit_of_measurement="d",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_HALF_LIFE_DAYS,
+                default=options.get(CONF_HALF_LIFE_DAYS, DEFAULT_HALF_LIFE_DAYS),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=365,
+                    step=1,
+                    unit_of_measurement="d",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_BACKFILL_DAYS,
+                default=options.get(CONF_BACKFILL_DAYS, DEFAULT_BACKFILL_DAYS),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=3650,
+                    step=1,
+                    unit_of_measurement="d",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_TREND_HALF_LIFE,
+                default=options.get(CONF_TREND_HALF_LIFE, DEFAULT_TREND_HALF_LIFE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=720,
+                    step=1,
+                    unit_of_measurement="h",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_TREND_THRESHOLD,
+                default=options.get(CONF_TREND_THRESHOLD, DEFAULT_TREND_THRESHOLD),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=100,
+                    step=0.1,
+                    unit_of_measurement="%",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_LOW_THRESHOLD,
+                description={"suggested_value": options.get(CONF_LOW_THRESHOLD)},
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    step="any", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(
+                CONF_HIGH_THRESHOLD,
+                description={"suggested_value": options.get(CONF_HIGH_THRESHOLD)},
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    step="any", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(
+                CONF_HYSTERESIS,
+                default=options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0, step="any", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(
+                CONF_DEADBAND,
+                default=options.get(CONF_DEADBAND, DEFAULT_DEADBAND),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=100,
+                    step=0.1,
+                    unit_of_measurement="%",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_MIN_INTERVAL,
+                default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=3600,
+                    step=1,
+                    unit_of_measurement="s",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_SKIP_UNCHANGED,
+                default=options.get(CONF_SKIP_UNCHANGED, DEFAULT_SKIP_UNCHANGED),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_STALE_TIMEOUT,
+                default=options.get(CONF_STALE_TIMEOUT, DEFAULT_STALE_TIMEOUT),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=10080,
+                    step=1,
+                    unit_of_measurement="min",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_STALE_UNAVAILABLE,
+                default=options.get(CONF_STALE_UNAVAILABLE, DEFAULT_STALE_UNAVAILABLE),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_INSTRUMENTATION,
+                default=options.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_FLIGHT_RECORDER,
+                default=options.get(CONF_FLIGHT_RECORDER, DEFAULT_FLIGHT_RECORDER),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=10000,
+                    step=1,
+                    unit_of_measurement="events",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+        }
+    )
+
+
+def output_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the schema for manual limits and the output format.
+
+    Cleared fields fall back to the learned limits and the source's unit
+    and precision.
+    """
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_MIN_RAW, description={"suggested_value": options.get(CONF_MIN_RAW)}
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    step="any", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(CONF_LOCK_MIN, default=False): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_MAX_RAW, description={"suggested_value": options.get(CONF_MAX_RAW)}
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    step="any", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(CONF_LOCK_MAX, default=False): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_UNIT_OF_MEASUREMENT,
+                description={"suggested_value": options.get(CONF_UNIT_OF_MEASUREMENT)},
+            ): selector.TextSelector(),
+            vol.Optional(
+                CONF_DISPLAY_PRECISION,
+                description={"suggested_value": options.get(CONF_DISPLAY_PRECISION)},
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0, max=6, step=1, mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+        }
+    )
+
+
+def attributes_schema(options: dict[str, Any], choices: list[str]) -> vol.Schema:
+    """Return the schema for calibrating attributes of the source as well.
+
+    ``choices`` are suggested; any other attribute name can be entered.
+    """
+    selected: list[str] = options.get(CONF_ATTRIBUTES, [])
+    return vol.Schema(
+        {
+            vol.Optional(CONF_ATTRIBUTES, default=selected): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=sorted({*choices, *selected}),
+                    multiple=True,
+                    custom_value=True,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+        }
+    )
+
+
+def numeric_attributes(hass: HomeAssistant, entity_id: str) -> list[str]:
+    """Return the names of an entity's attributes that hold a number."""
+    if (state := hass.states.get(entity_id)) is None:
+        return []
+    choices: list[str] = []
+    for name, value in state.attributes.items():
+        if isinstance(value, bool):
+            continue
+        try:
+            float(value)
+        except (TypeError, ValueError):
+            continue
+        choices.append(name)
+    return choices
+
+
+def profile_schema(options: dict[str, Any], names: list[str]) -> vol.Schema:
+    """Return the schema for linking a calibration profile.
+
+    ``names`` are the existing profiles; typing a new name creates one.
+    """
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_PROFILE, description={"suggested_value": options.get(CONF_PROFILE)}
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=sorted(names),
+                    custom_value=True,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Optional(
+                CONF_PROFILE_MODE,
+                default=options.get(CONF_PROFILE_MODE, DEFAULT_PROFILE_MODE),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[PROFILE_PRIOR, PROFILE_SHARED],
+                    translation_key=CONF_PROFILE_MODE,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+        }
+    )
+
+
+def profile_names(hass: HomeAssistant) -> list[str]:
+    """Return the names of the stored calibration profiles."""
+    if (store := hass.data.get(DATA_STORE)) is None:
+        return []
+    return list(store.profiles)
+
+
+def curve_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the schema for the response curve of the normalized value."""
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_CURVE, default=options.get(CONF_CURVE, DEFAULT_CURVE)
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[CURVE_LINEAR, CURVE_LOG, CURVE_POWER, CURVE_PIECEWISE],
+                    translation_key=CONF_CURVE,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Optional(
+                CONF_CURVE_PARAMETER,
+                description={"suggested_value": options.get(CONF_CURVE_PARAMETER)},
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0, step="any", mode=selector.NumberSelectorMode.BOX
+                )
+            ),
+            vol.Optional(
+                CONF_CURVE_POINTS,
+                description={"suggested_value": options.get(CONF_CURVE_POINTS)},
+            ): selector.TextSelector(),
+        }
+    )
+
+
+def curve_errors(options: dict[str, Any]) -> dict[str, str]:
+    """Return the form errors of an invalid response curve."""
+    try:
+        create_response_curve(options)
+    except ValueError:
+        if options.get(CONF_CURVE) == CURVE_PIECEWISE:
+            return {CONF_CURVE_POINTS: "invalid_curve_points"}
+        return {CONF_CURVE_PARAMETER: "invalid_curve_parameter"}
+    return {}
+
+
+def reference_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the schema for correcting the output against a reference sensor."""
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_REFERENCE_ENTITY,
+                description={"suggested_value": options.get(CONF_REFERENCE_ENTITY)},
+            ): selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
+            vol.Optional(
+                CONF_REFERENCE_HALF_LIFE,
+                default=options.get(
+                    CONF_REFERENCE_HALF_LIFE, DEFAULT_REFERENCE_HALF_LIFE
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=3650,
+                    step=1,
+                    unit_of_measurement="d",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+        }
+    )
+
+
+def manifest_options_schema() -> vol.Schema:
+    """Return the schema for the options of an onboarding manifest.
+
+    The options are checked with the selectors of the options flow, but
+    without their defaults so a source's options can override the
+    manifest defaults key by key.
+    """
+    validators: dict[Any, Any] = {}
+    for schema in (
+        settings_schema({}),
+        output_schema({}),
+        attributes_schema({}, []),
+        profile_schema({}, []),
+        curve_schema({}),
+        reference_schema({}),
+    ):
+        validators.update(schema.schema)
+    return vol.Schema(
+        {vol.Optional(str(key)): validator for key, validator in validators.items()}
+    )
+
+
+def group_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the schema for the members and the threshold of a group."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_MEMBERS, description={"suggested_value": options.get(CONF_MEMBERS)}
+            ): selector.EntitySelector(
+                selector.EntitySelectorConfig(
+                    integration=DOMAIN, domain="sensor", multiple=True
+                )
+            ),
+            vol.Optional(
+                CONF_THRESHOLD, default=options.get(CONF_THRESHOLD, DEFAULT_THRESHOLD)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=100,
+                    step=0.1,
+                    unit_of_measurement="%",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+        }
+    )
 
 
 class AutoCalibrateConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -18,10 +510,30 @@ class AutoCalibrateConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow."""
+        return AutoCalibrateOptionsFlow(config_entry)
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._title: str = ""
+        self._data: dict[str, Any] = {}
+        self._sources: list[str] = []
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(
+            step_id="user", menu_options=["single", "bulk", "group"]
+        )
+
+    async def async_step_single(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle adding a single source entity."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -30,85 +542,14 @@ class AutoCalibrateConfigFlow(ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(source_entity)
             self._abort_if_unique_id_configured()
 
-            state = self.hass.states.get(source_entity)
-            if state is None:
-                errors["base"] = "entity_not_found"
+            if error := validate_source(self.hass, source_entity):
+                errors["base"] = error
             else:
-                try:
-                    float(state.state)
-                except (ValueError, TypeError):
-                    if state.state not in ("unavailable", "unknown"):
-                        errors["base"] = "not_numeric"
-
-            if not errors:
                 custom_name = user_input.get(CONF_NAME, "").strip()
-                source_id = source_entity.split(".", 1)[-1]
-                entity_id_suffix = f"{source_id}_calibrated"
-
-                ent_reg = er.async_get(self.hass)
-                source_entry = ent_reg.async_get(source_entity)
-                source_device_identifiers: list[list[str]] = []
-                source_device_connections: list[list[str]] = []
-
-                if source_entry is not None and source_entry.device_id:
-                    dev_reg = dr.async_get(self.hass)
-                    source_device = dev_reg.async_get(source_entry.device_id)
-                    if source_device is not None:
-                        if source_device.identifiers:
-                            source_device_identifiers = [
-                                list(i) for i in source_device.identifiers
-                            ]
-                        if source_device.connections:
-                            source_device_connections = [
-                                list(c) for c in source_device.connections
-                            ]
-
-                source_state = self.hass.states.get(source_entity)
-                if source_state and source_state.attributes.get("friendly_name"):
-                    original_name = source_state.attributes["friendly_name"]
-                else:
-                    original_name = source_id.replace("_", " ").title()
-
-                source_device_class: str | None = None
-                source_unit: str | None = None
-                source_display_precision: int | None = None
-                if source_entry is not None:
-                    if source_entry.device_class:
-                        source_device_class = source_entry.device_class
-                    if source_entry.unit_of_measurement:
-                        source_unit = source_entry.unit_of_measurement
-                    if source_entry.options:
-                        sensor_opts = source_entry.options.get("sensor", {})
-                        if "display_precision" in sensor_opts:
-                            source_display_precision = sensor_opts["display_precision"]
-                        elif "suggested_display_precision" in sensor_opts:
-                            source_display_precision = sensor_opts["suggested_display_precision"]
-                if source_device_class is None and source_state:
-                    source_device_class = source_state.attributes.get("device_class")
-                if source_unit is None and source_state:
-                    source_unit = source_state.attributes.get("unit_of_measurement")
-
-                if custom_name:
-                    name = custom_name
-                    title = custom_name
-                else:
-                    name = f"{original_name} (calibrated)"
-                    title = name
-
-                return self.async_create_entry(
-                    title=title,
-                    data={
-                        CONF_SOURCE_ENTITY: source_entity,
-                        CONF_NAME: name,
-                        CONF_CUSTOM_NAME: custom_name,
-                        "source_device_identifiers": source_device_identifiers,
-                        "source_device_connections": source_device_connections,
-                        "entity_id_suffix": entity_id_suffix,
-                        "source_device_class": source_device_class,
-                        "source_unit": source_unit,
-                        "source_display_precision": source_display_precision,
-                    },
+                self._title, self._data = resolve_source(
+                    self.hass, source_entity, custom_name, {}
                 )
+                return await self.async_step_settings()
 
         data_schema = vol.Schema(
             {
@@ -120,7 +561,194 @@ class AutoCalibrateConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="single",
             data_schema=data_schema,
             errors=errors,
         )
+
+    async def async_step_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle adding many source entities, devices, areas or labels."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            configured = self._async_current_ids()
+            self._sources = [
+                entity_id
+                for entity_id in resolve_targets(
+                    self.hass,
+                    user_input.get(CONF_ENTITIES, []),
+                    user_input.get(CONF_DEVICES, []),
+                    user_input.get(CONF_AREAS, []),
+                    user_input.get(CONF_LABELS, []),
+                )
+                if entity_id not in configured
+                and validate_source(self.hass, entity_id) is None
+            ]
+            if self._sources:
+                return await self.async_step_settings()
+            errors["base"] = "no_new_sources"
+
+        data_schema = vol.Schema(
+            {
+                vol.Optional(CONF_ENTITIES): selector.EntitySelector(
+                    selector.EntitySelectorConfig(domain="sensor", multiple=True)
+                ),
+                vol.Optional(CONF_DEVICES): selector.DeviceSelector(
+                    selector.DeviceSelectorConfig(multiple=True)
+                ),
+                vol.Optional(CONF_AREAS): selector.AreaSelector(
+                    selector.AreaSelectorConfig(multiple=True)
+                ),
+                vol.Optional(CONF_LABELS): selector.LabelSelector(
+                    selector.LabelSelectorConfig(multiple=True)
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=data_schema,
+            errors=errors,
+        )
+
+    async def async_step_group(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle creating a group of calibrated sensors."""
+        if user_input is not None:
+            name: str = user_input[CONF_NAME].strip()
+            return self.async_create_entry(
+                title=name,
+                data={CONF_NAME: name, CONF_MEMBERS: user_input[CONF_MEMBERS]},
+                options={CONF_THRESHOLD: user_input[CONF_THRESHOLD]},
+            )
+
+        data_schema = vol.Schema({vol.Required(CONF_NAME): str}).extend(
+            group_schema({}).schema
+        )
+
+        return self.async_show_form(step_id="group", data_schema=data_schema)
+
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the calibration settings step."""
+        errors: dict[str, str] = {}
+        if user_input is not None and not (errors := curve_errors(user_input)):
+            if self._sources:
+                created, _ = await async_import_sources(
+                    self.hass,
+                    ((source, "", user_input) for source in self._sources),
+                )
+                return self.async_abort(
+                    reason="bulk_created",
+                    description_placeholders={"count": str(len(created))},
+                )
+            return self.async_create_entry(
+                title=self._title,
+                data=self._data,
+                options=user_input,
+            )
+
+        options = user_input or {}
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=settings_schema(options)
+            .extend(curve_schema(options).schema)
+            .extend(profile_schema(options, profile_names(self.hass)).schema),
+            errors=errors,
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create an entry for a source resolved by bulk onboarding."""
+        data: dict[str, Any] = import_data["data"]
+        await self.async_set_unique_id(data[CONF_SOURCE_ENTITY])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=import_data["title"],
+            data=data,
+            options=import_data[CONF_OPTIONS],
+        )
+
+
+class AutoCalibrateOptionsFlow(OptionsFlow):
+    """Change the settings of a calibrated sensor or a group.
+
+    Saved options are applied to the running entities by the entry's
+    update listener, without reloading the entry.
+    """
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the settings of a calibrated sensor."""
+        if CONF_MEMBERS in self._entry.data:
+            return await self.async_step_group()
+
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            options = dict(user_input)
+            self._lock_limits(options)
+            min_raw = options.get(CONF_MIN_RAW)
+            max_raw = options.get(CONF_MAX_RAW)
+            if min_raw is not None and max_raw is not None and min_raw >= max_raw:
+                errors["base"] = "invalid_limits"
+            elif (
+                options.get(CONF_REFERENCE_ENTITY)
+                == self._entry.data[CONF_SOURCE_ENTITY]
+            ):
+                errors[CONF_REFERENCE_ENTITY] = "reference_is_source"
+            elif not (errors := curve_errors(options)):
+                return self.async_create_entry(data=options)
+
+        options = {**self._entry.options, **(user_input or {})}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=settings_schema(options)
+            .extend(output_schema(options).schema)
+            .extend(
+                attributes_schema(
+                    options,
+                    numeric_attributes(
+                        self.hass, self._entry.data[CONF_SOURCE_ENTITY]
+                    ),
+                ).schema
+            )
+            .extend(curve_schema(options).schema)
+            .extend(profile_schema(options, profile_names(self.hass)).schema)
+            .extend(reference_schema(options).schema),
+            errors=errors,
+        )
+
+    async def async_step_group(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the members and the threshold of a group."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = {
+            CONF_MEMBERS: self._entry.data[CONF_MEMBERS],
+            **self._entry.options,
+        }
+        return self.async_show_form(step_id="group", data_schema=group_schema(options))
+
+    def _lock_limits(self, options: dict[str, Any]) -> None:
+        """Turn the lock checkboxes into manual limits.
+
+        A locked limit without a manual value is frozen at the value the
+        running sensor currently uses.
+        """
+        entities: dict[str, Any] = self.hass.data[DOMAIN].get(self._entry.entry_id, {})
+        sensor = entities.get("sensor")
+        for lock, key in ((CONF_LOCK_MIN, CONF_MIN_RAW), (CONF_LOCK_MAX, CONF_MAX_RAW)):
+            if not options.pop(lock, False) or options.get(key) is not None:
+                continue
+            if sensor is not None and (current := getattr(sensor, key)) is not None:
+                options[key] = current
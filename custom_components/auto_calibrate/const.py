@@ -2,6 +2,7 @@ DOMAIN = "auto_calibrate"
 
 CONF_SOURCE_ENTITY = "source_entity"
 CONF_NAME = "name"
+CONF_CUSTOM_NAME = "custom_name"
 
 ATTR_MIN_RAW = "min_raw"
 ATTR_MAX_RAW = "max_raw"
@@ -10,3 +11,109 @@ ATTR_SOURCE_ENTITY = "source_entity"
 
 SERVICE_RESET = "reset"
 CONF_ENTITY_ID = "entity_id"
+
+DATA_DISPATCHER = f"{DOMAIN}_dispatcher"
+DATA_SENSORS = f"{DOMAIN}_sensors"
+DATA_STORE = f"{DOMAIN}_store"
+DATA_STARTUP = f"{DOMAIN}_startup"
+DATA_STALE = f"{DOMAIN}_stale"
+
+CONF_DEADBAND = "deadband"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_SKIP_UNCHANGED = "skip_unchanged"
+
+DEFAULT_DEADBAND = 0.0
+DEFAULT_MIN_INTERVAL = 0
+DEFAULT_SKIP_UNCHANGED = True
+
+ATTR_WRITES_SUPPRESSED = "writes_suppressed"
+
+CONF_LEARNING_MODE = "learning_mode"
+CONF_LOW_QUANTILE = "low_quantile"
+CONF_HIGH_QUANTILE = "high_quantile"
+
+DEFAULT_LEARNING_MODE = "absolute"
+DEFAULT_LOW_QUANTILE = 1.0
+DEFAULT_HIGH_QUANTILE = 99.0
+
+CONF_WINDOW_DAYS = "window_days"
+CONF_HALF_LIFE_DAYS = "half_life_days"
+
+DEFAULT_WINDOW_DAYS = 30.0
+DEFAULT_HALF_LIFE_DAYS = 30.0
+
+CONF_BACKFILL_DAYS = "backfill_days"
+DEFAULT_BACKFILL_DAYS = 0
+
+ATTR_BACKFILL_PROGRESS = "backfill_progress"
+
+SERVICE_IMPORT_MANIFEST = "import_manifest"
+CONF_PATH = "path"
+
+CONF_INSTRUMENTATION = "instrumentation"
+DEFAULT_INSTRUMENTATION = False
+
+SERVICE_RECOMPUTE_STATISTICS = "recompute_statistics"
+CONF_START = "start"
+CONF_END = "end"
+
+CONF_MEMBERS = "members"
+CONF_THRESHOLD = "threshold"
+DEFAULT_THRESHOLD = 20.0
+
+CONF_TREND_HALF_LIFE = "trend_half_life"
+CONF_TREND_THRESHOLD = "trend_threshold"
+DEFAULT_TREND_HALF_LIFE = 0
+DEFAULT_TREND_THRESHOLD = 20.0
+
+ATTR_SLOPE = "slope"
+ATTR_TIME_TO_THRESHOLD = "time_to_threshold"
+
+CONF_MIN_RAW = "min_raw"
+CONF_MAX_RAW = "max_raw"
+CONF_LOCK_MIN = "lock_min"
+CONF_LOCK_MAX = "lock_max"
+CONF_UNIT_OF_MEASUREMENT = "unit_of_measurement"
+CONF_DISPLAY_PRECISION = "display_precision"
+
+CONF_REFERENCE_ENTITY = "reference_entity"
+CONF_REFERENCE_HALF_LIFE = "reference_half_life"
+DEFAULT_REFERENCE_HALF_LIFE = 0
+
+ATTR_REFERENCE_ENTITY = "reference_entity"
+ATTR_GAIN = "gain"
+ATTR_OFFSET = "offset"
+
+CONF_FLIGHT_RECORDER = "flight_recorder"
+DEFAULT_FLIGHT_RECORDER = 0
+
+SERVICE_GET_FLIGHT_RECORDER = "get_flight_recorder"
+
+CONF_LOW_THRESHOLD = "low_threshold"
+CONF_HIGH_THRESHOLD = "high_threshold"
+CONF_HYSTERESIS = "hysteresis"
+DEFAULT_HYSTERESIS = 2.0
+
+THRESHOLD_KEYS = {"low": CONF_LOW_THRESHOLD, "high": CONF_HIGH_THRESHOLD}
+
+CONF_STALE_TIMEOUT = "stale_timeout"
+CONF_STALE_UNAVAILABLE = "stale_unavailable"
+DEFAULT_STALE_TIMEOUT = 0
+DEFAULT_STALE_UNAVAILABLE = False
+
+ATTR_STALE = "stale"
+
+CONF_CURVE = "curve"
+CONF_CURVE_PARAMETER = "curve_parameter"
+CONF_CURVE_POINTS = "curve_points"
+DEFAULT_CURVE = "linear"
+
+CONF_ATTRIBUTES = "attributes"
+
+ATTR_SOURCE_ATTRIBUTE = "source_attribute"
+
+CONF_PROFILE = "profile"
+CONF_PROFILE_MODE = "profile_mode"
+DEFAULT_PROFILE_MODE = "prior"
+
+ATTR_PROFILE = "profile"
@@ -0,0 +1,112 @@
+"""Non-linear response curves for normalized values."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable
+import math
+
+CURVE_LINEAR = "linear"
+CURVE_LOG = "log"
+CURVE_POWER = "power"
+CURVE_PIECEWISE = "piecewise"
+
+DEFAULT_LOG_STRENGTH = 9.0
+DEFAULT_POWER_EXPONENT = 0.5
+
+# Normalized values are rounded to 0.1%, so a table with one entry per
+# 0.1% is exact and needs no interpolation.
+STEPS_PER_PERCENT = 10
+TABLE_SIZE = 100 * STEPS_PER_PERCENT + 1
+
+
+class ResponseCurve:
+    """A mapping of 0-100% to 0-100%, compiled to a lookup table.
+
+    The curve function is sampled once at every 0.1% step; evaluating the
+    curve is then a single index into the table.
+    """
+
+    __slots__ = ("kind", "_table")
+
+    def __init__(self, kind: str, function: Callable[[float], float]) -> None:
+        """Compile a curve function into its lookup table."""
+        self.kind = kind
+        self._table = array(
+            "d",
+            (
+                round(min(100.0, max(0.0, function(step / STEPS_PER_PERCENT))), 1)
+                for step in range(TABLE_SIZE)
+            ),
+        )
+
+    def __call__(self, value: float) -> float:
+        """Map a normalized value rounded to 0.1%."""
+        return self._table[int(value * STEPS_PER_PERCENT + 0.5)]
+
+
+def parse_points(text: str) -> list[tuple[float, float]]:
+    """Parse ``"x:y, x:y, ..."`` breakpoints of a piecewise-linear curve.
+
+    Raises ValueError unless there are at least two points within 0-100
+    with strictly increasing x.
+    """
+    points: list[tuple[float, float]] = []
+    for item in text.replace(";", ",").split(","):
+        if not item.strip():
+            continue
+        x_text, separator, y_text = item.partition(":")
+        if not separator:
+            raise ValueError(f"expected x:y, got {item.strip()!r}")
+        point = (float(x_text), float(y_text))
+        if not all(0 <= v <= 100 for v in point):
+            raise ValueError(f"point {item.strip()} is outside 0-100")
+        if points and point[0] <= points[-1][0]:
+            raise ValueError("x values must be strictly increasing")
+        points.append(point)
+    if len(points) < 2:
+        raise ValueError("at least two points are required")
+    return points
+
+
+def _piecewise(points: list[tuple[float, float]]) -> Callable[[float], float]:
+    """Return the function interpolating between breakpoints."""
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+
+    def function(value: float) -> float:
+        index = bisect_right(xs, value)
+        if index == 0:
+            return ys[0]
+        if index == len(xs):
+            return ys[-1]
+        x0, x1 = xs[index - 1], xs[index]
+        y0, y1 = ys[index - 1], ys[index]
+        return y0 + (y1 - y0) * (value - x0) / (x1 - x0)
+
+    return function
+
+
+def create_curve(
+    kind: str, parameter: float | None = None, points: str | None = None
+) -> ResponseCurve | None:
+    """Compile the configured curve; None stands for the linear identity.
+
+    Raises ValueError for invalid parameters or points.
+    """
+    if kind == CURVE_LOG:
+        strength = DEFAULT_LOG_STRENGTH if parameter is None else parameter
+        if strength <= 0:
+            raise ValueError("the log curve strength must be positive")
+        scale = 100 / math.log1p(strength)
+        return ResponseCurve(
+            kind, lambda value: scale * math.log1p(strength * value / 100)
+        )
+    if kind == CURVE_POWER:
+        exponent = DEFAULT_POWER_EXPONENT if parameter is None else parameter
+        if exponent <= 0:
+            raise ValueError("the power curve exponent must be positive")
+        return ResponseCurve(kind, lambda value: 100 * (value / 100) ** exponent)
+    if kind == CURVE_PIECEWISE:
+        return ResponseCurve(kind, _piecewise(parse_points(points or "")))
+    return None
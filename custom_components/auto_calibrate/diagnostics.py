@@ -0,0 +1,40 @@
+"""Diagnostics support for Auto-Calibrate."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SENSORS, DOMAIN
+from .stats import merge_stats
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Hot-path counters and the flight recorder are included for the entry's
+    sensor and its attribute outputs; the counters are also summed over all
+    sensors of the domain that have instrumentation enabled.
+    """
+    diagnostics: dict[str, Any] = {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+    }
+
+    entities: dict[str, Any] = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    if (sensor := entities.get("sensor")) is not None:
+        diagnostics["sensor"] = sensor.diagnostics()
+    if outputs := entities.get("outputs"):
+        diagnostics["outputs"] = [output.diagnostics() for output in outputs]
+
+    sensors = hass.data.get(DATA_SENSORS, {}).values()
+    instrumented = [sensor.stats for sensor in sensors if sensor.stats is not None]
+    diagnostics["domain"] = {
+        "sensors": len(sensors),
+        "instrumented": len(instrumented),
+        "writes_suppressed": sum(sensor.writes_suppressed for sensor in sensors),
+        "stats": merge_stats(instrumented).as_dict() if instrumented else None,
+    }
+    return diagnostics
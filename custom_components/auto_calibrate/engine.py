@@ -0,0 +1,377 @@
+"""Calibration engine for Auto-Calibrate.
+
+``CalibrationState`` holds the learning state of one calibrated output and
+caches its normalized value, mapped through an optional response curve,
+or the value corrected by a reference fit; the ``*_many`` functions update
+or re-normalize many outputs at once, vectorized with NumPy when it is
+installed.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from .const import (
+    CONF_BACKFILL_DAYS,
+    CONF_CURVE,
+    CONF_CURVE_PARAMETER,
+    CONF_CURVE_POINTS,
+    CONF_DISPLAY_PRECISION,
+    CONF_HALF_LIFE_DAYS,
+    CONF_HIGH_QUANTILE,
+    CONF_LEARNING_MODE,
+    CONF_LOW_QUANTILE,
+    CONF_MAX_RAW,
+    CONF_MIN_RAW,
+    CONF_PROFILE,
+    CONF_REFERENCE_ENTITY,
+    CONF_UNIT_OF_MEASUREMENT,
+    CONF_WINDOW_DAYS,
+    DEFAULT_CURVE,
+    DEFAULT_HALF_LIFE_DAYS,
+    DEFAULT_HIGH_QUANTILE,
+    DEFAULT_LEARNING_MODE,
+    DEFAULT_LOW_QUANTILE,
+    DEFAULT_WINDOW_DAYS,
+    THRESHOLD_KEYS,
+)
+from .curves import (
+    CURVE_LOG,
+    CURVE_PIECEWISE,
+    CURVE_POWER,
+    ResponseCurve,
+    create_curve,
+)
+from .fit import LinearFit
+from .limits import (
+    MODE_ABSOLUTE,
+    MODE_DECAY,
+    MODE_QUANTILE,
+    MODE_WINDOW,
+    AbsoluteLimits,
+    DecayLimits,
+    LimitTracker,
+    QuantileLimits,
+    WindowLimits,
+)
+from .profiles import CalibrationProfile
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+SECONDS_PER_DAY = 86400
+
+# Options in the units of the source state, or that read its history.
+# Attribute outputs leave them at their defaults.
+STATE_OUTPUT_OPTIONS = frozenset(
+    {
+        CONF_MIN_RAW,
+        CONF_MAX_RAW,
+        CONF_UNIT_OF_MEASUREMENT,
+        CONF_DISPLAY_PRECISION,
+        CONF_REFERENCE_ENTITY,
+        CONF_BACKFILL_DAYS,
+        CONF_PROFILE,
+        *THRESHOLD_KEYS.values(),
+    }
+)
+
+
+def attribute_output_options(options: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the options that apply to the attribute outputs of an entry."""
+    return {
+        option: value
+        for option, value in options.items()
+        if option not in STATE_OUTPUT_OPTIONS
+    }
+
+
+def limit_settings(options: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Return the learning mode and its tracker parameters, defaults applied.
+
+    Two option sets with equal settings produce equivalent trackers.
+    """
+    mode = options.get(CONF_LEARNING_MODE, DEFAULT_LEARNING_MODE)
+    if mode == MODE_QUANTILE:
+        return (
+            mode,
+            options.get(CONF_LOW_QUANTILE, DEFAULT_LOW_QUANTILE) / 100,
+            options.get(CONF_HIGH_QUANTILE, DEFAULT_HIGH_QUANTILE) / 100,
+        )
+    if mode == MODE_WINDOW:
+        return (
+            mode,
+            options.get(CONF_WINDOW_DAYS, DEFAULT_WINDOW_DAYS) * SECONDS_PER_DAY,
+        )
+    if mode == MODE_DECAY:
+        return (
+            mode,
+            options.get(CONF_HALF_LIFE_DAYS, DEFAULT_HALF_LIFE_DAYS) * SECONDS_PER_DAY,
+        )
+    return (MODE_ABSOLUTE,)
+
+
+def create_limits(options: Mapping[str, Any]) -> LimitTracker:
+    """Create the limit tracker for the configured learning mode."""
+    mode, *params = limit_settings(options)
+    if mode == MODE_QUANTILE:
+        return QuantileLimits(*params)
+    if mode == MODE_WINDOW:
+        return WindowLimits(*params)
+    if mode == MODE_DECAY:
+        return DecayLimits(*params)
+    return AbsoluteLimits()
+
+
+def restore_limits(options: Mapping[str, Any], data: Mapping[str, Any]) -> LimitTracker:
+    """Return a tracker of the configured learning mode restored from ``data``.
+
+    Raises ValueError if the data belongs to another learning mode or
+    cannot be restored.
+    """
+    tracker = create_limits(options)
+    if data.get("mode") != tracker.mode:
+        raise ValueError(f"expected limits of mode {tracker.mode}")
+    try:
+        tracker.restore(data)
+    except (KeyError, TypeError, ValueError) as err:
+        raise ValueError(f"invalid {tracker.mode} limits: {err}") from err
+    return tracker
+
+
+def curve_settings(options: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Return the response curve and the options it uses.
+
+    Two option sets with equal settings produce the same curve.
+    """
+    kind = options.get(CONF_CURVE, DEFAULT_CURVE)
+    if kind in (CURVE_LOG, CURVE_POWER):
+        return (kind, options.get(CONF_CURVE_PARAMETER))
+    if kind == CURVE_PIECEWISE:
+        return (kind, None, options.get(CONF_CURVE_POINTS))
+    return (kind,)
+
+
+def create_response_curve(options: Mapping[str, Any]) -> ResponseCurve | None:
+    """Compile the configured response curve; None means linear.
+
+    Raises ValueError if the curve's parameter or points are invalid.
+    """
+    return create_curve(*curve_settings(options))
+
+
+def normalize(
+    raw_value: float | None, min_raw: float | None, max_raw: float | None
+) -> float | None:
+    """Return a raw value normalized to 0-100% of the limits, rounded to 0.1."""
+    if raw_value is None or min_raw is None or max_raw is None:
+        return None
+
+    if min_raw == max_raw:
+        return 0.0
+
+    normalized = ((raw_value - min_raw) / (max_raw - min_raw)) * 100.0
+
+    return round(max(0.0, min(100.0, normalized)), 1)
+
+
+class CalibrationState:
+    """Learning state and cached output of one calibrated value.
+
+    Manual overrides, when set, replace the learned minimum or maximum in
+    the output while the tracker keeps learning underneath. A shared
+    profile, when set, does the same with its pooled limits. With a
+    reference fit, the output is the raw value corrected to the reference's
+    units instead of the normalized value. Otherwise a response curve, when
+    set, maps the normalized value.
+    """
+
+    __slots__ = (
+        "limits",
+        "raw_value",
+        "min_override",
+        "max_override",
+        "fit",
+        "curve",
+        "profile",
+        "_value",
+        "_valid",
+    )
+
+    def __init__(self, limits: LimitTracker) -> None:
+        """Initialize the state around a limit tracker."""
+        self.limits = limits
+        self.raw_value: float | None = None
+        self.min_override: float | None = None
+        self.max_override: float | None = None
+        self.fit: LinearFit | None = None
+        self.curve: ResponseCurve | None = None
+        self.profile: CalibrationProfile | None = None
+        self._value: float | None = None
+        self._valid = False
+
+    @property
+    def min_raw(self) -> float | None:
+        """Return the minimum used for the output."""
+        if self.min_override is not None:
+            return self.min_override
+        if self.profile is not None and (pooled := self.profile.min_raw) is not None:
+            return pooled
+        return self.limits.min_raw
+
+    @property
+    def max_raw(self) -> float | None:
+        """Return the maximum used for the output."""
+        if self.max_override is not None:
+            return self.max_override
+        if self.profile is not None and (pooled := self.profile.max_raw) is not None:
+            return pooled
+        return self.limits.max_raw
+
+    @property
+    def value(self) -> float | None:
+        """Return the normalized value, computing it only after changes."""
+        if not self._valid:
+            self.set_normalized(
+                None
+                if self.fit is not None
+                else normalize(self.raw_value, self.min_raw, self.max_raw)
+            )
+        return self._value
+
+    def set_normalized(self, normalized: float | None) -> float | None:
+        """Cache the output for a normalized value computed by the caller.
+
+        Batch callers normalize many states at once; the reference fit or
+        the response curve is applied here. Returns the output.
+        """
+        if self.fit is not None:
+            self._value = self._corrected()
+        elif self.curve is not None and normalized is not None:
+            self._value = self.curve(normalized)
+        else:
+            self._value = normalized
+        self._valid = True
+        return self._value
+
+    def _corrected(self) -> float | None:
+        """Return the raw value mapped through the reference fit."""
+        if self.raw_value is None:
+            return None
+        corrected = self.fit.predict(self.raw_value)
+        return round(corrected, 3) if corrected is not None else None
+
+    def set_overrides(self, min_raw: float | None, max_raw: float | None) -> None:
+        """Set or clear (with ``None``) the manual limits."""
+        self.min_override = min_raw
+        self.max_override = max_raw
+        self._valid = False
+
+    def set_fit(self, fit: LinearFit | None) -> None:
+        """Set or clear (with ``None``) the reference fit."""
+        self.fit = fit
+        self._valid = False
+
+    def set_profile(self, profile: CalibrationProfile | None) -> None:
+        """Set or clear (with ``None``) the profile whose limits are shared."""
+        self.profile = profile
+        self._valid = False
+
+    def set_curve(self, curve: ResponseCurve | None) -> None:
+        """Set or clear (with ``None``) the response curve."""
+        self.curve = curve
+        self._valid = False
+
+    def update_reference(self, reference: float, timestamp: float) -> bool:
+        """Pair a reference reading with the latest raw value.
+
+        Returns True if the pair was added to the fit.
+        """
+        if self.fit is None or self.raw_value is None:
+            return False
+        self.fit.update(timestamp, self.raw_value, reference)
+        self._valid = False
+        return True
+
+    def update(self, value: float, timestamp: float) -> bool:
+        """Learn from a raw value. Returns True if the limits changed."""
+        self.raw_value = value
+        self._valid = False
+        return self.limits.update(value, timestamp)
+
+    def set_limits(self, limits: LimitTracker) -> None:
+        """Replace the limit tracker."""
+        self.limits = limits
+        self._valid = False
+
+    def restore(self, limits_data: dict[str, Any] | None, raw_value: float | None) -> None:
+        """Restore the tracker state and the last raw value.
+
+        Tracker data learned in a different mode is ignored.
+        """
+        if limits_data and limits_data.get("mode") == self.limits.mode:
+            self.limits.restore(limits_data)
+        self.raw_value = raw_value
+        self._valid = False
+
+    def invalidate(self) -> None:
+        """Drop the cached value after the limits were changed directly."""
+        self._valid = False
+
+    def reset(self) -> None:
+        """Forget the learned limits, the reference fit and the last raw value."""
+        self.limits.reset()
+        if self.fit is not None:
+            self.fit.reset()
+        self.raw_value = None
+        self._valid = False
+
+
+def normalize_many(
+    raw_values: Sequence[float | None],
+    min_raws: Sequence[float | None],
+    max_raws: Sequence[float | None],
+) -> list[float | None]:
+    """Normalize many raw values against their limits at once."""
+    if np is None:
+        return [
+            normalize(raw, low, high)
+            for raw, low, high in zip(raw_values, min_raws, max_raws, strict=True)
+        ]
+
+    raw = np.array(raw_values, dtype=float)
+    low = np.array(min_raws, dtype=float)
+    span = np.array(max_raws, dtype=float) - low
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = np.round(np.clip((raw - low) / span * 100.0, 0.0, 100.0), 1)
+    normalized = np.where(span == 0, 0.0, normalized)
+    missing = np.isnan(raw) | np.isnan(span)
+    return [
+        None if is_missing else float(value)
+        for value, is_missing in zip(normalized, missing, strict=True)
+    ]
+
+
+def renormalize_many(states: Sequence[CalibrationState]) -> list[float | None]:
+    """Recompute and cache the values of many states at once."""
+    values = normalize_many(
+        [state.raw_value for state in states],
+        [state.min_raw for state in states],
+        [state.max_raw for state in states],
+    )
+    return [
+        state.set_normalized(value) for state, value in zip(states, values, strict=True)
+    ]
+
+
+def update_many(
+    states: Sequence[CalibrationState],
+    values: Sequence[float],
+    timestamps: Sequence[float],
+) -> list[float | None]:
+    """Feed one raw value to each state and return the new normalized values."""
+    for state, value, timestamp in zip(states, values, timestamps, strict=True):
+        state.update(value, timestamp)
+    return renormalize_many(states)
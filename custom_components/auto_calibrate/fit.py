@@ -0,0 +1,107 @@
+"""Online linear calibration against a reference sensor."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+class LinearFit:
+    """Exponentially weighted least-squares line from raw to reference values.
+
+    Weighted means and co-moments are updated in place with every pair
+    (West's algorithm), so memory and work per pair are constant and large
+    raw values do not lose precision to cancellation. With a half-life,
+    older pairs lose half their weight every ``half_life`` seconds; without
+    one, every pair keeps its weight. Two distinct pairs give the exact
+    two-point calibration.
+    """
+
+    __slots__ = (
+        "half_life",
+        "_time",
+        "_weight",
+        "_mean_x",
+        "_mean_y",
+        "_cxx",
+        "_cxy",
+        "_count",
+    )
+
+    def __init__(self, half_life: float | None = None) -> None:
+        """Initialize an empty fit."""
+        self.half_life = half_life
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all pairs."""
+        self._time: float | None = None
+        self._weight = 0.0
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._cxx = 0.0
+        self._cxy = 0.0
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """Return the number of pairs seen."""
+        return self._count
+
+    def update(self, timestamp: float, raw: float, reference: float) -> None:
+        """Add a (raw, reference) pair."""
+        if self._time is not None and self.half_life:
+            shift = timestamp - self._time
+            if shift > 0:
+                decay = math.exp2(-shift / self.half_life)
+                self._weight *= decay
+                self._cxx *= decay
+                self._cxy *= decay
+        if self._time is None or timestamp > self._time:
+            self._time = timestamp
+        self._weight += 1.0
+        dx = raw - self._mean_x
+        self._mean_x += dx / self._weight
+        self._mean_y += (reference - self._mean_y) / self._weight
+        self._cxx += dx * (raw - self._mean_x)
+        self._cxy += dx * (reference - self._mean_y)
+        self._count += 1
+
+    @property
+    def gain(self) -> float | None:
+        """Return the fitted reference change per raw unit."""
+        if self._count < 2:
+            return None
+        if self._cxx <= 1e-12 * self._weight * (1.0 + self._mean_x * self._mean_x):
+            return None
+        return self._cxy / self._cxx
+
+    @property
+    def offset(self) -> float | None:
+        """Return the fitted reference value at a raw value of zero."""
+        gain = self.gain
+        if gain is None:
+            return None
+        return self._mean_y - gain * self._mean_x
+
+    def predict(self, raw: float) -> float | None:
+        """Return the reference value the line predicts for a raw value."""
+        gain = self.gain
+        if gain is None:
+            return None
+        return self._mean_y + gain * (raw - self._mean_x)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fit state as a JSON-serializable dict."""
+        return {
+            "t": self._time,
+            "s": [self._weight, self._mean_x, self._mean_y, self._cxx, self._cxy],
+            "n": self._count,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the fit state from ``as_dict`` output."""
+        self._time = data["t"]
+        self._weight, self._mean_x, self._mean_y, self._cxx, self._cxy = (
+            float(v) for v in data["s"]
+        )
+        self._count = int(data["n"])
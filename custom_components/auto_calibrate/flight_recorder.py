@@ -0,0 +1,110 @@
+"""Fixed-size history of calibration decisions."""
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Any
+
+NAN = math.nan
+
+EVENT_MIN_CHANGED = 1
+EVENT_MAX_CHANGED = 2
+EVENT_UNPARSABLE = 4
+EVENT_RESET = 8
+EVENT_LIMITS_REPLACED = 16
+
+_EVENT_NAMES = (
+    (EVENT_MIN_CHANGED, "min_changed"),
+    (EVENT_MAX_CHANGED, "max_changed"),
+    (EVENT_UNPARSABLE, "unparsable"),
+    (EVENT_RESET, "reset"),
+    (EVENT_LIMITS_REPLACED, "limits_replaced"),
+)
+
+
+def _optional(value: float) -> float | None:
+    """Return None for the NaN that stands for a missing value."""
+    return None if math.isnan(value) else value
+
+
+class FlightRecorder:
+    """Ring buffer of the last ``size`` calibration events of one sensor.
+
+    Each column is a preallocated ``array``; recording an event overwrites
+    one slot per column, so nothing is allocated after construction.
+    Missing values are stored as NaN.
+    """
+
+    __slots__ = (
+        "size",
+        "_times",
+        "_raws",
+        "_mins",
+        "_maxs",
+        "_values",
+        "_events",
+        "_next",
+        "_count",
+    )
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty recorder."""
+        self.size = size
+        self._times = array("d", bytes(8 * size))
+        self._raws = array("d", bytes(8 * size))
+        self._mins = array("d", bytes(8 * size))
+        self._maxs = array("d", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+        self._events = array("B", bytes(size))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of recorded events."""
+        return self._count
+
+    def record(
+        self,
+        timestamp: float,
+        raw: float | None,
+        min_raw: float | None,
+        max_raw: float | None,
+        value: float | None,
+        events: int = 0,
+    ) -> None:
+        """Record one event, overwriting the oldest when full."""
+        index = self._next
+        self._times[index] = timestamp
+        self._raws[index] = NAN if raw is None else raw
+        self._mins[index] = NAN if min_raw is None else min_raw
+        self._maxs[index] = NAN if max_raw is None else max_raw
+        self._values[index] = NAN if value is None else value
+        self._events[index] = events
+        index += 1
+        self._next = 0 if index == self.size else index
+        if self._count < self.size:
+            self._count += 1
+
+    def clear(self) -> None:
+        """Forget all events."""
+        self._next = 0
+        self._count = 0
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the events, oldest first, as JSON-serializable dicts."""
+        start = (self._next - self._count) % self.size if self.size else 0
+        rows: list[dict[str, Any]] = []
+        for offset in range(self._count):
+            index = (start + offset) % self.size
+            events = self._events[index]
+            rows.append(
+                {
+                    "timestamp": self._times[index],
+                    "raw_value": _optional(self._raws[index]),
+                    "min_raw": _optional(self._mins[index]),
+                    "max_raw": _optional(self._maxs[index]),
+                    "value": _optional(self._values[index]),
+                    "events": [name for flag, name in _EVENT_NAMES if events & flag],
+                }
+            )
+        return rows
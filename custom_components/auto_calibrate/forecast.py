@@ -0,0 +1,92 @@
+"""Online trend estimation for calibrated values."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+class TrendEstimator:
+    """Exponentially weighted least-squares line through (time, value).
+
+    Five weighted sums are kept relative to the time of the latest sample,
+    so memory and work per sample are constant. Older samples lose half
+    their weight every ``half_life`` seconds.
+    """
+
+    __slots__ = ("half_life", "_time", "_s0", "_st", "_sy", "_stt", "_sty", "_count")
+
+    def __init__(self, half_life: float) -> None:
+        """Initialize an empty estimator."""
+        self.half_life = half_life
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._time: float | None = None
+        self._s0 = 0.0
+        self._st = 0.0
+        self._sy = 0.0
+        self._stt = 0.0
+        self._sty = 0.0
+        self._count = 0
+
+    def update(self, timestamp: float, value: float) -> None:
+        """Add a sample."""
+        if self._time is not None:
+            shift = timestamp - self._time
+            if shift < 0:
+                return
+            decay = math.exp2(-shift / self.half_life)
+            # Move the origin to the new sample, then age all weights.
+            self._stt = (self._stt - 2 * shift * self._st + shift * shift * self._s0) * decay
+            self._sty = (self._sty - shift * self._sy) * decay
+            self._st = (self._st - shift * self._s0) * decay
+            self._s0 *= decay
+            self._sy *= decay
+        self._time = timestamp
+        self._s0 += 1.0
+        self._sy += value
+        self._count += 1
+
+    @property
+    def slope(self) -> float | None:
+        """Return the fitted change of the value per second."""
+        if self._count < 2:
+            return None
+        denominator = self._s0 * self._stt - self._st * self._st
+        if denominator <= 1e-9 * self._s0 * self._stt:
+            return None
+        return (self._s0 * self._sty - self._st * self._sy) / denominator
+
+    @property
+    def level(self) -> float | None:
+        """Return the fitted value at the time of the latest sample."""
+        slope = self.slope
+        if slope is None:
+            return None
+        return (self._sy - slope * self._st) / self._s0
+
+    def time_to(self, threshold: float) -> float | None:
+        """Return the seconds until the fitted line reaches a threshold.
+
+        Returns None if the line does not move toward the threshold.
+        """
+        slope = self.slope
+        if not slope:
+            return None
+        seconds = (threshold - self.level) / slope
+        return seconds if seconds >= 0 else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimator state as a JSON-serializable dict."""
+        return {
+            "t": self._time,
+            "s": [self._s0, self._st, self._sy, self._stt, self._sty],
+            "n": self._count,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the estimator state from ``as_dict`` output."""
+        self._time = data["t"]
+        self._s0, self._st, self._sy, self._stt, self._sty = (float(v) for v in data["s"])
+        self._count = int(data["n"])
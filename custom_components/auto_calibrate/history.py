@@ -0,0 +1,260 @@
+"""Recorder history access for Auto-Calibrate."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .curves import ResponseCurve
+from .engine import normalize_many
+from .limits import LimitTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+CHUNK = timedelta(days=1)
+STATISTICS_CHUNK = timedelta(days=7)
+HOUR = 3600
+
+
+def _fetch_statistics(
+    hass: HomeAssistant, entity_id: str, start: datetime, end: datetime
+) -> list[tuple[float, float, float]]:
+    """Return hourly (start, min, max) statistics of an entity."""
+    stats = statistics_during_period(
+        hass, start, end, {entity_id}, "hour", None, {"min", "max"}
+    )
+    return [
+        (row["start"], row["min"], row["max"])
+        for row in stats.get(entity_id, [])
+        if row.get("min") is not None and row.get("max") is not None
+    ]
+
+
+def _fetch_states(
+    hass: HomeAssistant,
+    entity_id: str,
+    start: datetime,
+    end: datetime,
+    include_start_time_state: bool = False,
+) -> list[tuple[float, float]]:
+    """Return the numeric (value, timestamp) states of an entity."""
+    states = history.state_changes_during_period(
+        hass,
+        start,
+        end,
+        entity_id,
+        no_attributes=True,
+        include_start_time_state=include_start_time_state,
+    )
+    values: list[tuple[float, float]] = []
+    for state in states.get(entity_id, []):
+        try:
+            values.append((float(state.state), state.last_updated_timestamp))
+        except (ValueError, TypeError):
+            continue
+    return values
+
+
+async def async_backfill_limits(
+    hass: HomeAssistant,
+    entity_id: str,
+    tracker: LimitTracker,
+    start: datetime,
+    use_statistics: bool,
+    progress: Callable[[float], None],
+) -> int:
+    """Feed the recorded history of an entity into a limit tracker.
+
+    Hourly long-term statistics are used where available; raw states are
+    streamed in daily chunks for the rest of the range. All queries run in
+    the recorder executor and the tracker is only touched on the event
+    loop. Returns the number of values fed to the tracker.
+    """
+    instance = get_instance(hass)
+    end = dt_util.utcnow()
+    total = (end - start).total_seconds()
+    count = 0
+
+    if use_statistics:
+        rows = await instance.async_add_executor_job(
+            _fetch_statistics, hass, entity_id, start, end
+        )
+        for row_start, row_min, row_max in rows:
+            tracker.update(row_min, row_start)
+            tracker.update(row_max, row_start)
+        count += 2 * len(rows)
+        if rows:
+            start = dt_util.utc_from_timestamp(rows[-1][0]) + timedelta(hours=1)
+            progress((total - (end - start).total_seconds()) / total)
+
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + CHUNK, end)
+        values = await instance.async_add_executor_job(
+            _fetch_states, hass, entity_id, chunk_start, chunk_end
+        )
+        for value, timestamp in values:
+            tracker.update(value, timestamp)
+        count += len(values)
+        chunk_start = chunk_end
+        progress((total - (end - chunk_start).total_seconds()) / total)
+
+    _LOGGER.debug("Backfilled %s values of %s", count, entity_id)
+    return count
+
+
+def _hourly_statistics(
+    samples: list[tuple[float, float]],
+    start: float,
+    end: float,
+    carry: float | None,
+) -> tuple[list[tuple[float, float, float, float]], float | None]:
+    """Aggregate (value, timestamp) samples into hourly statistics.
+
+    Returns time-weighted (start, mean, min, max) rows of the hours in
+    ``start``-``end`` and the value still in effect at ``end``. ``carry`` is
+    the value in effect at ``start``.
+    """
+    rows: list[tuple[float, float, float, float]] = []
+    current = carry
+    index = 0
+    count = len(samples)
+    for hour_start in range(int(start), int(end), HOUR):
+        hour_end = hour_start + HOUR
+        total = 0.0
+        duration = 0.0
+        low = high = None
+        since = float(hour_start)
+        while True:
+            if index < count and samples[index][1] < hour_end:
+                value, timestamp = samples[index]
+                timestamp = max(timestamp, since)
+                index += 1
+            else:
+                value, timestamp = None, float(hour_end)
+            if current is not None and timestamp > since:
+                total += current * (timestamp - since)
+                duration += timestamp - since
+                if low is None or current < low:
+                    low = current
+                if high is None or current > high:
+                    high = current
+            if value is None:
+                break
+            current = value
+            since = timestamp
+        if duration:
+            rows.append((hour_start, total / duration, low, high))
+    return rows, current
+
+
+def _recompute_chunk(
+    hass: HomeAssistant,
+    entity_id: str,
+    start: datetime,
+    end: datetime,
+    min_raw: float,
+    max_raw: float,
+    carry: float | None,
+    curve: ResponseCurve | None = None,
+) -> tuple[list[tuple[float, float, float, float]], float | None]:
+    """Normalize one chunk of source history and aggregate it by hour."""
+    states = _fetch_states(
+        hass, entity_id, start, end, include_start_time_state=carry is None
+    )
+    values = normalize_many(
+        [value for value, _ in states],
+        [min_raw] * len(states),
+        [max_raw] * len(states),
+    )
+    if curve is not None:
+        values = [curve(value) if value is not None else None for value in values]
+    return _hourly_statistics(
+        [(value, state[1]) for value, state in zip(values, states, strict=True)],
+        start.timestamp(),
+        end.timestamp(),
+        carry,
+    )
+
+
+async def async_recompute_statistics(
+    hass: HomeAssistant,
+    statistic_id: str,
+    source_entity: str,
+    unit: str | None,
+    min_raw: float,
+    max_raw: float,
+    start: datetime,
+    end: datetime,
+    curve: ResponseCurve | None = None,
+) -> int:
+    """Rewrite the hourly statistics of a calibrated sensor.
+
+    The source history between ``start`` and ``end`` (both rounded down to
+    the hour) is normalized against the given limits, mapped through the
+    response curve if there is one, and imported as the sensor's own
+    long-term statistics, one week at a time. Fetching and aggregation run
+    in the recorder executor; each chunk is one batched import. Returns the
+    number of hours written.
+    """
+    instance = get_instance(hass)
+    start = start.replace(minute=0, second=0, microsecond=0)
+    end = end.replace(minute=0, second=0, microsecond=0)
+    metadata = StatisticMetaData(
+        has_mean=True,
+        has_sum=False,
+        name=None,
+        source="recorder",
+        statistic_id=statistic_id,
+        unit_of_measurement=unit,
+    )
+    carry: float | None = None
+    hours = 0
+
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + STATISTICS_CHUNK, end)
+        rows, carry = await instance.async_add_executor_job(
+            _recompute_chunk,
+            hass,
+            source_entity,
+            chunk_start,
+            chunk_end,
+            min_raw,
+            max_raw,
+            carry,
+            curve,
+        )
+        if rows:
+            statistics: list[StatisticData] = [
+                StatisticData(
+                    start=dt_util.utc_from_timestamp(row_start),
+                    mean=mean,
+                    min=low,
+                    max=high,
+                )
+                for row_start, mean, low, high in rows
+            ]
+            async_import_statistics(hass, metadata, statistics)
+            hours += len(rows)
+        chunk_start = chunk_end
+
+    _LOGGER.info(
+        "Recomputed %s hours of statistics for %s from %s",
+        hours,
+        statistic_id,
+        source_entity,
+    )
+    return hours
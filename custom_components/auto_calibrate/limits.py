@@ -0,0 +1,391 @@
+"""Limit trackers that learn the raw range of a source sensor.
+
+The trackers are plain Python so they can be used without Home Assistant.
+Every tracker exposes ``min_raw``/``max_raw``, learns from ``update`` and
+round-trips its state through ``as_dict``/``restore``.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+MODE_ABSOLUTE = "absolute"
+MODE_QUANTILE = "quantile"
+MODE_WINDOW = "window"
+MODE_DECAY = "decay"
+
+WINDOW_BUCKETS = 60
+
+
+class AbsoluteLimits:
+    """Track the all-time minimum and maximum raw values."""
+
+    mode = MODE_ABSOLUTE
+
+    __slots__ = ("min_raw", "max_raw")
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.min_raw: float | None = None
+        self.max_raw: float | None = None
+
+    def update(self, value: float, timestamp: float) -> bool:
+        """Learn from a raw value. Returns True if the limits changed."""
+        changed = False
+        if self.min_raw is None or value < self.min_raw:
+            self.min_raw = value
+            changed = True
+        if self.max_raw is None or value > self.max_raw:
+            self.max_raw = value
+            changed = True
+        return changed
+
+    def reset(self) -> None:
+        """Forget the learned limits."""
+        self.min_raw = None
+        self.max_raw = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tracker state as a JSON-serializable dict."""
+        return {"mode": self.mode, "min": self.min_raw, "max": self.max_raw}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the tracker state from ``as_dict`` output."""
+        self.min_raw = data.get("min")
+        self.max_raw = data.get("max")
+
+
+class P2Quantile:
+    """Streaming estimate of a single quantile with the P-square algorithm.
+
+    Jain & Chlamtac's P² keeps five markers whose heights approximate the
+    minimum, the p/2, p and (1+p)/2 quantiles and the maximum, so memory
+    stays constant however many values are observed.
+    """
+
+    __slots__ = ("p", "heights", "positions", "desired", "increments")
+
+    def __init__(self, p: float) -> None:
+        """Initialize the estimator for quantile ``p`` (0 < p < 1)."""
+        self.p = p
+        self.heights: list[float] = []
+        self.positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self.desired = [1.0, 1.0 + 2 * p, 1.0 + 4 * p, 3.0 + 2 * p, 5.0]
+        self.increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    @property
+    def value(self) -> float | None:
+        """Return the current quantile estimate."""
+        heights = self.heights
+        if not heights:
+            return None
+        if len(heights) < 5:
+            ordered = sorted(heights)
+            return ordered[min(len(ordered) - 1, int(self.p * len(ordered)))]
+        return heights[2]
+
+    def add(self, value: float) -> None:
+        """Add an observation."""
+        q = self.heights
+        if len(q) < 5:
+            q.append(value)
+            if len(q) == 5:
+                q.sort()
+            return
+
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= q[k + 1]:
+                k += 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self.desired
+        for i in range(5):
+            desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimator state as a JSON-serializable dict."""
+        return {"q": list(self.heights), "n": list(self.positions), "d": list(self.desired)}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the estimator state from ``as_dict`` output."""
+        self.heights = [float(v) for v in data["q"]]
+        self.positions = [float(v) for v in data["n"]]
+        self.desired = [float(v) for v in data["d"]]
+
+
+class QuantileLimits:
+    """Track a low and a high quantile of the raw values as the limits.
+
+    Unlike the absolute extremes, isolated glitch readings (such as 0 or
+    65535 from a re-pairing probe) barely move quantile estimates.
+    """
+
+    mode = MODE_QUANTILE
+
+    __slots__ = ("low", "high")
+
+    def __init__(self, low: float, high: float) -> None:
+        """Initialize the tracker with quantiles given as fractions."""
+        self.low = P2Quantile(low)
+        self.high = P2Quantile(high)
+
+    @property
+    def min_raw(self) -> float | None:
+        """Return the low quantile estimate."""
+        return self.low.value
+
+    @property
+    def max_raw(self) -> float | None:
+        """Return the high quantile estimate."""
+        return self.high.value
+
+    def update(self, value: float, timestamp: float) -> bool:
+        """Learn from a raw value. Returns True if the limits changed."""
+        before = (self.low.value, self.high.value)
+        self.low.add(value)
+        self.high.add(value)
+        return before != (self.low.value, self.high.value)
+
+    def reset(self) -> None:
+        """Forget the learned limits."""
+        self.low = P2Quantile(self.low.p)
+        self.high = P2Quantile(self.high.p)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tracker state as a JSON-serializable dict."""
+        return {
+            "mode": self.mode,
+            "low": self.low.p,
+            "high": self.high.p,
+            "low_sketch": self.low.as_dict(),
+            "high_sketch": self.high.as_dict(),
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the tracker state from ``as_dict`` output.
+
+        Sketches learned for different quantiles are discarded.
+        """
+        if data.get("low") == self.low.p:
+            self.low.restore(data["low_sketch"])
+        if data.get("high") == self.high.p:
+            self.high.restore(data["high_sketch"])
+
+
+class WindowLimits:
+    """Track the minimum and maximum raw values within a sliding time window.
+
+    Readings are folded into ``buckets`` fixed-width time buckets. Closed
+    buckets feed two monotonic deques (ascending minima, descending maxima)
+    so the window extremes are always at the deque fronts. Each update is
+    amortized O(1) and memory is bounded by the bucket count.
+    """
+
+    mode = MODE_WINDOW
+
+    __slots__ = (
+        "window",
+        "buckets",
+        "_width",
+        "_key",
+        "_cur_min",
+        "_cur_max",
+        "_mins",
+        "_maxs",
+        "min_raw",
+        "max_raw",
+    )
+
+    def __init__(self, window: float, buckets: int = WINDOW_BUCKETS) -> None:
+        """Initialize the tracker for a window given in seconds."""
+        self.window = window
+        self.buckets = buckets
+        self._width = window / buckets
+        self._key: int | None = None
+        self._cur_min = 0.0
+        self._cur_max = 0.0
+        self._mins: deque[tuple[int, float]] = deque()
+        self._maxs: deque[tuple[int, float]] = deque()
+        self.min_raw: float | None = None
+        self.max_raw: float | None = None
+
+    def update(self, value: float, timestamp: float) -> bool:
+        """Learn from a raw value. Returns True if the limits changed."""
+        key = int(timestamp // self._width)
+        if self._key is None:
+            self._key = key
+            self._cur_min = self._cur_max = value
+        elif key > self._key:
+            self._close_bucket()
+            self._key = key
+            self._cur_min = self._cur_max = value
+        else:
+            if value < self._cur_min:
+                self._cur_min = value
+            if value > self._cur_max:
+                self._cur_max = value
+
+        oldest = self._key - self.buckets + 1
+        mins = self._mins
+        while mins and mins[0][0] < oldest:
+            mins.popleft()
+        maxs = self._maxs
+        while maxs and maxs[0][0] < oldest:
+            maxs.popleft()
+
+        return self._refresh()
+
+    def _close_bucket(self) -> None:
+        """Push the current bucket's extremes onto the monotonic deques."""
+        key = self._key
+        mins = self._mins
+        while mins and mins[-1][1] >= self._cur_min:
+            mins.pop()
+        mins.append((key, self._cur_min))
+        maxs = self._maxs
+        while maxs and maxs[-1][1] <= self._cur_max:
+            maxs.pop()
+        maxs.append((key, self._cur_max))
+
+    def _refresh(self) -> bool:
+        """Recompute the window extremes. Returns True if they changed."""
+        min_raw = self._cur_min
+        if self._mins and self._mins[0][1] < min_raw:
+            min_raw = self._mins[0][1]
+        max_raw = self._cur_max
+        if self._maxs and self._maxs[0][1] > max_raw:
+            max_raw = self._maxs[0][1]
+        changed = min_raw != self.min_raw or max_raw != self.max_raw
+        self.min_raw = min_raw
+        self.max_raw = max_raw
+        return changed
+
+    def reset(self) -> None:
+        """Forget the learned limits."""
+        self._key = None
+        self._mins.clear()
+        self._maxs.clear()
+        self.min_raw = None
+        self.max_raw = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tracker state as a JSON-serializable dict."""
+        return {
+            "mode": self.mode,
+            "window": self.window,
+            "buckets": self.buckets,
+            "key": self._key,
+            "cur": [self._cur_min, self._cur_max],
+            "mins": [list(item) for item in self._mins],
+            "maxs": [list(item) for item in self._maxs],
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the tracker state from ``as_dict`` output.
+
+        Buckets of a different window or bucket count are discarded.
+        """
+        if (
+            data.get("window") != self.window
+            or data.get("buckets") != self.buckets
+            or data.get("key") is None
+        ):
+            return
+        self._key = int(data["key"])
+        self._cur_min, self._cur_max = (float(v) for v in data["cur"])
+        self._mins = deque((int(k), float(v)) for k, v in data["mins"])
+        self._maxs = deque((int(k), float(v)) for k, v in data["maxs"])
+        self._refresh()
+
+
+class DecayLimits:
+    """Track extremes that relax exponentially toward recent readings.
+
+    A new extreme is taken immediately. Otherwise both limits move toward
+    the current reading by a fraction that depends on the time elapsed, so
+    an extreme that is not seen again loses half its distance every
+    ``half_life`` seconds.
+    """
+
+    mode = MODE_DECAY
+
+    __slots__ = ("half_life", "min_raw", "max_raw", "_last")
+
+    def __init__(self, half_life: float) -> None:
+        """Initialize the tracker for a half-life given in seconds."""
+        self.half_life = half_life
+        self.min_raw: float | None = None
+        self.max_raw: float | None = None
+        self._last: float | None = None
+
+    def update(self, value: float, timestamp: float) -> bool:
+        """Learn from a raw value. Returns True if the limits changed."""
+        min_raw = self.min_raw
+        max_raw = self.max_raw
+        if min_raw is None or max_raw is None:
+            self.min_raw = self.max_raw = value
+            self._last = timestamp
+            return True
+        if self._last is None:
+            # Limits restored or seeded without a time start decaying now.
+            self._last = timestamp
+
+        elapsed = timestamp - self._last
+        if elapsed > 0:
+            self._last = timestamp
+            alpha = 1.0 - 0.5 ** (elapsed / self.half_life)
+        else:
+            alpha = 0.0
+
+        new_min = value if value < min_raw else min_raw + (value - min_raw) * alpha
+        new_max = value if value > max_raw else max_raw - (max_raw - value) * alpha
+        changed = new_min != min_raw or new_max != max_raw
+        self.min_raw = new_min
+        self.max_raw = new_max
+        return changed
+
+    def reset(self) -> None:
+        """Forget the learned limits."""
+        self.min_raw = None
+        self.max_raw = None
+        self._last = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tracker state as a JSON-serializable dict."""
+        return {
+            "mode": self.mode,
+            "min": self.min_raw,
+            "max": self.max_raw,
+            "last": self._last,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the tracker state from ``as_dict`` output."""
+        self.min_raw = data.get("min")
+        self.max_raw = data.get("max")
+        self._last = data.get("last")
+
+
+LimitTracker = AbsoluteLimits | QuantileLimits | WindowLimits | DecayLimits
@@ -0,0 +1,249 @@
+"""Source resolution and bulk onboarding for Auto-Calibrate."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+import json
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util.yaml import load_yaml
+
+from .const import (
+    CONF_CUSTOM_NAME,
+    CONF_NAME,
+    CONF_SOURCE_ENTITY,
+    DATA_STORE,
+    DOMAIN,
+)
+from .engine import restore_limits
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_DEFAULTS = "defaults"
+CONF_LIMITS = "limits"
+CONF_OPTIONS = "options"
+CONF_SOURCES = "sources"
+
+MANIFEST_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_DEFAULTS, default={}): dict,
+        vol.Required(CONF_SOURCES): [
+            vol.Schema(
+                {
+                    vol.Required(CONF_SOURCE_ENTITY): cv.entity_id,
+                    vol.Optional(CONF_NAME, default=""): cv.string,
+                    vol.Optional(CONF_OPTIONS, default={}): dict,
+                    vol.Optional(CONF_LIMITS): vol.Schema(
+                        {vol.Required("mode"): cv.string}, extra=vol.ALLOW_EXTRA
+                    ),
+                },
+                extra=vol.ALLOW_EXTRA,
+            )
+        ],
+    }
+)
+
+DeviceCache = dict[str, tuple[list[list[str]], list[list[str]]]]
+
+
+@callback
+def validate_source(hass: HomeAssistant, source_entity: str) -> str | None:
+    """Return an error key if an entity cannot be used as a source."""
+    state = hass.states.get(source_entity)
+    if state is None:
+        return "entity_not_found"
+    try:
+        float(state.state)
+    except (ValueError, TypeError):
+        if state.state not in ("unavailable", "unknown"):
+            return "not_numeric"
+    return None
+
+
+@callback
+def resolve_source(
+    hass: HomeAssistant,
+    source_entity: str,
+    custom_name: str,
+    devices: DeviceCache,
+) -> tuple[str, dict[str, Any]]:
+    """Resolve the entry title and data for a source entity.
+
+    Device identifiers and connections are looked up once per device and
+    kept in ``devices`` for the other entities of the same device.
+    """
+    source_id = source_entity.split(".", 1)[-1]
+    entity_id_suffix = f"{source_id}_calibrated"
+
+    ent_reg = er.async_get(hass)
+    source_entry = ent_reg.async_get(source_entity)
+    source_device_identifiers: list[list[str]] = []
+    source_device_connections: list[list[str]] = []
+
+    if source_entry is not None and source_entry.device_id:
+        device_id = source_entry.device_id
+        if device_id not in devices:
+            identifiers: list[list[str]] = []
+            connections: list[list[str]] = []
+            source_device = dr.async_get(hass).async_get(device_id)
+            if source_device is not None:
+                identifiers = [list(i) for i in source_device.identifiers]
+                connections = [list(c) for c in source_device.connections]
+            devices[device_id] = (identifiers, connections)
+        source_device_identifiers, source_device_connections = devices[device_id]
+
+    source_state = hass.states.get(source_entity)
+    if source_state and source_state.attributes.get("friendly_name"):
+        original_name = source_state.attributes["friendly_name"]
+    else:
+        original_name = source_id.replace("_", " ").title()
+
+    source_device_class: str | None = None
+    source_unit: str | None = None
+    source_display_precision: int | None = None
+    if source_entry is not None:
+        if source_entry.device_class:
+            source_device_class = source_entry.device_class
+        if source_entry.unit_of_measurement:
+            source_unit = source_entry.unit_of_measurement
+        if source_entry.options:
+            sensor_opts = source_entry.options.get("sensor", {})
+            if "display_precision" in sensor_opts:
+                source_display_precision = sensor_opts["display_precision"]
+            elif "suggested_display_precision" in sensor_opts:
+                source_display_precision = sensor_opts["suggested_display_precision"]
+    if source_device_class is None and source_state:
+        source_device_class = source_state.attributes.get("device_class")
+    if source_unit is None and source_state:
+        source_unit = source_state.attributes.get("unit_of_measurement")
+
+    if custom_name:
+        name = custom_name
+        title = custom_name
+    else:
+        name = f"{original_name} (calibrated)"
+        title = name
+
+    return title, {
+        CONF_SOURCE_ENTITY: source_entity,
+        CONF_NAME: name,
+        CONF_CUSTOM_NAME: custom_name,
+        "source_device_identifiers": source_device_identifiers,
+        "source_device_connections": source_device_connections,
+        "entity_id_suffix": entity_id_suffix,
+        "source_device_class": source_device_class,
+        "source_unit": source_unit,
+        "source_display_precision": source_display_precision,
+    }
+
+
+@callback
+def resolve_targets(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str] = (),
+    device_ids: Iterable[str] = (),
+    area_ids: Iterable[str] = (),
+    label_ids: Iterable[str] = (),
+) -> list[str]:
+    """Expand entities, devices, areas and labels into sensor entity ids.
+
+    Entities provided by Auto-Calibrate itself are never returned.
+    """
+    ent_reg = er.async_get(hass)
+    dev_reg = dr.async_get(hass)
+    device_ids = set(device_ids)
+    reg_entries: list[er.RegistryEntry] = []
+
+    for area_id in area_ids:
+        reg_entries.extend(er.async_entries_for_area(ent_reg, area_id))
+        device_ids.update(
+            device.id for device in dr.async_entries_for_area(dev_reg, area_id)
+        )
+    for label_id in label_ids:
+        reg_entries.extend(er.async_entries_for_label(ent_reg, label_id))
+        device_ids.update(
+            device.id for device in dr.async_entries_for_label(dev_reg, label_id)
+        )
+    for device_id in device_ids:
+        reg_entries.extend(er.async_entries_for_device(ent_reg, device_id))
+
+    resolved = dict.fromkeys(entity_ids)
+    resolved.update(dict.fromkeys(reg_entry.entity_id for reg_entry in reg_entries))
+    sources: list[str] = []
+    for entity_id in resolved:
+        if not entity_id.startswith("sensor."):
+            continue
+        reg_entry = ent_reg.async_get(entity_id)
+        if reg_entry is None or reg_entry.platform != DOMAIN:
+            sources.append(entity_id)
+    return sources
+
+
+async def async_import_sources(
+    hass: HomeAssistant,
+    sources: Iterable[tuple[str, str, dict[str, Any]]],
+    seeds: Mapping[str, dict[str, Any]] | None = None,
+) -> tuple[list[str], list[str]]:
+    """Create config entries for many (source_entity, name, options) at once.
+
+    ``seeds`` maps source entities to precomputed tracker state (for
+    example from ``tools/calibrate.py``) that new sensors start from.
+    Sources that are already configured, not numeric or whose seed cannot
+    be restored into a tracker of their learning mode are skipped.
+    Returns the created and the skipped source entities.
+    """
+    configured = {
+        entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    devices: DeviceCache = {}
+    created: list[str] = []
+    skipped: list[str] = []
+    flows = []
+
+    for source_entity, custom_name, options in sources:
+        if source_entity in configured or validate_source(hass, source_entity):
+            skipped.append(source_entity)
+            continue
+        seed = seeds.get(source_entity) if seeds else None
+        if seed is not None:
+            try:
+                restore_limits(options, seed)
+            except ValueError as err:
+                _LOGGER.warning("Skipping %s: invalid limits: %s", source_entity, err)
+                skipped.append(source_entity)
+                continue
+        configured.add(source_entity)
+        title, data = resolve_source(hass, source_entity, custom_name, devices)
+        if seed is not None:
+            hass.data[DATA_STORE].async_seed(f"auto_calibrate_{source_entity}", seed)
+        created.append(source_entity)
+        flows.append(
+            hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": SOURCE_IMPORT},
+                data={"title": title, "data": data, CONF_OPTIONS: options},
+            )
+        )
+
+    await asyncio.gather(*flows)
+    _LOGGER.info(
+        "Onboarded %s calibrated sensors, skipped %s", len(created), len(skipped)
+    )
+    return created, skipped
+
+
+def load_manifest(path: str) -> dict[str, Any]:
+    """Load and validate a JSON or YAML onboarding manifest."""
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    else:
+        manifest = load_yaml(path)
+    return MANIFEST_SCHEMA(manifest)
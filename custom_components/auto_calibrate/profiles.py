@@ -0,0 +1,70 @@
+"""Calibration limits pooled over sensors of the same probe model."""
+from __future__ import annotations
+
+from typing import Any
+
+from .aggregate import RunningAggregate
+
+PROFILE_PRIOR = "prior"
+PROFILE_SHARED = "shared"
+
+
+class CalibrationProfile:
+    """Limits pooled over the member sensors of one profile.
+
+    Every member contributes the minimum and maximum it learned. The pooled
+    limits are the medians of the members' minimums and of their maximums,
+    so a single probe in an odd spot does not move them. Both are kept in
+    a ``RunningAggregate``: a member update is a binary search and one
+    insert and delete per limit, and reading the pooled limits is an index.
+    """
+
+    __slots__ = ("_members", "_mins", "_maxs")
+
+    def __init__(self) -> None:
+        """Initialize a profile without members."""
+        self._members: dict[str, tuple[float, float]] = {}
+        self._mins = RunningAggregate(0.0)
+        self._maxs = RunningAggregate(0.0)
+
+    @property
+    def count(self) -> int:
+        """Return the number of members that contributed limits."""
+        return len(self._members)
+
+    @property
+    def min_raw(self) -> float | None:
+        """Return the pooled minimum."""
+        return self._mins.median
+
+    @property
+    def max_raw(self) -> float | None:
+        """Return the pooled maximum."""
+        return self._maxs.median
+
+    def update(
+        self, member: str, min_raw: float | None, max_raw: float | None
+    ) -> bool:
+        """Set or clear (with ``None``) the limits a member contributes.
+
+        Members only contribute once they learned a range. Returns True if
+        the pooled limits changed.
+        """
+        if min_raw is None or max_raw is None or min_raw >= max_raw:
+            min_raw = max_raw = None
+            self._members.pop(member, None)
+        else:
+            self._members[member] = (min_raw, max_raw)
+        pooled = (self._mins.median, self._maxs.median)
+        self._mins.update(member, min_raw)
+        self._maxs.update(member, max_raw)
+        return (self._mins.median, self._maxs.median) != pooled
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the members' contributions as a JSON-serializable dict."""
+        return {member: list(limits) for member, limits in self._members.items()}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the members' contributions from ``as_dict`` output."""
+        for member, (low, high) in data.items():
+            self.update(member, float(low), float(high))
@@ -1,31 +1,146 @@
 """Sensor platform for Auto-Calibrate."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     RestoreSensor,
     SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE
-from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    PERCENTAGE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    EntityCategory,
+    UnitOfTime,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util, slugify
 
+from . import SourceDispatcher, StaleSourceMonitor
 from .const import (
+    ATTR_BACKFILL_PROGRESS,
+    ATTR_GAIN,
     ATTR_MAX_RAW,
     ATTR_MIN_RAW,
+    ATTR_OFFSET,
+    ATTR_PROFILE,
     ATTR_RAW_VALUE,
+    ATTR_REFERENCE_ENTITY,
+    ATTR_SLOPE,
+    ATTR_SOURCE_ATTRIBUTE,
     ATTR_SOURCE_ENTITY,
+    ATTR_STALE,
+    ATTR_TIME_TO_THRESHOLD,
+    ATTR_WRITES_SUPPRESSED,
+    CONF_ATTRIBUTES,
+    CONF_BACKFILL_DAYS,
+    CONF_DEADBAND,
+    CONF_DISPLAY_PRECISION,
+    CONF_FLIGHT_RECORDER,
+    CONF_ENTITY_ID,
+    CONF_INSTRUMENTATION,
+    CONF_MAX_RAW,
+    CONF_MEMBERS,
+    CONF_MIN_INTERVAL,
+    CONF_MIN_RAW,
     CONF_NAME,
+    CONF_PROFILE,
+    CONF_PROFILE_MODE,
+    CONF_REFERENCE_ENTITY,
+    CONF_REFERENCE_HALF_LIFE,
+    CONF_SKIP_UNCHANGED,
     CONF_SOURCE_ENTITY,
+    CONF_STALE_TIMEOUT,
+    CONF_STALE_UNAVAILABLE,
+    CONF_THRESHOLD,
+    CONF_TREND_HALF_LIFE,
+    CONF_TREND_THRESHOLD,
+    CONF_UNIT_OF_MEASUREMENT,
+    DATA_DISPATCHER,
+    DATA_SENSORS,
+    DATA_STALE,
+    DATA_STARTUP,
+    DATA_STORE,
+    DEFAULT_BACKFILL_DAYS,
+    DEFAULT_DEADBAND,
+    DEFAULT_FLIGHT_RECORDER,
+    DEFAULT_INSTRUMENTATION,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_PROFILE_MODE,
+    DEFAULT_REFERENCE_HALF_LIFE,
+    DEFAULT_SKIP_UNCHANGED,
+    DEFAULT_STALE_TIMEOUT,
+    DEFAULT_STALE_UNAVAILABLE,
+    DEFAULT_THRESHOLD,
+    DEFAULT_TREND_HALF_LIFE,
+    DEFAULT_TREND_THRESHOLD,
     DOMAIN,
+    THRESHOLD_KEYS,
+)
+from .aggregate import RunningAggregate
+from .engine import (
+    SECONDS_PER_DAY,
+    CalibrationState,
+    attribute_output_options,
+    create_limits,
+    create_response_curve,
+    curve_settings,
+    limit_settings,
+    restore_limits,
+)
+from .fit import LinearFit
+from .flight_recorder import (
+    EVENT_LIMITS_REPLACED,
+    EVENT_MAX_CHANGED,
+    EVENT_MIN_CHANGED,
+    EVENT_RESET,
+    EVENT_UNPARSABLE,
+    FlightRecorder,
 )
+from .forecast import TrendEstimator
+from .history import async_backfill_limits, async_recompute_statistics
+from .limits import (
+    MODE_DECAY,
+    MODE_WINDOW,
+    AbsoluteLimits,
+    LimitTracker,
+    QuantileLimits,
+)
+from .profiles import PROFILE_PRIOR, PROFILE_SHARED
+from .stats import CallbackStats
+from .store import KEY_FIT, KEY_LIMITS, KEY_RAW, KEY_TREND, CalibrationStore, Record
+
+if TYPE_CHECKING:
+    from .binary_sensor import ThresholdBinarySensor
+
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_HOUR = 3600
+
+ReadingAction = Callable[[Any, float], None]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,11 +151,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Auto-Calibrate sensor from a config entry."""
+    if CONF_MEMBERS in entry.data:
+        _async_setup_group(hass, entry, async_add_entities)
+        return
+
     source_entity: str = entry.data[CONF_SOURCE_ENTITY]
     name: str = entry.data[CONF_NAME]
-    custom_name: str = entry.data.get("custom_name", "")
-    source_device_identifiers: list[list[str]] = entry.data.get("source_device_identifiers", [])
-    source_device_connections: list[list[str]] = entry.data.get("source_device_connections", [])
     entity_id_suffix: str = entry.data.get(
         "entity_id_suffix",
         f"{source_entity.split('.', 1)[-1]}_calibrated",
@@ -48,6 +164,101 @@ async def async_setup_entry(
     source_device_class: str | None = entry.data.get("source_device_class")
     source_unit: str | None = entry.data.get("source_unit")
     source_display_precision: int | None = entry.data.get("source_display_precision")
+    device_info = entry_device_info(entry)
+    store: CalibrationStore = hass.data[DATA_STORE]
+    source_outputs = SourceOutputs(source_entity)
+
+    sensor = AutoCalibrateSensor(
+        entry_id=entry.entry_id,
+        source_entity=source_entity,
+        name=name,
+        entity_id_suffix=entity_id_suffix,
+        store=store,
+        device_info=device_info,
+        source_device_class=source_device_class,
+        source_unit=source_unit,
+        source_display_precision=source_display_precision,
+        options=entry.options,
+        thresholds=hass.data[DOMAIN][entry.entry_id].setdefault("thresholds", []),
+        source_outputs=source_outputs,
+    )
+    attribute_options = attribute_output_options(entry.options)
+    outputs = [
+        AutoCalibrateSensor(
+            entry_id=entry.entry_id,
+            source_entity=source_entity,
+            name=name,
+            entity_id_suffix=entity_id_suffix,
+            store=store,
+            device_info=device_info,
+            options=attribute_options,
+            attribute=attribute,
+            source_outputs=source_outputs,
+        )
+        for attribute in entry.options.get(CONF_ATTRIBUTES, [])
+    ]
+
+    # Turning instrumentation off leaves no orphaned diagnostic entities behind.
+    ent_reg = er.async_get(hass)
+    entities: list[SensorEntity] = []
+    for output in (sensor, *outputs):
+        entities.append(output)
+        if output.stats is not None:
+            entities.extend(
+                AutoCalibrateDiagnosticSensor(output, description)
+                for description in DIAGNOSTIC_SENSORS
+            )
+            continue
+        for description in DIAGNOSTIC_SENSORS:
+            if entity_id := ent_reg.async_get_entity_id(
+                "sensor", DOMAIN, f"{output.unique_id}_{description.key}"
+            ):
+                ent_reg.async_remove(entity_id)
+    _async_remove_attribute_outputs(
+        hass, entry, {entity.unique_id for entity in entities}
+    )
+    async_add_entities(entities)
+    hass.data[DOMAIN][entry.entry_id]["sensor"] = sensor
+    hass.data[DOMAIN][entry.entry_id]["outputs"] = outputs
+
+
+@callback
+def _async_remove_attribute_outputs(
+    hass: HomeAssistant, entry: ConfigEntry, keep: set[str]
+) -> None:
+    """Remove the entities and calibration of attributes no longer calibrated.
+
+    Entities of attribute outputs whose unique_id is not in ``keep`` are
+    removed from the entity registry, and their records from the store.
+    """
+    prefix = f"auto_calibrate_{entry.data[CONF_SOURCE_ENTITY]}_attribute_"
+    ent_reg = er.async_get(hass)
+    store: CalibrationStore = hass.data[DATA_STORE]
+    for registry_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
+        unique_id = registry_entry.unique_id
+        if (
+            registry_entry.domain == "sensor"
+            and unique_id.startswith(prefix)
+            and unique_id not in keep
+        ):
+            ent_reg.async_remove(registry_entry.entity_id)
+            if store.async_get(unique_id) is not None:
+                store.async_remove(unique_id)
+
+
+def entry_device_info(entry: ConfigEntry) -> DeviceInfo | None:
+    """Return the device of a calibrated sensor entry's entities.
+
+    A custom name creates a service device; otherwise the entities join the
+    source entity's device, if it has one.
+    """
+    custom_name: str = entry.data.get("custom_name", "")
+    source_device_identifiers: list[list[str]] = entry.data.get(
+        "source_device_identifiers", []
+    )
+    source_device_connections: list[list[str]] = entry.data.get(
+        "source_device_connections", []
+    )
 
     device_info: DeviceInfo | None = None
 
@@ -72,40 +283,36 @@ async def async_setup_entry(
         if dev_info_kwargs:
             device_info = DeviceInfo(**dev_info_kwargs)
 
-    expected_entity_id = f"sensor.{entity_id_suffix}"
-    unique_id = f"auto_calibrate_{source_entity}"
+    return device_info
 
-    ent_reg = er.async_get(hass)
-    existing_entry = ent_reg.async_get_entity_id("sensor", DOMAIN, unique_id)
-    if existing_entry is not None and existing_entry != expected_entity_id:
-        _LOGGER.info(
-            "Correcting entity_id from %s to %s",
-            existing_entry,
-            expected_entity_id,
-        )
-        try:
-            ent_reg.async_update_entity(
-                existing_entry,
-                new_entity_id=expected_entity_id,
-            )
-        except ValueError:
-            _LOGGER.warning(
-                "Could not update entity_id to %s (may already exist)",
-                expected_entity_id,
-            )
 
-    sensor = AutoCalibrateSensor(
-        entry_id=entry.entry_id,
-        source_entity=source_entity,
-        name=name,
-        entity_id_suffix=entity_id_suffix,
-        device_info=device_info,
-        source_device_class=source_device_class,
-        source_unit=source_unit,
-        source_display_precision=source_display_precision,
+@callback
+def _async_setup_group(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the aggregate sensors of a group entry."""
+    group = AggregateGroup(
+        hass,
+        entry.options.get(CONF_MEMBERS, entry.data[CONF_MEMBERS]),
+        entry.options.get(CONF_THRESHOLD, DEFAULT_THRESHOLD),
     )
-    async_add_entities([sensor], True)
-    hass.data[DOMAIN][entry.entry_id]["sensor"] = sensor
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=entry.data[CONF_NAME],
+        manufacturer="Auto-Calibrate",
+        model="Calibrated Sensor Group",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+    entry.async_on_unload(group.async_start())
+    async_add_entities(
+        AutoCalibrateAggregateSensor(
+            group, entry.entry_id, entry.data[CONF_NAME], device_info, description
+        )
+        for description in AGGREGATE_SENSORS
+    )
+    hass.data[DOMAIN][entry.entry_id]["group"] = group
 
 
 class AutoCalibrateSensor(RestoreSensor):
@@ -114,6 +321,19 @@ class AutoCalibrateSensor(RestoreSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_should_poll = False
     _attr_has_entity_name = False
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_MIN_RAW,
+            ATTR_MAX_RAW,
+            ATTR_RAW_VALUE,
+            ATTR_WRITES_SUPPRESSED,
+            ATTR_BACKFILL_PROGRESS,
+            ATTR_SLOPE,
+            ATTR_TIME_TO_THRESHOLD,
+            ATTR_GAIN,
+            ATTR_OFFSET,
+        }
+    )
 
     def __init__(
         self,
@@ -121,158 +341,1238 @@ class AutoCalibrateSensor(RestoreSensor):
         source_entity: str,
         name: str,
         entity_id_suffix: str,
+        store: CalibrationStore,
         device_info: DeviceInfo | None = None,
         source_device_class: str | None = None,
         source_unit: str | None = None,
         source_display_precision: int | None = None,
+        options: Mapping[str, Any] | None = None,
+        thresholds: list[ThresholdBinarySensor] | None = None,
+        attribute: str | None = None,
+        source_outputs: SourceOutputs | None = None,
     ) -> None:
-        """Initialize the sensor."""
+        """Initialize the sensor.
+
+        Without ``attribute`` the sensor calibrates the source's state,
+        otherwise the named attribute of the source.
+        """
         self._entry_id = entry_id
+        self._store = store
         self._source_entity = source_entity
-        self._attr_name = name
-        self._attr_unique_id = f"auto_calibrate_{source_entity}"
+        self.attribute = attribute
+        self._source_outputs = source_outputs or SourceOutputs(source_entity)
+        if attribute is None:
+            self._attr_name = name
+            self._attr_unique_id = f"auto_calibrate_{source_entity}"
+        else:
+            self._attr_name = f"{name} {attribute}"
+            self._attr_unique_id = (
+                f"auto_calibrate_{source_entity}_attribute_{attribute}"
+            )
+            entity_id_suffix = f"{entity_id_suffix}_{slugify(attribute)}"
         self._entity_id_suffix = entity_id_suffix
         self.entity_id = f"sensor.{entity_id_suffix}"
         self._attr_device_info = device_info
 
-        if source_device_class:
+        self._source_device_class = source_device_class
+        self._source_unit = source_unit
+        self._source_display_precision = source_display_precision
+        self._reference_entity: str | None = None
+        self._reference_device_class: str | None = None
+        self._reference_unit: str | None = None
+        self._reference_unsub: CALLBACK_TYPE | None = None
+        self._thresholds: list[ThresholdBinarySensor] = (
+            thresholds if thresholds is not None else []
+        )
+
+        options = options or {}
+        self._options = options
+        self._engine = CalibrationState(create_limits(options))
+        self._trend: TrendEstimator | None = None
+        self.flight_recorder: FlightRecorder | None = None
+        self._stale_monitor: StaleSourceMonitor | None = None
+        self._stale_unsub: CALLBACK_TYPE | None = None
+        self._stale = False
+        self._profile_unsub: CALLBACK_TYPE | None = None
+        self._curve_settings: tuple[Any, ...] | None = None
+        self._configure(options)
+        self._last_raw_state: Any = None
+        self._written: tuple[float | None, ...] | None = None
+        self._last_write: float = 0.0
+        self._flush_unsub: CALLBACK_TYPE | None = None
+        self._writes_suppressed = 0
+        self._backfill_task: asyncio.Task[None] | None = None
+        self._backfill_progress: float | None = None
+        self._attrs: dict[str, Any] | None = None
+        self.stats: CallbackStats | None = (
+            CallbackStats()
+            if options.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION)
+            else None
+        )
+
+    def _configure(self, options: Mapping[str, Any]) -> None:
+        """Apply the options that take effect without re-learning."""
+        self._reference_entity = options.get(CONF_REFERENCE_ENTITY) or None
+        if self._reference_entity is None:
+            self._engine.set_fit(None)
+        else:
+            half_life = (
+                options.get(CONF_REFERENCE_HALF_LIFE, DEFAULT_REFERENCE_HALF_LIFE)
+                * SECONDS_PER_DAY
+            ) or None
+            if self._engine.fit is None:
+                self._engine.set_fit(LinearFit(half_life))
+            else:
+                self._engine.fit.half_life = half_life
+        self._update_output_unit()
+        precision = options.get(CONF_DISPLAY_PRECISION, self._source_display_precision)
+        self._attr_suggested_display_precision = (
+            int(precision) if precision is not None else 1
+        )
+        self._engine.set_overrides(options.get(CONF_MIN_RAW), options.get(CONF_MAX_RAW))
+        self._profile: str | None = options.get(CONF_PROFILE) or None
+        self._profile_mode: str = options.get(CONF_PROFILE_MODE, DEFAULT_PROFILE_MODE)
+        self._engine.set_profile(
+            self._store.async_profile(self._profile)
+            if self._profile is not None and self._profile_mode == PROFILE_SHARED
+            else None
+        )
+
+        # The curve's lookup table is only rebuilt when the curve changed.
+        if (settings := curve_settings(options)) != self._curve_settings:
+            self._curve_settings = settings
             try:
-                self._attr_device_class = SensorDeviceClass(source_device_class)
-            except ValueError:
-                self._attr_device_class = None
-        if source_unit:
-            self._attr_native_unit_of_measurement = source_unit
+                self._engine.set_curve(create_response_curve(options))
+            except ValueError as err:
+                _LOGGER.warning(
+                    "Ignoring the response curve of %s: %s", self._source_entity, err
+                )
+                self._engine.set_curve(None)
+
+        trend_half_life = options.get(CONF_TREND_HALF_LIFE, DEFAULT_TREND_HALF_LIFE)
+        if not trend_half_life:
+            self._trend = None
+        elif self._trend is None:
+            self._trend = TrendEstimator(trend_half_life * SECONDS_PER_HOUR)
         else:
-            self._attr_native_unit_of_measurement = PERCENTAGE
-        if source_display_precision is not None:
-            self._attr_suggested_display_precision = source_display_precision
+            self._trend.half_life = trend_half_life * SECONDS_PER_HOUR
+        self._trend_threshold: float = options.get(
+            CONF_TREND_THRESHOLD, DEFAULT_TREND_THRESHOLD
+        )
+
+        size = int(options.get(CONF_FLIGHT_RECORDER, DEFAULT_FLIGHT_RECORDER))
+        if not size:
+            self.flight_recorder = None
+        elif self.flight_recorder is None or self.flight_recorder.size != size:
+            self.flight_recorder = FlightRecorder(size)
+
+        self._stale_timeout: float = (
+            options.get(CONF_STALE_TIMEOUT, DEFAULT_STALE_TIMEOUT) * SECONDS_PER_MINUTE
+        )
+        self._stale_unavailable: bool = options.get(
+            CONF_STALE_UNAVAILABLE, DEFAULT_STALE_UNAVAILABLE
+        )
+
+        self._deadband: float = options.get(CONF_DEADBAND, DEFAULT_DEADBAND)
+        self._min_interval: float = options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        # Window and decay limits move with time, so they need every reading
+        # to evict old values or relax, including repeated ones.
+        self._skip_unchanged: bool = options.get(
+            CONF_SKIP_UNCHANGED, DEFAULT_SKIP_UNCHANGED
+        ) and limit_settings(options)[0] not in (MODE_WINDOW, MODE_DECAY)
+
+    def _update_output_unit(self) -> None:
+        """Set the unit and device class of the source or of the reference."""
+        if self._reference_entity is None:
+            unit = self._source_unit or PERCENTAGE
+            device_class = self._source_device_class
         else:
-            self._attr_suggested_display_precision = 1
+            unit = self._reference_unit
+            device_class = self._reference_device_class
+        self._attr_native_unit_of_measurement = (
+            self._options.get(CONF_UNIT_OF_MEASUREMENT) or unit
+        )
+        try:
+            self._attr_device_class = (
+                SensorDeviceClass(device_class) if device_class else None
+            )
+        except ValueError:
+            self._attr_device_class = None
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> bool:
+        """Apply changed options to the running sensor in place.
+
+        The subscription and the restored state are kept. The limits are
+        only re-learned when the learning mode or its parameters changed.
+        Returns False if the change adds or removes entities, which needs
+        the entry to be reloaded.
+        """
+        instrumented = options.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION)
+        if instrumented != (self.stats is not None):
+            return False
+
+        previous = self._options
+        if any(
+            (options.get(option) is None) != (previous.get(option) is None)
+            for option in THRESHOLD_KEYS.values()
+        ) or options.get(CONF_ATTRIBUTES, []) != previous.get(CONF_ATTRIBUTES, []):
+            return False
+
+        self._options = options
+        precision = self._attr_suggested_display_precision
+        stale_timeout = self._stale_timeout
+        profile = (self._profile, self._profile_mode)
+        self._configure(options)
+        if self._stale_timeout != stale_timeout:
+            self._async_track_staleness()
+        if (self._profile, self._profile_mode) != profile:
+            if profile[0] is not None and profile[0] != self._profile:
+                self._store.async_update_profile(profile[0], self.unique_id, None, None)
+            self._async_track_profile()
+
+        if self._reference_entity != (previous.get(CONF_REFERENCE_ENTITY) or None):
+            if self._engine.fit is not None:
+                self._engine.fit.reset()
+                self._engine.invalidate()
+            self._store.async_mark_dirty(self.unique_id)
+            self._async_track_reference()
+
+        if limit_settings(options) != limit_settings(previous):
+            _LOGGER.info(
+                "Learning mode of %s changed, re-learning limits", self.entity_id
+            )
+            tracker = create_limits(options)
+            if self._engine.raw_value is not None:
+                tracker.update(self._engine.raw_value, time.time())
+            self.async_set_limits(tracker, write_state=False)
+            if self._trend is not None:
+                self._trend.reset()
+            if backfill_days := options.get(CONF_BACKFILL_DAYS, DEFAULT_BACKFILL_DAYS):
+                self.async_start_backfill(backfill_days)
+
+        if self._attr_suggested_display_precision != precision:
+            self._async_update_registry_precision()
+        for threshold in self._thresholds:
+            threshold.configure(options)
+            threshold.async_write_ha_state()
+        self._attrs = None
+        self.async_write_ha_state()
+        return True
 
-        self._min_raw: float | None = None
-        self._max_raw: float | None = None
-        self._raw_value: float | None = None
-        self._unsub: callback | None = None
+    @callback
+    def _async_update_registry_precision(self) -> None:
+        """Store a changed suggested display precision in the entity registry.
+
+        The frontend reads the precision from the registry, which the sensor
+        base class only refreshes when the entity is added or its registry
+        entry changes.
+        """
+        ent_reg = er.async_get(self.hass)
+        if (registry_entry := ent_reg.async_get(self.entity_id)) is None:
+            return
+        sensor_options = dict(registry_entry.options.get("sensor", {}))
+        sensor_options["suggested_display_precision"] = (
+            self._attr_suggested_display_precision
+        )
+        ent_reg.async_update_entity_options(self.entity_id, "sensor", sensor_options)
 
     async def async_added_to_hass(self) -> None:
         """Restore state and subscribe to source entity changes."""
         await super().async_added_to_hass()
 
-        expected_entity_id = f"sensor.{self._entity_id_suffix}"
-        if self.entity_id != expected_entity_id:
-            ent_reg = er.async_get(self.hass)
-            reg_entry = ent_reg.async_get(self.entity_id)
-            if reg_entry is not None:
-                try:
-                    ent_reg.async_update_entity(
-                        self.entity_id,
-                        new_entity_id=expected_entity_id,
-                    )
-                    _LOGGER.info(
-                        "Migrated entity_id from %s to %s",
-                        self.entity_id,
-                        expected_entity_id,
-                    )
-                except ValueError:
-                    _LOGGER.warning(
-                        "Could not migrate entity_id to %s",
-                        expected_entity_id,
-                    )
-
-        last_sensor_data = await self.async_get_last_sensor_data()
-        last_state = await self.async_get_last_state()
+        timings: dict[str, float] | None = self.hass.data.get(DATA_STARTUP)
+        begin = time.perf_counter()
 
-        if last_state is not None:
-            attrs = last_state.attributes
-            if ATTR_MIN_RAW in attrs and attrs[ATTR_MIN_RAW] is not None:
-                self._min_raw = float(attrs[ATTR_MIN_RAW])
-            if ATTR_MAX_RAW in attrs and attrs[ATTR_MAX_RAW] is not None:
-                self._max_raw = float(attrs[ATTR_MAX_RAW])
-
-        if last_sensor_data is not None and last_sensor_data.native_value is not None:
+        store = self._store
+        record = store.async_get(self.unique_id)
+        if record is not None:
             try:
-                self._attr_native_value = float(last_sensor_data.native_value)
-            except (ValueError, TypeError):
-                pass
+                self._engine.restore(record[KEY_LIMITS], record.get(KEY_RAW))
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.warning(
+                    "Ignoring the stored limits of %s: %s", self.entity_id, err
+                )
+                self._engine.set_limits(create_limits(self._options))
+            if self._trend is not None and KEY_TREND in record:
+                self._trend.restore(record[KEY_TREND])
+            if self._engine.fit is not None and KEY_FIT in record:
+                self._engine.fit.restore(record[KEY_FIT])
+        else:
+            await self._async_restore_legacy_limits()
+        self.async_on_remove(
+            store.async_register(self.unique_id, self._calibration_record)
+        )
+        self._async_track_profile()
+        self.async_on_remove(self._async_untrack_profile)
 
         _LOGGER.debug(
             "Restored min_raw=%s, max_raw=%s for %s",
-            self._min_raw,
-            self._max_raw,
+            self.min_raw,
+            self.max_raw,
             self.entity_id,
         )
 
+        restored = time.perf_counter()
+
+        # The platform writes the state once this method returns.
         current_state = self.hass.states.get(self._source_entity)
         if current_state is not None:
-            self._process_raw_value(current_state.state)
-            self.async_write_ha_state()
+            raw = (
+                current_state.state
+                if self.attribute is None
+                else current_state.attributes.get(self.attribute)
+            )
+            self._last_raw_state = raw
+            self._process_raw_value(raw, current_state.last_updated_timestamp)
+
+        self.async_on_remove(self._source_outputs.async_add(self))
+
+        self._async_track_reference()
+        self.async_on_remove(self._async_untrack_reference)
+        self._async_track_staleness()
+        self.async_on_remove(self._async_untrack_staleness)
+
+        sensors: dict[str, AutoCalibrateSensor] = self.hass.data[DATA_SENSORS]
+        entity_id = self.entity_id
+        sensors[entity_id] = self
+        self.async_on_remove(lambda: sensors.pop(entity_id, None))
+        self.async_on_remove(self._async_cancel_flush)
+        self.async_on_remove(self._async_cancel_backfill)
+
+        backfill_days = self._options.get(CONF_BACKFILL_DAYS, DEFAULT_BACKFILL_DAYS)
+        if backfill_days and self.min_raw is None:
+            self.async_start_backfill(backfill_days)
+
+        if timings is not None:
+            timings["sensors"] += 1
+            timings["restore"] += restored - begin
+            timings["subscribe"] += time.perf_counter() - restored
 
-        self._unsub = async_track_state_change_event(
-            self.hass, [self._source_entity], self._async_source_state_changed
+    async def _async_restore_legacy_limits(self) -> None:
+        """Restore limits saved by versions that predate the calibration store."""
+        limits = self._engine.limits
+        last_state = await self.async_get_last_state()
+        if last_state is not None and isinstance(limits, AbsoluteLimits):
+            attrs = last_state.attributes
+            if ATTR_MIN_RAW in attrs and attrs[ATTR_MIN_RAW] is not None:
+                limits.min_raw = float(attrs[ATTR_MIN_RAW])
+            if ATTR_MAX_RAW in attrs and attrs[ATTR_MAX_RAW] is not None:
+                limits.max_raw = float(attrs[ATTR_MAX_RAW])
+            self._engine.invalidate()
+
+    @callback
+    def _calibration_record(self) -> Record:
+        """Return the compact calibration record kept in the store."""
+        record: Record = {
+            KEY_LIMITS: self._engine.limits.as_dict(),
+            KEY_RAW: self._engine.raw_value,
+        }
+        if self._trend is not None:
+            record[KEY_TREND] = self._trend.as_dict()
+        if self._engine.fit is not None:
+            record[KEY_FIT] = self._engine.fit.as_dict()
+        return record
+
+    @callback
+    def _async_track_reference(self) -> None:
+        """Route state changes of the reference entity to this sensor."""
+        self._async_untrack_reference()
+        if self._reference_entity is None:
+            return
+        if (state := self.hass.states.get(self._reference_entity)) is not None:
+            self._adopt_reference_format(state)
+        dispatcher: SourceDispatcher = self.hass.data[DATA_DISPATCHER]
+        self._reference_unsub = dispatcher.async_register(
+            self._reference_entity, self._async_reference_state_changed
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from source entity updates."""
-        if self._unsub is not None:
-            self._unsub()
-            self._unsub = None
+    @callback
+    def _async_untrack_reference(self) -> None:
+        """Stop following the reference entity."""
+        if self._reference_unsub is not None:
+            self._reference_unsub()
+            self._reference_unsub = None
+
+    def _adopt_reference_format(self, state: State) -> None:
+        """Publish in the unit and device class of the reference entity."""
+        attributes = state.attributes
+        unit = attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        device_class = attributes.get(ATTR_DEVICE_CLASS)
+        if unit != self._reference_unit or device_class != self._reference_device_class:
+            self._reference_unit = unit
+            self._reference_device_class = device_class
+            self._update_output_unit()
+
+    @callback
+    def _async_track_profile(self) -> None:
+        """Join the linked profile and follow it if its limits are shared."""
+        self._async_untrack_profile()
+        if self._profile is None:
+            return
+        self._async_join_profile()
+        if self._profile_mode == PROFILE_SHARED:
+            self._profile_unsub = self._store.async_listen_profile(
+                self._profile, self.unique_id, self._async_profile_changed
+            )
+
+    @callback
+    def _async_untrack_profile(self) -> None:
+        """Stop following the linked profile; the contribution is kept."""
+        if self._profile_unsub is not None:
+            self._profile_unsub()
+            self._profile_unsub = None
+
+    @callback
+    def _async_join_profile(self) -> None:
+        """Contribute the learned limits, starting from the profile's if none.
+
+        In prior mode, a tracker that has not learned anything yet is seeded
+        with the pooled minimum and maximum as its first two readings.
+        """
+        limits = self._engine.limits
+        profile = self._store.async_profile(self._profile)
+        if (
+            self._profile_mode == PROFILE_PRIOR
+            and limits.min_raw is None
+            and profile.min_raw is not None
+        ):
+            now = time.time()
+            limits.update(profile.min_raw, now)
+            limits.update(profile.max_raw, now)
+            self._engine.invalidate()
+            self._attrs = None
+            self._store.async_mark_dirty(self.unique_id)
+            _LOGGER.debug(
+                "Seeded %s with min_raw=%s, max_raw=%s of profile %s",
+                self.entity_id,
+                profile.min_raw,
+                profile.max_raw,
+                self._profile,
+            )
+        self._async_contribute_to_profile()
+
+    @callback
+    def _async_contribute_to_profile(self) -> None:
+        """Pool the limits learned by this sensor into its profile.
+
+        The profile does not notify the contributing sensor, which writes
+        its state after the update that moved the limits anyway.
+        """
+        limits = self._engine.limits
+        self._store.async_update_profile(
+            self._profile, self.unique_id, limits.min_raw, limits.max_raw
+        )
+        if self._profile_unsub is not None:
+            self._engine.invalidate()
+
+    @callback
+    def _async_profile_changed(self) -> None:
+        """Publish the value against the profile's new pooled limits."""
+        self._engine.invalidate()
+        self._attrs = None
+        self._async_write_coalesced()
+
+    @callback
+    def _async_track_staleness(self) -> None:
+        """Register with the domain's stale source monitor if a timeout is set."""
+        self._async_untrack_staleness()
+        if not self._stale_timeout:
+            return
+        monitor: StaleSourceMonitor = self.hass.data[DATA_STALE]
+        self._stale_unsub = monitor.async_register(
+            self, self._stale_timeout, self._async_set_stale
+        )
+        self._stale_monitor = monitor
+
+    @callback
+    def _async_untrack_staleness(self) -> None:
+        """Stop watching the source for staleness."""
+        if self._stale_unsub is not None:
+            self._stale_unsub()
+            self._stale_unsub = None
+            self._stale_monitor = None
+            self._stale = False
+            self._attrs = None
 
     @callback
-    def _async_source_state_changed(self, event: Event) -> None:
-        """Handle state changes from the source sensor."""
+    def _async_set_stale(self, stale: bool) -> None:
+        """Publish that the source stopped or resumed reporting."""
+        if stale:
+            _LOGGER.debug(
+                "%s did not report for %s s, marking %s stale",
+                self._source_entity,
+                self._stale_timeout,
+                self.entity_id,
+            )
+        self._stale = stale
+        self._attrs = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_reference_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Refit the correction with a new reference reading.
+
+        The reading is paired with the latest raw value of the source.
+        """
         new_state = event.data.get("new_state")
         if new_state is None:
             return
-        self._process_raw_value(new_state.state)
+        self._adopt_reference_format(new_state)
+        try:
+            reference = float(new_state.state)
+        except ValueError:
+            return
+        if self._engine.update_reference(reference, new_state.last_updated_timestamp):
+            self._attrs = None
+            self._store.async_mark_dirty(self.unique_id)
+            self._async_write_coalesced()
+
+    @callback
+    def async_source_reading(self, raw: Any, timestamp: float) -> None:
+        """Handle a new reading of the source state or attribute."""
+        if (monitor := self._stale_monitor) is not None:
+            monitor.async_touch(self)
+        if self._skip_unchanged and raw == self._last_raw_state:
+            # A flat source is still a trend of zero, so the estimator sees it.
+            if self._trend is not None:
+                self._update_trend(timestamp)
+                self._store.async_mark_dirty(self.unique_id)
+            self._writes_suppressed += 1
+            self._attrs = None
+            return
+        self._last_raw_state = raw
+        self._process_raw_value(raw, timestamp)
+        self._async_write_coalesced()
+
+    @callback
+    def async_source_reading_timed(self, raw: Any, timestamp: float) -> None:
+        """Handle a source reading and record how long it took.
+
+        Only registered instead of ``async_source_reading`` when
+        instrumentation is enabled.
+        """
+        begin = time.perf_counter_ns()
+        self.async_source_reading(raw, timestamp)
+        self.stats.record_callback(time.perf_counter_ns() - begin)
+
+    @callback
+    def _async_write_coalesced(self) -> None:
+        """Write state unless the output policies suppress it.
+
+        Unchanged states and output changes smaller than the deadband are
+        dropped. Writes closer together than the minimum interval are
+        deferred to a single trailing write of the latest value.
+        """
+        if self._flush_unsub is not None:
+            self._async_suppress_write()
+            return
+
+        written = self._written
+        if written is not None:
+            value = self._engine.value
+            if written == (value, self.min_raw, self.max_raw, self._engine.raw_value):
+                self._async_suppress_write()
+                return
+            if (
+                self._deadband
+                and value is not None
+                and written[0] is not None
+                and abs(value - written[0]) < self._deadband
+            ):
+                self._async_suppress_write()
+                return
+
+        if self._min_interval:
+            elapsed = time.monotonic() - self._last_write
+            if elapsed < self._min_interval:
+                self._async_suppress_write()
+                self._flush_unsub = async_call_later(
+                    self.hass, self._min_interval - elapsed, self._async_flush
+                )
+                return
+
+        self.async_write_ha_state()
+
+    @callback
+    def _async_suppress_write(self) -> None:
+        """Count a state write that an output policy suppressed."""
+        self._writes_suppressed += 1
+        self._attrs = None
+        if self._thresholds:
+            self._async_evaluate_thresholds()
+
+    @callback
+    def _async_evaluate_thresholds(self) -> None:
+        """Let the threshold binary sensors follow the current value.
+
+        Runs whether or not the calibrated state itself is written, so the
+        binary sensors do not depend on the write policies.
+        """
+        value = self._engine.value
+        for threshold in self._thresholds:
+            threshold.async_evaluate(value)
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Write the latest value at the end of a minimum interval."""
+        self._flush_unsub = None
         self.async_write_ha_state()
 
-    def _process_raw_value(self, raw_state: str) -> None:
-        """Process a raw state value and update min/max/normalized."""
+    @callback
+    def _async_cancel_flush(self) -> None:
+        """Cancel a pending trailing write."""
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember what was published."""
+        self._async_cancel_flush()
+        if self._thresholds:
+            self._async_evaluate_thresholds()
+        self._written = (
+            self._engine.value,
+            self.min_raw,
+            self.max_raw,
+            self._engine.raw_value,
+        )
+        self._last_write = time.monotonic()
+        if self.stats is None:
+            super().async_write_ha_state()
+            return
+        begin = time.perf_counter_ns()
+        super().async_write_ha_state()
+        self.stats.record_write(time.perf_counter_ns() - begin)
+
+    @callback
+    def async_start_backfill(self, days: float) -> None:
+        """Start seeding the limits from the recorded history of the source."""
+        if self.attribute is not None:
+            _LOGGER.warning(
+                "Cannot backfill %s: only the source state's history is read",
+                self.entity_id,
+            )
+            return
+        if "recorder" not in self.hass.config.components:
+            _LOGGER.warning(
+                "Cannot backfill %s: the recorder is not loaded", self.entity_id
+            )
+            return
+        self._async_cancel_backfill()
+        self._backfill_task = self.platform.config_entry.async_create_background_task(
+            self.hass,
+            self._async_backfill(days),
+            f"{DOMAIN} backfill {self.entity_id}",
+        )
+
+    async def _async_backfill(self, days: float) -> None:
+        """Learn limits from recorded history and swap them in when done.
+
+        History is fed into a fresh tracker so that older readings never mix
+        with readings that arrive while the backfill is running.
+        """
+        _LOGGER.info(
+            "Backfilling %s from %s days of %s history",
+            self.entity_id,
+            days,
+            self._source_entity,
+        )
+        tracker = create_limits(self._options)
+        self._async_backfill_progress(0.0)
+        try:
+            count = await async_backfill_limits(
+                self.hass,
+                self._source_entity,
+                tracker,
+                dt_util.utcnow() - timedelta(days=days),
+                use_statistics=not isinstance(tracker, QuantileLimits),
+                progress=self._async_backfill_progress,
+            )
+        finally:
+            if self._backfill_task is asyncio.current_task():
+                self._backfill_task = None
+                self._backfill_progress = None
+
+        _LOGGER.info("Backfilled %s from %s recorded values", self.entity_id, count)
+        if count:
+            if self._engine.raw_value is not None:
+                tracker.update(self._engine.raw_value, time.time())
+            self._engine.set_limits(tracker)
+            self._attrs = None
+            self._store.async_mark_dirty(self.unique_id)
+            if self.flight_recorder is not None:
+                self._record_event(
+                    time.time(), self._engine.raw_value, EVENT_LIMITS_REPLACED
+                )
+        self.async_write_ha_state()
+
+    async def async_recompute_statistics(self, start: datetime, end: datetime) -> int:
+        """Rewrite this sensor's hourly statistics with the current limits.
+
+        Returns the number of hours written; nothing is written before the
+        limits are known.
+        """
+        if self.min_raw is None or self.max_raw is None:
+            return 0
+        if self.attribute is not None:
+            _LOGGER.warning(
+                "Cannot recompute statistics of %s: only the source state's "
+                "history is read",
+                self.entity_id,
+            )
+            return 0
+        if self._engine.fit is not None:
+            _LOGGER.warning(
+                "Cannot recompute statistics of %s: its values are corrected "
+                "against a reference, not normalized",
+                self.entity_id,
+            )
+            return 0
+        return await async_recompute_statistics(
+            self.hass,
+            self.entity_id,
+            self._source_entity,
+            self.unit_of_measurement,
+            self.min_raw,
+            self.max_raw,
+            start,
+            end,
+            self._engine.curve,
+        )
+
+    @callback
+    def _async_backfill_progress(self, fraction: float) -> None:
+        """Publish the progress of a running backfill."""
+        self._backfill_progress = round(fraction * 100, 1)
+        self._attrs = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_backfill(self) -> None:
+        """Cancel a running backfill."""
+        if self._backfill_task is not None:
+            self._backfill_task.cancel()
+            self._backfill_task = None
+            self._backfill_progress = None
+            self._attrs = None
+
+    def _process_raw_value(self, raw_state: Any, timestamp: float) -> bool:
+        """Process a raw state or attribute value and update min/max/normalized.
+
+        Returns True if the learned limits changed.
+        """
+        flight = self.flight_recorder
         try:
             value = float(raw_state)
         except (ValueError, TypeError):
-            return
+            if self.stats is not None:
+                self.stats.parse_failures += 1
+            if flight is not None:
+                self._record_event(timestamp, None, EVENT_UNPARSABLE)
+            return False
 
-        self._raw_value = value
+        if flight is not None:
+            limits = self._engine.limits
+            min_raw, max_raw = limits.min_raw, limits.max_raw
+        limits_changed = self._engine.update(value, timestamp)
+        if flight is not None:
+            limits = self._engine.limits
+            self._record_event(
+                timestamp,
+                value,
+                (EVENT_MIN_CHANGED if limits.min_raw != min_raw else 0)
+                | (EVENT_MAX_CHANGED if limits.max_raw != max_raw else 0),
+            )
+        self._attrs = None
+        self._update_trend(timestamp)
+        self._store.async_mark_dirty(self.unique_id)
+        if limits_changed:
+            if self.stats is not None:
+                self.stats.limit_updates += 1
+            if self._profile is not None:
+                self._async_contribute_to_profile()
+            _LOGGER.debug(
+                "New limits min_raw=%s, max_raw=%s for %s",
+                self.min_raw,
+                self.max_raw,
+                self.entity_id,
+            )
+        return limits_changed
 
-        if self._min_raw is None or value < self._min_raw:
-            self._min_raw = value
-            _LOGGER.debug("New min_raw=%s for %s", self._min_raw, self.entity_id)
+    def _update_trend(self, timestamp: float) -> None:
+        """Feed the current calibrated value to the trend estimator."""
+        if self._trend is not None and (calibrated := self._engine.value) is not None:
+            self._trend.update(timestamp, calibrated)
 
-        if self._max_raw is None or value > self._max_raw:
-            self._max_raw = value
-            _LOGGER.debug("New max_raw=%s for %s", self._max_raw, self.entity_id)
+    def _record_event(self, timestamp: float, raw: float | None, events: int) -> None:
+        """Record the learned limits and the output in the flight recorder."""
+        limits = self._engine.limits
+        self.flight_recorder.record(
+            timestamp, raw, limits.min_raw, limits.max_raw, self._engine.value, events
+        )
 
     @property
-    def native_value(self) -> float | None:
-        """Return the normalized 0-100% value."""
-        if self._raw_value is None or self._min_raw is None or self._max_raw is None:
-            return None
+    def min_raw(self) -> float | None:
+        """Return the minimum raw value, learned or set manually."""
+        return self._engine.min_raw
+
+    @property
+    def max_raw(self) -> float | None:
+        """Return the maximum raw value, learned or set manually."""
+        return self._engine.max_raw
 
-        if self._min_raw == self._max_raw:
-            return 0.0
+    @property
+    def learning_mode(self) -> str:
+        """Return the learning mode of the limit tracker."""
+        return self._engine.limits.mode
 
-        normalized = (
-            (self._raw_value - self._min_raw) / (self._max_raw - self._min_raw)
-        ) * 100.0
+    @property
+    def writes_suppressed(self) -> int:
+        """Return the number of state writes suppressed by the output settings."""
+        return self._writes_suppressed
 
-        return round(max(0.0, min(100.0, normalized)), 1)
+    @property
+    def available(self) -> bool:
+        """Return False while the source is stale, if configured so."""
+        return not (self._stale and self._stale_unavailable)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the normalized 0-100% value."""
+        return self._engine.value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return state attributes including learned limits."""
+        """Return state attributes including learned limits.
+
+        The dict is rebuilt only after one of its inputs changed.
+        """
+        if self._attrs is None:
+            attrs = {
+                ATTR_MIN_RAW: self.min_raw,
+                ATTR_MAX_RAW: self.max_raw,
+                ATTR_RAW_VALUE: self._engine.raw_value,
+                ATTR_SOURCE_ENTITY: self._source_entity,
+                ATTR_WRITES_SUPPRESSED: self._writes_suppressed,
+            }
+            if self.attribute is not None:
+                attrs[ATTR_SOURCE_ATTRIBUTE] = self.attribute
+            if self._profile is not None:
+                attrs[ATTR_PROFILE] = self._profile
+            if self._backfill_progress is not None:
+                attrs[ATTR_BACKFILL_PROGRESS] = self._backfill_progress
+            if self._stale_monitor is not None:
+                attrs[ATTR_STALE] = self._stale
+            if (fit := self._engine.fit) is not None:
+                attrs[ATTR_REFERENCE_ENTITY] = self._reference_entity
+                attrs[ATTR_GAIN] = fit.gain
+                attrs[ATTR_OFFSET] = fit.offset
+            if (trend := self._trend) is not None:
+                slope = trend.slope
+                eta = trend.time_to(self._trend_threshold)
+                attrs[ATTR_SLOPE] = (
+                    round(slope * SECONDS_PER_HOUR, 3) if slope is not None else None
+                )
+                attrs[ATTR_TIME_TO_THRESHOLD] = (
+                    round(eta / SECONDS_PER_HOUR, 1) if eta is not None else None
+                )
+            self._attrs = attrs
+        return self._attrs
+
+    @callback
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the calibration and hot-path counters for diagnostics."""
         return {
-            ATTR_MIN_RAW: self._min_raw,
-            ATTR_MAX_RAW: self._max_raw,
-            ATTR_RAW_VALUE: self._raw_value,
+            "entity_id": self.entity_id,
+            "attribute": self.attribute,
+            "value": self._engine.value,
+            "raw_value": self._engine.raw_value,
+            "limits": self._engine.limits.as_dict(),
+            "fit": self._engine.fit.as_dict() if self._engine.fit is not None else None,
+            "curve": self._curve_settings,
+            "profile": self._profile,
+            "writes_suppressed": self._writes_suppressed,
+            "stats": self.stats.as_dict() if self.stats is not None else None,
+            "flight_recorder": (
+                self.flight_recorder.as_list()
+                if self.flight_recorder is not None
+                else None
+            ),
+        }
+
+    @callback
+    def export_calibration(self) -> dict[str, Any]:
+        """Return the learned calibration in the websocket export format."""
+        return {
+            CONF_ENTITY_ID: self.entity_id,
             ATTR_SOURCE_ENTITY: self._source_entity,
+            "value": self._engine.value,
+            ATTR_RAW_VALUE: self._engine.raw_value,
+            ATTR_MIN_RAW: self.min_raw,
+            ATTR_MAX_RAW: self.max_raw,
+            "limits": self._engine.limits.as_dict(),
         }
 
+    def build_limits(self, data: dict[str, Any]) -> LimitTracker:
+        """Return a tracker of this sensor's learning mode restored from ``data``.
+
+        Raises ValueError if the data belongs to another learning mode or
+        cannot be restored.
+        """
+        return restore_limits(self._options, data)
+
+    @callback
+    def async_set_limits(self, tracker: LimitTracker, write_state: bool = True) -> None:
+        """Replace the learned limits.
+
+        Bulk callers pass ``write_state=False`` and write the state of all
+        affected sensors themselves once every sensor is updated.
+        """
+        self._async_cancel_backfill()
+        self._engine.set_limits(tracker)
+        self._attrs = None
+        self._store.async_mark_dirty(self.unique_id)
+        if self._profile is not None:
+            self._async_contribute_to_profile()
+        if self.flight_recorder is not None:
+            self._record_event(
+                time.time(), self._engine.raw_value, EVENT_LIMITS_REPLACED
+            )
+        if write_state:
+            self.async_write_ha_state()
+
     @callback
-    def reset_calibration(self) -> None:
-        """Reset the learned min/max values."""
+    def reset_calibration(self, write_state: bool = True) -> None:
+        """Reset the learned min/max values.
+
+        Bulk callers pass ``write_state=False`` and write the state of all
+        affected sensors themselves once every reset is done.
+        """
         _LOGGER.info("Resetting calibration for %s", self.entity_id)
-        self._min_raw = None
-        self._max_raw = None
-        self._raw_value = None
-        self.async_write_ha_state()
+        self._async_cancel_backfill()
+        self._engine.reset()
+        if self._trend is not None:
+            self._trend.reset()
+        self._attrs = None
+        self._last_raw_state = None
+        self._store.async_mark_dirty(self.unique_id)
+        if self._profile is not None:
+            self._async_join_profile()
+        if self.flight_recorder is not None:
+            self._record_event(time.time(), None, EVENT_RESET)
+        if write_state:
+            self.async_write_ha_state()
+
+
+@dataclass(frozen=True, kw_only=True)
+class DiagnosticSensorDescription(SensorEntityDescription):
+    """Describes a hot-path counter of a calibrated sensor."""
+
+    value_fn: Callable[[CallbackStats], float | int | None]
+
+
+DIAGNOSTIC_SENSORS: tuple[DiagnosticSensorDescription, ...] = (
+    DiagnosticSensorDescription(
+        key="events",
+        name="events",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.events,
+    ),
+    DiagnosticSensorDescription(
+        key="writes",
+        name="writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.writes,
+    ),
+    DiagnosticSensorDescription(
+        key="callback_time",
+        name="callback time",
+        native_unit_of_measurement=UnitOfTime.MICROSECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.callback_mean_us,
+    ),
+)
+
+
+class AutoCalibrateDiagnosticSensor(SensorEntity):
+    """Polled diagnostic view of a calibrated sensor's hot-path counters.
+
+    Disabled by default; enabled entities read the counters every scan
+    interval instead of writing state from the hot path.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = False
+
+    entity_description: DiagnosticSensorDescription
+
+    def __init__(
+        self, sensor: AutoCalibrateSensor, description: DiagnosticSensorDescription
+    ) -> None:
+        """Initialize the diagnostic sensor."""
+        self.entity_description = description
+        self._sensor = sensor
+        self._attr_name = f"{sensor.name} {description.name}"
+        self._attr_unique_id = f"{sensor.unique_id}_{description.key}"
+        self.entity_id = f"{sensor.entity_id}_{description.key}"
+        self._attr_device_info = sensor.device_info
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current counter value."""
+        return self.entity_description.value_fn(self._sensor.stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the worst-case callback time next to the mean."""
+        if self.entity_description.key != "callback_time":
+            return None
+        return {"max_us": round(self._sensor.stats.callback_max_ns / 1000, 1)}
+
+
+class SourceOutputs:
+    """Feed all calibrated outputs of one source from a single subscription.
+
+    The state output and the attribute outputs of an entry register here
+    instead of with the domain's ``SourceDispatcher``. Each state change
+    is unpacked once, and every output is handed its own field of it.
+    """
+
+    def __init__(self, source_entity: str) -> None:
+        """Initialize without outputs."""
+        self.source_entity = source_entity
+        self._readers: tuple[tuple[str | None, ReadingAction], ...] = ()
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, output: AutoCalibrateSensor) -> CALLBACK_TYPE:
+        """Feed an added output; subscribe to the source with the first one."""
+        reader = (
+            output.attribute,
+            output.async_source_reading
+            if output.stats is None
+            else output.async_source_reading_timed,
+        )
+        self._readers += (reader,)
+        if self._unsub is None:
+            dispatcher: SourceDispatcher = output.hass.data[DATA_DISPATCHER]
+            self._unsub = dispatcher.async_register(
+                self.source_entity, self._async_source_state_changed
+            )
+
+        @callback
+        def _async_remove() -> None:
+            self._readers = tuple(r for r in self._readers if r is not reader)
+            if not self._readers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_remove
+
+    @callback
+    def _async_source_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Hand the state or an attribute of a new source state to each output."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return
+        state = new_state.state
+        attributes = new_state.attributes
+        timestamp = new_state.last_updated_timestamp
+        for attribute, reader in self._readers:
+            reader(state if attribute is None else attributes.get(attribute), timestamp)
+
+
+class AggregateGroup:
+    """Keep running statistics over the states of a group of sensors.
+
+    Member state changes arrive through the domain's ``SourceDispatcher``
+    and update a ``RunningAggregate`` in place; the group's entities then
+    write their state only if their own value changed.
+    """
+
+    def __init__(self, hass: HomeAssistant, members: list[str], threshold: float) -> None:
+        """Initialize the group."""
+        self.hass = hass
+        self.members = members
+        self.aggregate = RunningAggregate(threshold)
+        self.entities: set[AutoCalibrateAggregateSensor] = set()
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Seed the aggregate from the current member states and subscribe."""
+        self._async_subscribe(self.members)
+        return self._async_stop
+
+    @callback
+    def _async_subscribe(self, members: list[str]) -> None:
+        """Seed and subscribe members that are not subscribed yet."""
+        dispatcher: SourceDispatcher = self.hass.data[DATA_DISPATCHER]
+        for member in members:
+            if member in self._unsubs:
+                continue
+            if (state := self.hass.states.get(member)) is not None:
+                self.aggregate.update(member, _member_value(state.state))
+            self._unsubs[member] = dispatcher.async_register(
+                member, self._async_member_changed
+            )
+
+    @callback
+    def _async_stop(self) -> None:
+        """Unsubscribe all members."""
+        for unsub in self._unsubs.values():
+            unsub()
+        self._unsubs.clear()
+        self.aggregate.clear()
+
+    @callback
+    def async_update(self, members: list[str], threshold: float) -> None:
+        """Change the members and the threshold in place.
+
+        Only added and removed members are (un)subscribed; the values of
+        the other members are kept.
+        """
+        for member in set(self._unsubs).difference(members):
+            self._unsubs.pop(member)()
+            self.aggregate.update(member, None)
+        self._async_subscribe(members)
+        self.members = members
+        self.aggregate.threshold = threshold
+        for entity in self.entities:
+            entity.async_write_ha_state()
+
+    @callback
+    def _async_member_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Apply a member state change and refresh the group's entities."""
+        new_state = event.data.get("new_state")
+        value = _member_value(new_state.state) if new_state is not None else None
+        if self.aggregate.update(event.data["entity_id"], value):
+            for entity in self.entities:
+                entity.async_refresh()
+
+
+def _member_value(state: str) -> float | None:
+    """Return the numeric value of a member state."""
+    if state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+    try:
+        return float(state)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, kw_only=True)
+class AggregateSensorDescription(SensorEntityDescription):
+    """Describes one statistic of a group of calibrated sensors."""
+
+    value_fn: Callable[[RunningAggregate], float | int | None]
+
+
+AGGREGATE_SENSORS: tuple[AggregateSensorDescription, ...] = (
+    AggregateSensorDescription(
+        key="mean",
+        name="mean",
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda aggregate: aggregate.mean,
+    ),
+    AggregateSensorDescription(
+        key="min",
+        name="min",
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda aggregate: aggregate.min,
+    ),
+    AggregateSensorDescription(
+        key="max",
+        name="max",
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda aggregate: aggregate.max,
+    ),
+    AggregateSensorDescription(
+        key="median",
+        name="median",
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda aggregate: aggregate.median,
+    ),
+    AggregateSensorDescription(
+        key="count_below",
+        name="below threshold",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda aggregate: aggregate.count_below if aggregate.count else None,
+    ),
+)
+
+
+class AutoCalibrateAggregateSensor(SensorEntity):
+    """One statistic of a group of calibrated sensors."""
+
+    _attr_should_poll = False
+    _attr_has_entity_name = False
+
+    entity_description: AggregateSensorDescription
+
+    def __init__(
+        self,
+        group: AggregateGroup,
+        entry_id: str,
+        name: str,
+        device_info: DeviceInfo,
+        description: AggregateSensorDescription,
+    ) -> None:
+        """Initialize the aggregate sensor."""
+        self.entity_description = description
+        self._group = group
+        self._attr_name = f"{name} {description.name}"
+        self._attr_unique_id = f"auto_calibrate_group_{entry_id}_{description.key}"
+        self._attr_device_info = device_info
+        self._written: tuple[float | int | None, int] | None = None
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current value of the statistic."""
+        value = self.entity_description.value_fn(self._group.aggregate)
+        if isinstance(value, float):
+            return round(value, 2)
+        return value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the group size and, for the count, the threshold."""
+        aggregate = self._group.aggregate
+        attrs: dict[str, Any] = {
+            "members": len(self._group.members),
+            "available": aggregate.count,
+        }
+        if self.entity_description.key == "count_below":
+            attrs[CONF_THRESHOLD] = aggregate.threshold
+        return attrs
+
+    async def async_added_to_hass(self) -> None:
+        """Receive updates from the group while added."""
+        self._group.entities.add(self)
+        self.async_on_remove(lambda: self._group.entities.discard(self))
+
+    @callback
+    def async_refresh(self) -> None:
+        """Write the state if the statistic or the member count changed."""
+        current = (self.native_value, self._group.aggregate.count)
+        if current != self._written:
+            self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember what was published."""
+        self._written = (self.native_value, self._group.aggregate.count)
+        super().async_write_ha_state()
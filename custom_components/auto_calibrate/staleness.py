@@ -0,0 +1,102 @@
+"""Detection of sources that stopped reporting."""
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+
+class TimerWheel:
+    """Find keys that were not touched within their timeout.
+
+    Every tracked key sits in one bucket of a hashed timer wheel, at the
+    earliest time it can become stale. Touching a key only records the
+    time; its wheel entry is corrected lazily when its bucket comes due, so
+    a key that keeps reporting moves at most once per timeout. ``advance``
+    only visits the buckets that came due since the previous call, making
+    its cost proportional to the entries due rather than to all keys.
+    """
+
+    __slots__ = (
+        "resolution",
+        "_buckets",
+        "_slot",
+        "_last_seen",
+        "_timeouts",
+        "_stale",
+        "_tick",
+    )
+
+    def __init__(self, resolution: float, slots: int = 512) -> None:
+        """Initialize an empty wheel of buckets ``resolution`` seconds wide."""
+        self.resolution = resolution
+        self._buckets: list[set[Hashable]] = [set() for _ in range(slots)]
+        self._slot: dict[Hashable, int] = {}
+        self._last_seen: dict[Hashable, float] = {}
+        self._timeouts: dict[Hashable, float] = {}
+        self._stale: set[Hashable] = set()
+        self._tick: int | None = None
+
+    def __len__(self) -> int:
+        """Return the number of tracked keys."""
+        return len(self._timeouts)
+
+    def _schedule(self, key: Hashable, deadline: float) -> None:
+        """Put a key in the bucket that comes due after its deadline."""
+        slot = (int(deadline // self.resolution) + 1) % len(self._buckets)
+        self._buckets[slot].add(key)
+        self._slot[key] = slot
+
+    def add(self, key: Hashable, timeout: float, now: float) -> None:
+        """Start tracking a key, as if it was touched now."""
+        if self._tick is None:
+            self._tick = int(now // self.resolution)
+        self.remove(key)
+        self._timeouts[key] = timeout
+        self._last_seen[key] = now
+        self._schedule(key, now + timeout)
+
+    def remove(self, key: Hashable) -> None:
+        """Stop tracking a key."""
+        if (slot := self._slot.pop(key, None)) is not None:
+            self._buckets[slot].discard(key)
+        self._timeouts.pop(key, None)
+        self._last_seen.pop(key, None)
+        self._stale.discard(key)
+
+    def touch(self, key: Hashable, now: float) -> bool:
+        """Record that a key reported. Returns True if it was stale."""
+        self._last_seen[key] = now
+        if key not in self._stale:
+            return False
+        self._stale.discard(key)
+        self._schedule(key, now + self._timeouts[key])
+        return True
+
+    def is_stale(self, key: Hashable) -> bool:
+        """Return whether a key is stale."""
+        return key in self._stale
+
+    def advance(self, now: float) -> list[Hashable]:
+        """Visit the buckets due by ``now``; return the keys that went stale."""
+        if self._tick is None:
+            return []
+        tick = int(now // self.resolution)
+        buckets = self._buckets
+        size = len(buckets)
+        expired: list[Hashable] = []
+        # After a gap longer than the wheel, visiting every bucket once is
+        # enough because entries are checked against their real deadline.
+        for current in range(max(self._tick + 1, tick - size + 1), tick + 1):
+            slot = current % size
+            if not (due := buckets[slot]):
+                continue
+            buckets[slot] = set()
+            for key in due:
+                deadline = self._last_seen[key] + self._timeouts[key]
+                if deadline <= now:
+                    del self._slot[key]
+                    self._stale.add(key)
+                    expired.append(key)
+                else:
+                    self._schedule(key, deadline)
+        self._tick = tick
+        return expired
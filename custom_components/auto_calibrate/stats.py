@@ -0,0 +1,105 @@
+"""Hot-path counters for Auto-Calibrate.
+
+A ``CallbackStats`` is only created for sensors with instrumentation
+enabled; sensors without one skip all timing.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+# Bucket i counts callbacks that took less than 2**i microseconds; the
+# last bucket also holds everything slower.
+HISTOGRAM_BUCKETS = 18
+
+
+class CallbackStats:
+    """Counters and a log2 latency histogram of one calibrated sensor."""
+
+    __slots__ = (
+        "events",
+        "parse_failures",
+        "limit_updates",
+        "writes",
+        "callback_ns",
+        "callback_max_ns",
+        "write_ns",
+        "histogram",
+    )
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.events = 0
+        self.parse_failures = 0
+        self.limit_updates = 0
+        self.writes = 0
+        self.callback_ns = 0
+        self.callback_max_ns = 0
+        self.write_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def record_callback(self, elapsed_ns: int) -> None:
+        """Record the duration of one source state change callback."""
+        self.events += 1
+        self.callback_ns += elapsed_ns
+        if elapsed_ns > self.callback_max_ns:
+            self.callback_max_ns = elapsed_ns
+        bucket = (elapsed_ns // 1000).bit_length()
+        self.histogram[min(bucket, HISTOGRAM_BUCKETS - 1)] += 1
+
+    def record_write(self, elapsed_ns: int) -> None:
+        """Record the duration of one state write."""
+        self.writes += 1
+        self.write_ns += elapsed_ns
+
+    def merge(self, other: CallbackStats) -> None:
+        """Add the counters of another sensor to these."""
+        self.events += other.events
+        self.parse_failures += other.parse_failures
+        self.limit_updates += other.limit_updates
+        self.writes += other.writes
+        self.callback_ns += other.callback_ns
+        self.callback_max_ns = max(self.callback_max_ns, other.callback_max_ns)
+        self.write_ns += other.write_ns
+        for bucket, count in enumerate(other.histogram):
+            self.histogram[bucket] += count
+
+    @property
+    def callback_mean_us(self) -> float | None:
+        """Return the mean callback time in microseconds."""
+        if not self.events:
+            return None
+        return round(self.callback_ns / self.events / 1000, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters in a JSON serializable form."""
+        return {
+            "events": self.events,
+            "parse_failures": self.parse_failures,
+            "limit_updates": self.limit_updates,
+            "writes": self.writes,
+            "callback_total_ms": round(self.callback_ns / 1e6, 3),
+            "callback_mean_us": self.callback_mean_us,
+            "callback_max_us": round(self.callback_max_ns / 1000, 1),
+            "write_total_ms": round(self.write_ns / 1e6, 3),
+            "callback_histogram_us": {
+                _bucket_label(bucket): count
+                for bucket, count in enumerate(self.histogram)
+                if count
+            },
+        }
+
+
+def _bucket_label(bucket: int) -> str:
+    """Return the microsecond range of a histogram bucket."""
+    if bucket < HISTOGRAM_BUCKETS - 1:
+        return f"<{2**bucket}"
+    return f">={2 ** (bucket - 1)}"
+
+
+def merge_stats(stats: Iterable[CallbackStats]) -> CallbackStats:
+    """Return the sum of the counters of many sensors."""
+    total = CallbackStats()
+    for item in stats:
+        total.merge(item)
+    return total
@@ -0,0 +1,166 @@
+"""Persistent calibration storage for Auto-Calibrate."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .profiles import CalibrationProfile
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+STORAGE_MINOR_VERSION = 1
+SAVE_DELAY = 60
+
+KEY_LIMITS = "l"
+KEY_RAW = "r"
+KEY_TREND = "t"
+KEY_FIT = "f"
+
+Record = dict[str, Any]
+ProfileAction = Callable[[], None]
+
+
+class CalibrationStore:
+    """Hold the learned calibration of every sensor in one storage file.
+
+    Sensors register a provider for their record and mark it dirty when it
+    changes. Dirty records are collected when the delayed save fires, so
+    all sensors share one write per ``SAVE_DELAY`` seconds. Pending changes
+    are also written when Home Assistant shuts down.
+
+    The store also keeps the calibration profiles, so a profile's pooled
+    limits are known before any of its members is set up.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            minor_version=STORAGE_MINOR_VERSION,
+        )
+        self._records: dict[str, Record] = {}
+        self._providers: dict[str, Callable[[], Record]] = {}
+        self._dirty: set[str] = set()
+        self._save_scheduled = False
+        self.profiles: dict[str, CalibrationProfile] = {}
+        self._profile_listeners: dict[str, dict[str, ProfileAction]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored records."""
+        data = await self._store.async_load()
+        if data is not None:
+            self._records = data.get("sensors", {})
+            for name, members in data.get("profiles", {}).items():
+                self.async_profile(name).restore(members)
+
+    @callback
+    def async_get(self, key: str) -> Record | None:
+        """Return the stored record of a sensor."""
+        return self._records.get(key)
+
+    @callback
+    def async_register(self, key: str, provider: Callable[[], Record]) -> CALLBACK_TYPE:
+        """Register the provider of a sensor's record."""
+        self._providers[key] = provider
+
+        @callback
+        def _async_unregister() -> None:
+            if self._providers.pop(key, None) is not None and key in self._dirty:
+                self._records[key] = provider()
+                self._dirty.discard(key)
+
+        return _async_unregister
+
+    @callback
+    def async_mark_dirty(self, key: str) -> None:
+        """Schedule a save that includes the current record of a sensor."""
+        self._dirty.add(key)
+        if not self._save_scheduled:
+            self._async_schedule_save()
+
+    @callback
+    def async_seed(self, key: str, limits: dict[str, Any]) -> None:
+        """Store precomputed limits for a sensor that is not set up yet."""
+        if key in self._providers:
+            return
+        self._records[key] = {KEY_LIMITS: limits, KEY_RAW: None}
+        if not self._save_scheduled:
+            self._async_schedule_save()
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Forget the record of a sensor."""
+        self._records.pop(key, None)
+        self._dirty.discard(key)
+        if not self._save_scheduled:
+            self._async_schedule_save()
+
+    @callback
+    def async_profile(self, name: str) -> CalibrationProfile:
+        """Return a calibration profile, creating it on first use."""
+        if (profile := self.profiles.get(name)) is None:
+            profile = self.profiles[name] = CalibrationProfile()
+        return profile
+
+    @callback
+    def async_update_profile(
+        self, name: str, member: str, min_raw: float | None, max_raw: float | None
+    ) -> None:
+        """Set or clear the limits a sensor contributes to a profile.
+
+        The other members listening to the profile are called if its pooled
+        limits changed; the member itself already knows.
+        """
+        changed = self.async_profile(name).update(member, min_raw, max_raw)
+        if not self._save_scheduled:
+            self._async_schedule_save()
+        if not changed:
+            return
+        for listener, action in tuple(self._profile_listeners.get(name, {}).items()):
+            if listener != member:
+                action()
+
+    @callback
+    def async_listen_profile(
+        self, name: str, member: str, action: ProfileAction
+    ) -> CALLBACK_TYPE:
+        """Call ``action`` whenever another member moves a profile's limits."""
+        listeners = self._profile_listeners.setdefault(name, {})
+        listeners[member] = action
+
+        @callback
+        def _async_unlisten() -> None:
+            listeners.pop(member, None)
+            if not listeners:
+                self._profile_listeners.pop(name, None)
+
+        return _async_unlisten
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule one delayed save for all pending changes."""
+        self._save_scheduled = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Collect the dirty records and return the data to write."""
+        for key in self._dirty:
+            if (provider := self._providers.get(key)) is not None:
+                self._records[key] = provider()
+        self._dirty.clear()
+        self._save_scheduled = False
+        return {
+            "sensors": self._records,
+            "profiles": {
+                name: profile.as_dict()
+                for name, profile in self.profiles.items()
+                if profile.count
+            },
+        }
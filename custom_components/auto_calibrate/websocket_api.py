@@ -0,0 +1,145 @@
+"""Websocket API for exporting and applying Auto-Calibrate limits."""
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+
+from .const import ATTR_MAX_RAW, ATTR_MIN_RAW, CONF_ENTITY_ID, DATA_SENSORS, DOMAIN
+from .limits import MODE_ABSOLUTE, MODE_DECAY
+
+if TYPE_CHECKING:
+    from .limits import LimitTracker
+    from .sensor import AutoCalibrateSensor
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+CONF_LIMITS = "limits"
+CONF_SENSORS = "sensors"
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_list)
+    websocket_api.async_register_command(hass, websocket_apply)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/list",
+        vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional("limit", default=DEFAULT_PAGE_SIZE): vol.All(
+            int, vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+    }
+)
+@websocket_api.require_admin
+@callback
+def websocket_list(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """List the calibration of all sensors, one page at a time."""
+    sensors: dict[str, AutoCalibrateSensor] = hass.data[DATA_SENSORS]
+    entity_ids = sorted(sensors)
+    offset: int = msg["offset"]
+    end = offset + msg["limit"]
+    connection.send_result(
+        msg["id"],
+        {
+            CONF_SENSORS: [
+                sensors[entity_id].export_calibration()
+                for entity_id in entity_ids[offset:end]
+            ],
+            "total": len(entity_ids),
+            "next_offset": end if end < len(entity_ids) else None,
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/apply",
+        vol.Required(CONF_SENSORS): [
+            vol.Schema(
+                {
+                    vol.Required(CONF_ENTITY_ID): cv.entity_id,
+                    vol.Exclusive(CONF_LIMITS, "limits"): dict,
+                    vol.Inclusive(ATTR_MIN_RAW, "range"): vol.Coerce(float),
+                    vol.Inclusive(ATTR_MAX_RAW, "range"): vol.Coerce(float),
+                },
+                extra=vol.ALLOW_EXTRA,
+            )
+        ],
+    }
+)
+@websocket_api.require_admin
+@callback
+def websocket_apply(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Apply limits to many sensors at once.
+
+    Items take either exported ``limits`` (as returned by ``list``) or a
+    ``min_raw``/``max_raw`` pair for absolute and decay mode sensors. Every
+    item is validated before any sensor changes, and all changed sensors
+    are written in one pass.
+    """
+    sensors: dict[str, AutoCalibrateSensor] = hass.data[DATA_SENSORS]
+    updates: list[tuple[AutoCalibrateSensor, LimitTracker]] = []
+    errors: list[str] = []
+
+    for item in msg[CONF_SENSORS]:
+        entity_id: str = item[CONF_ENTITY_ID]
+        if (sensor := sensors.get(entity_id)) is None:
+            errors.append(f"{entity_id}: not an auto_calibrate sensor")
+            continue
+        if CONF_LIMITS in item:
+            data = item[CONF_LIMITS]
+        elif ATTR_MIN_RAW in item:
+            if sensor.learning_mode not in (MODE_ABSOLUTE, MODE_DECAY):
+                errors.append(
+                    f"{entity_id}: {sensor.learning_mode} mode needs exported limits"
+                )
+                continue
+            if item[ATTR_MIN_RAW] > item[ATTR_MAX_RAW]:
+                errors.append(f"{entity_id}: min_raw is above max_raw")
+                continue
+            data = {
+                "mode": sensor.learning_mode,
+                "min": item[ATTR_MIN_RAW],
+                "max": item[ATTR_MAX_RAW],
+                # Decay limits relax from the time they were applied.
+                "last": time.time(),
+            }
+        else:
+            errors.append(f"{entity_id}: limits or min_raw/max_raw required")
+            continue
+        try:
+            updates.append((sensor, sensor.build_limits(data)))
+        except ValueError as err:
+            errors.append(f"{entity_id}: {err}")
+
+    if errors:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_INVALID_FORMAT, "; ".join(errors)
+        )
+        return
+
+    for sensor, tracker in updates:
+        sensor.async_set_limits(tracker, write_state=False)
+    for sensor, _ in updates:
+        sensor.async_write_ha_state()
+    connection.send_result(
+        msg["id"], {"applied": [sensor.entity_id for sensor, _ in updates]}
+    )
@@ -0,0 +1,10 @@
+"""Make the Home Assistant independent modules importable in the tests."""
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"),
+)
@@ -0,0 +1,70 @@
+"""Tests for the running group statistics."""
+from __future__ import annotations
+
+import random
+import statistics
+
+from _component import load_component_module
+import pytest
+
+aggregate = load_component_module("aggregate")
+
+
+def test_empty_aggregate() -> None:
+    """Without members every statistic is None and nothing is below."""
+    running = aggregate.RunningAggregate(20.0)
+    assert running.count == 0
+    assert (running.mean, running.min, running.max, running.median) == (
+        None,
+        None,
+        None,
+        None,
+    )
+    assert running.count_below == 0
+
+
+def test_update_reports_changes() -> None:
+    """Only an actual change of the member values returns True."""
+    running = aggregate.RunningAggregate(20.0)
+    assert running.update("a", 5.0)
+    assert not running.update("a", 5.0)
+    assert not running.update("b", None)
+    assert running.update("a", None)
+    assert running.count == 0
+
+
+def test_matches_recomputation() -> None:
+    """Random member changes agree with statistics recomputed from scratch."""
+    rng = random.Random(7)
+    running = aggregate.RunningAggregate(30.0)
+    members: dict[str, float] = {}
+    for _ in range(2000):
+        key = f"sensor.{rng.randrange(25)}"
+        if rng.random() < 0.2:
+            running.update(key, None)
+            members.pop(key, None)
+        else:
+            value = round(rng.uniform(0, 100), 1)
+            running.update(key, value)
+            members[key] = value
+        values = list(members.values())
+        assert running.count == len(values)
+        if not values:
+            assert running.median is None
+            continue
+        assert running.mean == pytest.approx(statistics.fmean(values))
+        assert running.min == min(values)
+        assert running.max == max(values)
+        assert running.median == statistics.median(values)
+        assert running.count_below == sum(value < 30.0 for value in values)
+
+
+def test_clear() -> None:
+    """Clearing forgets every member."""
+    running = aggregate.RunningAggregate(50.0)
+    running.update("a", 10.0)
+    running.update("b", 90.0)
+    running.clear()
+    assert running.count == 0
+    assert running.mean is None
+    assert running.update("a", 10.0)
@@ -0,0 +1,63 @@
+"""Tests for the response curves."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+
+from _component import load_component_module
+import pytest
+
+curves = load_component_module("curves")
+
+
+def test_linear_is_none() -> None:
+    """The linear curve needs no table."""
+    assert curves.create_curve(curves.CURVE_LINEAR) is None
+
+
+@pytest.mark.parametrize(
+    ("kind", "parameter", "function"),
+    [
+        (
+            curves.CURVE_LOG,
+            9.0,
+            lambda value: 100 * math.log1p(9.0 * value / 100) / math.log1p(9.0),
+        ),
+        (curves.CURVE_POWER, 2.0, lambda value: 100 * (value / 100) ** 2),
+    ],
+)
+def test_table_matches_function(
+    kind: str, parameter: float, function: Callable[[float], float]
+) -> None:
+    """Every 0.1% step maps to the rounded curve function."""
+    curve = curves.create_curve(kind, parameter)
+    for step in range(1001):
+        value = step / 10
+        assert curve(value) == round(function(value), 1)
+    assert (curve(0.0), curve(100.0)) == (0.0, 100.0)
+
+
+def test_piecewise_interpolates_between_points() -> None:
+    """Values between breakpoints are interpolated, outside they are held."""
+    curve = curves.create_curve(curves.CURVE_PIECEWISE, points="10:0, 50:80; 90:100")
+    assert curve(0.0) == 0.0
+    assert curve(30.0) == 40.0
+    assert curve(50.0) == 80.0
+    assert curve(70.0) == 90.0
+    assert curve(95.0) == 100.0
+
+
+@pytest.mark.parametrize(
+    "points", ["", "10:20", "10-20, 30:40", "50:10, 40:20", "10:20, 30:140"]
+)
+def test_parse_points_rejects_invalid(points: str) -> None:
+    """Breakpoints must be x:y pairs in range with increasing x."""
+    with pytest.raises(ValueError):
+        curves.parse_points(points)
+
+
+@pytest.mark.parametrize("kind", [curves.CURVE_LOG, curves.CURVE_POWER])
+def test_non_positive_parameter_is_rejected(kind: str) -> None:
+    """The log strength and the power exponent must be positive."""
+    with pytest.raises(ValueError):
+        curves.create_curve(kind, 0.0)
@@ -0,0 +1,163 @@
+"""Tests for the calibration engine."""
+from __future__ import annotations
+
+import random
+
+from _component import load_component_module
+import pytest
+
+const = load_component_module("const")
+curves = load_component_module("curves")
+engine = load_component_module("engine")
+fit = load_component_module("fit")
+limits = load_component_module("limits")
+profiles = load_component_module("profiles")
+
+
+@pytest.mark.parametrize(
+    ("raw", "low", "high", "expected"),
+    [
+        (50.0, 0.0, 200.0, 25.0),
+        (-5.0, 0.0, 200.0, 0.0),
+        (250.0, 0.0, 200.0, 100.0),
+        (1.0, 0.0, 3.0, 33.3),
+        (7.0, 7.0, 7.0, 0.0),
+        (None, 0.0, 1.0, None),
+        (1.0, None, 1.0, None),
+    ],
+)
+def test_normalize(
+    raw: float | None, low: float | None, high: float | None, expected: float | None
+) -> None:
+    """Values are clamped to 0-100% and rounded to 0.1."""
+    assert engine.normalize(raw, low, high) == expected
+
+
+def test_state_caches_value_until_inputs_change() -> None:
+    """The value is recomputed only after an update or a setting change."""
+    state = engine.CalibrationState(limits.AbsoluteLimits())
+    assert state.value is None
+    state.update(0.0, 0)
+    state.update(200.0, 1)
+    state.update(50.0, 2)
+    assert state.value == 25.0
+    state.set_overrides(None, 100.0)
+    assert state.value == 50.0
+    assert state.max_raw == 100.0
+    assert state.limits.max_raw == 200.0
+    state.set_curve(curves.create_curve(curves.CURVE_POWER, 0.5))
+    assert state.value == pytest.approx(70.7)
+    state.reset()
+    assert state.value is None
+
+
+def test_state_uses_pooled_profile_limits() -> None:
+    """A shared profile supplies the limits unless overridden."""
+    profile = profiles.CalibrationProfile()
+    profile.update("a", 0.0, 400.0)
+    state = engine.CalibrationState(limits.AbsoluteLimits())
+    state.update(0.0, 0)
+    state.update(100.0, 1)
+    state.set_profile(profile)
+    assert state.value == 25.0
+    state.set_overrides(None, 200.0)
+    assert state.value == 50.0
+
+
+def test_state_with_fit_publishes_corrected_value() -> None:
+    """With a reference fit, the output is the raw value in reference units."""
+    state = engine.CalibrationState(limits.AbsoluteLimits())
+    state.set_fit(fit.LinearFit())
+    state.update(10.0, 0)
+    assert state.update_reference(20.0, 0)
+    assert state.value is None
+    state.update(20.0, 1)
+    assert state.update_reference(40.0, 1)
+    state.update(15.0, 2)
+    assert state.value == pytest.approx(30.0)
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_normalize_many_matches_normalize(
+    monkeypatch: pytest.MonkeyPatch, numpy: bool
+) -> None:
+    """The batch path agrees with the scalar path, with and without NumPy."""
+    if numpy and engine.np is None:
+        pytest.skip("NumPy is not installed")
+    if not numpy:
+        monkeypatch.setattr(engine, "np", None)
+    rng = random.Random(5)
+    raws: list[float | None] = [rng.uniform(-10, 110) for _ in range(200)]
+    lows: list[float | None] = [rng.uniform(0, 20) for _ in range(200)]
+    highs: list[float | None] = [rng.uniform(80, 100) for _ in range(200)]
+    raws[3] = None
+    lows[4] = None
+    highs[5] = lows[5]
+    assert engine.normalize_many(raws, lows, highs) == [
+        engine.normalize(raw, low, high)
+        for raw, low, high in zip(raws, lows, highs, strict=True)
+    ]
+
+
+def test_update_many_matches_single_updates() -> None:
+    """Batch updates leave every state as single updates would."""
+    rng = random.Random(6)
+    batch = [engine.CalibrationState(limits.AbsoluteLimits()) for _ in range(20)]
+    single = [engine.CalibrationState(limits.AbsoluteLimits()) for _ in range(20)]
+    curve = curves.create_curve(curves.CURVE_LOG)
+    batch[0].set_curve(curve)
+    single[0].set_curve(curve)
+    for round_ in range(30):
+        values = [rng.uniform(0, 100) for _ in batch]
+        timestamps = [float(round_)] * len(batch)
+        outputs = engine.update_many(batch, values, timestamps)
+        for state, value in zip(single, values, strict=True):
+            state.update(value, round_)
+        assert outputs == [state.value for state in single]
+        assert [state.value for state in batch] == outputs
+
+
+def test_update_many_rejects_length_mismatch() -> None:
+    """Inputs of different lengths raise instead of truncating."""
+    states = [engine.CalibrationState(limits.AbsoluteLimits()) for _ in range(2)]
+    with pytest.raises(ValueError):
+        engine.update_many(states, [1.0], [0.0, 0.0])
+
+
+@pytest.mark.parametrize(
+    ("mode", "tracker"),
+    [
+        (limits.MODE_ABSOLUTE, limits.AbsoluteLimits),
+        (limits.MODE_QUANTILE, limits.QuantileLimits),
+        (limits.MODE_WINDOW, limits.WindowLimits),
+        (limits.MODE_DECAY, limits.DecayLimits),
+    ],
+)
+def test_create_limits(mode: str, tracker: type) -> None:
+    """The learning mode option selects the tracker."""
+    assert isinstance(
+        engine.create_limits({const.CONF_LEARNING_MODE: mode}), tracker
+    )
+
+
+def test_restore_limits_validates_data() -> None:
+    """Data of another mode or of the wrong shape raises ValueError."""
+    options = {const.CONF_LEARNING_MODE: limits.MODE_WINDOW}
+    tracker = engine.create_limits(options)
+    tracker.update(5.0, 0)
+    restored = engine.restore_limits(options, tracker.as_dict())
+    assert restored.min_raw == 5.0
+    with pytest.raises(ValueError):
+        engine.restore_limits(options, {"mode": limits.MODE_ABSOLUTE})
+    broken = tracker.as_dict()
+    del broken["cur"]
+    with pytest.raises(ValueError):
+        engine.restore_limits(options, broken)
+
+
+def test_attribute_output_options_drop_state_options() -> None:
+    """Attribute outputs do not inherit options in the units of the state."""
+    options = {const.CONF_MIN_RAW: 3.0, const.CONF_LEARNING_MODE: "decay"}
+    assert engine.attribute_output_options(options) == {
+        const.CONF_LEARNING_MODE: "decay"
+    }
@@ -0,0 +1,83 @@
+"""Tests for the online reference fit."""
+from __future__ import annotations
+
+import random
+
+from _component import load_component_module
+import pytest
+
+fit = load_component_module("fit")
+
+
+def test_two_points_give_exact_calibration() -> None:
+    """Two distinct pairs give the line through them."""
+    line = fit.LinearFit()
+    line.update(0, 20.0, 0.0)
+    assert line.gain is None
+    line.update(1, 80.0, 100.0)
+    assert line.gain == pytest.approx(100 / 60)
+    assert line.offset == pytest.approx(-100 / 3)
+    assert line.predict(50.0) == pytest.approx(50.0)
+
+
+def test_least_squares_without_half_life() -> None:
+    """Without a half-life the fit equals ordinary least squares."""
+    rng = random.Random(9)
+    pairs = [(x, 3.0 * x - 7.0 + rng.gauss(0, 1)) for x in range(100)]
+    line = fit.LinearFit()
+    for index, (raw, reference) in enumerate(pairs):
+        line.update(index, raw, reference)
+    count = len(pairs)
+    mean_x = sum(x for x, _ in pairs) / count
+    mean_y = sum(y for _, y in pairs) / count
+    gain = sum((x - mean_x) * (y - mean_y) for x, y in pairs) / sum(
+        (x - mean_x) ** 2 for x, _ in pairs
+    )
+    assert line.gain == pytest.approx(gain)
+    assert line.offset == pytest.approx(mean_y - gain * mean_x)
+
+
+def test_large_raw_values_keep_precision() -> None:
+    """Raw values with a large offset do not cancel out."""
+    line = fit.LinearFit()
+    for index in range(50):
+        raw = 1e6 + index * 0.5
+        line.update(index, raw, 2.0 * (raw - 1e6) + 5.0)
+    assert line.gain == pytest.approx(2.0, rel=1e-9)
+    assert line.predict(1e6 + 1.0) == pytest.approx(7.0, rel=1e-9)
+
+
+def test_half_life_follows_a_changed_probe() -> None:
+    """With a half-life, old pairs fade and the fit follows the new line."""
+    line = fit.LinearFit(half_life=600.0)
+    for index in range(100):
+        line.update(index * 60.0, float(index % 10), 2.0 * (index % 10))
+    for index in range(100, 400):
+        line.update(index * 60.0, float(index % 10), 3.0 * (index % 10) + 1.0)
+    assert line.gain == pytest.approx(3.0, rel=1e-3)
+    assert line.offset == pytest.approx(1.0, abs=1e-2)
+
+
+def test_constant_raw_defines_no_gain() -> None:
+    """Pairs with a single raw value define no line."""
+    line = fit.LinearFit()
+    for index in range(5):
+        line.update(index, 4.0, float(index))
+    assert line.gain is None
+    assert line.predict(4.0) is None
+
+
+def test_round_trip() -> None:
+    """A restored fit continues exactly like the original."""
+    line = fit.LinearFit(half_life=600.0)
+    for index, (raw, reference) in enumerate(((1.0, 2.0), (2.0, 4.5), (3.0, 6.0))):
+        line.update(index * 60.0, raw, reference)
+    restored = fit.LinearFit(half_life=600.0)
+    restored.restore(line.as_dict())
+    line.update(240.0, 4.0, 8.0)
+    restored.update(240.0, 4.0, 8.0)
+    assert (restored.gain, restored.offset, restored.count) == (
+        line.gain,
+        line.offset,
+        line.count,
+    )
@@ -0,0 +1,51 @@
+"""Tests for the flight recorder ring buffer."""
+from __future__ import annotations
+
+from _component import load_component_module
+
+flight_recorder = load_component_module("flight_recorder")
+
+
+def test_keeps_last_events_oldest_first() -> None:
+    """A full recorder overwrites the oldest events."""
+    recorder = flight_recorder.FlightRecorder(3)
+    for index in range(5):
+        recorder.record(float(index), float(index), 0.0, 10.0, index * 10.0)
+    assert len(recorder) == 3
+    assert [row["timestamp"] for row in recorder.as_list()] == [2.0, 3.0, 4.0]
+
+
+def test_missing_values_and_event_names() -> None:
+    """None round-trips through the NaN columns and flags become names."""
+    recorder = flight_recorder.FlightRecorder(2)
+    recorder.record(
+        1.0,
+        None,
+        None,
+        None,
+        None,
+        flight_recorder.EVENT_UNPARSABLE | flight_recorder.EVENT_RESET,
+    )
+    recorder.record(2.0, 5.0, 1.0, 9.0, 50.0, flight_recorder.EVENT_MIN_CHANGED)
+    first, second = recorder.as_list()
+    assert first == {
+        "timestamp": 1.0,
+        "raw_value": None,
+        "min_raw": None,
+        "max_raw": None,
+        "value": None,
+        "events": ["unparsable", "reset"],
+    }
+    assert second["raw_value"] == 5.0
+    assert second["events"] == ["min_changed"]
+
+
+def test_clear() -> None:
+    """Clearing forgets every event."""
+    recorder = flight_recorder.FlightRecorder(2)
+    recorder.record(1.0, 1.0, 1.0, 1.0, 0.0)
+    recorder.clear()
+    assert len(recorder) == 0
+    assert recorder.as_list() == []
+    recorder.record(2.0, 1.0, 1.0, 1.0, 0.0)
+    assert [row["timestamp"] for row in recorder.as_list()] == [2.0]
@@ -0,0 +1,90 @@
+"""Tests for the trend estimator."""
+from __future__ import annotations
+
+import random
+
+from _component import load_component_module
+import pytest
+
+forecast = load_component_module("forecast")
+
+
+def _weighted_line(
+    samples: list[tuple[float, float]], half_life: float
+) -> tuple[float, float]:
+    """Return the slope and the level at the last sample by direct sums."""
+    last = samples[-1][0]
+    weights = [2 ** (-(last - t) / half_life) for t, _ in samples]
+    s0 = sum(weights)
+    mean_t = sum(w * t for w, (t, _) in zip(weights, samples, strict=True)) / s0
+    mean_y = sum(w * y for w, (_, y) in zip(weights, samples, strict=True)) / s0
+    stt = sum(
+        w * (t - mean_t) ** 2 for w, (t, _) in zip(weights, samples, strict=True)
+    )
+    sty = sum(
+        w * (t - mean_t) * (y - mean_y)
+        for w, (t, y) in zip(weights, samples, strict=True)
+    )
+    slope = sty / stt
+    return slope, mean_y + slope * (last - mean_t)
+
+
+def test_exact_line() -> None:
+    """Samples on a line give its slope, level and crossing time."""
+    trend = forecast.TrendEstimator(3600.0)
+    for t in range(0, 3600, 60):
+        trend.update(float(t), 80.0 - 0.01 * t)
+    assert trend.slope == pytest.approx(-0.01)
+    assert trend.level == pytest.approx(80.0 - 0.01 * 3540)
+    assert trend.time_to(20.0) == pytest.approx((80.0 - 0.01 * 3540 - 20.0) / 0.01)
+    assert trend.time_to(90.0) is None
+
+
+def test_matches_weighted_least_squares() -> None:
+    """Noisy samples agree with a weighted fit computed from scratch."""
+    rng = random.Random(8)
+    trend = forecast.TrendEstimator(1800.0)
+    samples: list[tuple[float, float]] = []
+    t = 0.0
+    for _ in range(300):
+        t += rng.uniform(10, 120)
+        value = 50.0 + 0.002 * t + rng.gauss(0, 2)
+        samples.append((t, value))
+        trend.update(t, value)
+    slope, level = _weighted_line(samples, 1800.0)
+    assert trend.slope == pytest.approx(slope, rel=1e-6)
+    assert trend.level == pytest.approx(level, rel=1e-6)
+
+
+def test_flat_readings_pull_slope_to_zero() -> None:
+    """A source that stops changing flattens the trend."""
+    trend = forecast.TrendEstimator(600.0)
+    for t in range(0, 600, 60):
+        trend.update(float(t), float(t))
+    assert trend.slope == pytest.approx(1.0)
+    for t in range(600, 20000, 60):
+        trend.update(float(t), 540.0)
+    assert trend.slope == pytest.approx(0.0, abs=1e-6)
+
+
+def test_undefined_until_two_times() -> None:
+    """One sample, or samples at one instant, define no slope."""
+    trend = forecast.TrendEstimator(600.0)
+    assert trend.slope is None
+    trend.update(0.0, 1.0)
+    trend.update(0.0, 2.0)
+    assert trend.slope is None
+    assert trend.level is None
+
+
+def test_round_trip() -> None:
+    """A restored estimator continues exactly like the original."""
+    trend = forecast.TrendEstimator(600.0)
+    for t, value in ((0.0, 1.0), (60.0, 3.0), (120.0, 4.0)):
+        trend.update(t, value)
+    restored = forecast.TrendEstimator(600.0)
+    restored.restore(trend.as_dict())
+    trend.update(180.0, 8.0)
+    restored.update(180.0, 8.0)
+    assert restored.slope == trend.slope
+    assert restored.level == trend.level
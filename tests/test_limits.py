@@ -0,0 +1,149 @@
+"""Tests for the limit trackers."""
+from __future__ import annotations
+
+import random
+
+from _component import load_component_module
+import pytest
+
+limits = load_component_module("limits")
+
+
+def test_absolute_limits_keep_extremes() -> None:
+    """The absolute tracker keeps the all-time minimum and maximum."""
+    tracker = limits.AbsoluteLimits()
+    assert tracker.update(5.0, 0)
+    assert tracker.update(2.0, 1)
+    assert tracker.update(9.0, 2)
+    assert not tracker.update(4.0, 3)
+    assert (tracker.min_raw, tracker.max_raw) == (2.0, 9.0)
+
+
+@pytest.mark.parametrize("p", [0.05, 0.5, 0.95])
+def test_p2_quantile_tracks_sample_quantile(p: float) -> None:
+    """P² stays close to the exact quantile of a large sample."""
+    rng = random.Random(4)
+    values = [rng.uniform(0, 1000) for _ in range(20000)]
+    estimator = limits.P2Quantile(p)
+    for value in values:
+        estimator.add(value)
+    exact = sorted(values)[int(p * len(values))]
+    assert estimator.value == pytest.approx(exact, abs=15)
+
+
+def test_quantile_limits_ignore_glitches() -> None:
+    """Isolated glitch readings barely move the quantile limits."""
+    rng = random.Random(1)
+    tracker = limits.QuantileLimits(0.05, 0.95)
+    for index in range(5000):
+        value = 65535.0 if index % 1000 == 500 else rng.uniform(20, 80)
+        tracker.update(value, index)
+    assert tracker.min_raw == pytest.approx(23, abs=5)
+    assert tracker.max_raw == pytest.approx(77, abs=5)
+
+
+def test_quantile_limits_round_trip() -> None:
+    """A restored quantile tracker continues exactly like the original."""
+    rng = random.Random(2)
+    tracker = limits.QuantileLimits(0.1, 0.9)
+    for index in range(100):
+        tracker.update(rng.uniform(0, 100), index)
+    restored = limits.QuantileLimits(0.1, 0.9)
+    restored.restore(tracker.as_dict())
+    for index in range(100, 200):
+        value = rng.uniform(0, 100)
+        tracker.update(value, index)
+        restored.update(value, index)
+    assert (restored.min_raw, restored.max_raw) == (tracker.min_raw, tracker.max_raw)
+
+
+def _window_extremes(
+    readings: list[tuple[float, float]], width: float, buckets: int
+) -> tuple[float, float]:
+    """Return the window extremes by scanning every reading."""
+    newest = int(readings[-1][0] // width)
+    window = [
+        value for timestamp, value in readings if timestamp // width > newest - buckets
+    ]
+    return min(window), max(window)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_window_limits_match_brute_force(seed: int) -> None:
+    """The bucketed deques agree with a scan of the readings in the window."""
+    rng = random.Random(seed)
+    tracker = limits.WindowLimits(600.0, buckets=10)
+    readings: list[tuple[float, float]] = []
+    timestamp = 0.0
+    for _ in range(2000):
+        # Mostly small steps, with occasional gaps longer than the window.
+        timestamp += rng.choice((1.0, 7.0, 45.0, 130.0, 900.0))
+        value = rng.gauss(50, 20)
+        readings.append((timestamp, value))
+        tracker.update(value, timestamp)
+        assert (tracker.min_raw, tracker.max_raw) == _window_extremes(
+            readings, 60.0, 10
+        )
+
+
+def test_window_limits_round_trip() -> None:
+    """A restored window tracker continues exactly like the original."""
+    rng = random.Random(3)
+    tracker = limits.WindowLimits(600.0, buckets=10)
+    for index in range(300):
+        tracker.update(rng.uniform(0, 100), index * 13.0)
+    restored = limits.WindowLimits(600.0, buckets=10)
+    restored.restore(tracker.as_dict())
+    assert (restored.min_raw, restored.max_raw) == (tracker.min_raw, tracker.max_raw)
+    for index in range(300, 600):
+        value = rng.uniform(0, 100)
+        tracker.update(value, index * 13.0)
+        restored.update(value, index * 13.0)
+        assert (restored.min_raw, restored.max_raw) == (
+            tracker.min_raw,
+            tracker.max_raw,
+        )
+
+
+def test_window_limits_discard_other_window() -> None:
+    """Buckets learned for another window length are not restored."""
+    tracker = limits.WindowLimits(600.0, buckets=10)
+    tracker.update(5.0, 0)
+    restored = limits.WindowLimits(1200.0, buckets=10)
+    restored.restore(tracker.as_dict())
+    assert restored.min_raw is None
+
+
+def test_decay_limits_relax_by_half_life() -> None:
+    """An extreme not seen again loses half its distance per half-life."""
+    tracker = limits.DecayLimits(3600.0)
+    tracker.update(0.0, 0)
+    tracker.update(100.0, 0)
+    assert tracker.update(50.0, 3600.0)
+    assert tracker.min_raw == pytest.approx(25.0)
+    assert tracker.max_raw == pytest.approx(75.0)
+    assert tracker.update(90.0, 3600.0)
+    assert tracker.max_raw == 90.0
+
+
+def test_decay_limits_restored_without_time() -> None:
+    """Limits restored without a time decay from the next reading on."""
+    tracker = limits.DecayLimits(3600.0)
+    tracker.restore({"mode": limits.MODE_DECAY, "min": 100.0, "max": 900.0})
+    assert not tracker.update(500.0, 1000.0)
+    assert (tracker.min_raw, tracker.max_raw) == (100.0, 900.0)
+    tracker.update(500.0, 4600.0)
+    assert tracker.min_raw == pytest.approx(300.0)
+    assert tracker.max_raw == pytest.approx(700.0)
+
+
+def test_decay_limits_round_trip() -> None:
+    """A restored decay tracker continues exactly like the original."""
+    tracker = limits.DecayLimits(3600.0)
+    for index, value in enumerate((10.0, 80.0, 40.0)):
+        tracker.update(value, index * 600.0)
+    restored = limits.DecayLimits(3600.0)
+    restored.restore(tracker.as_dict())
+    tracker.update(50.0, 7200.0)
+    restored.update(50.0, 7200.0)
+    assert (restored.min_raw, restored.max_raw) == (tracker.min_raw, tracker.max_raw)
@@ -0,0 +1,49 @@
+"""Tests for the calibration profiles."""
+from __future__ import annotations
+
+from _component import load_component_module
+
+profiles = load_component_module("profiles")
+
+
+def test_pooled_limits_are_member_medians() -> None:
+    """The pooled limits are the medians, so one odd probe does not move them."""
+    profile = profiles.CalibrationProfile()
+    assert profile.update("a", 20.0, 90.0)
+    assert profile.update("b", 24.0, 94.0)
+    assert profile.update("c", 0.0, 1000.0)
+    assert profile.count == 3
+    assert (profile.min_raw, profile.max_raw) == (20.0, 94.0)
+
+
+def test_update_reports_pooled_changes() -> None:
+    """Only a change of the pooled limits returns True."""
+    profile = profiles.CalibrationProfile()
+    profile.update("a", 20.0, 90.0)
+    profile.update("b", 30.0, 80.0)
+    profile.update("c", 40.0, 70.0)
+    assert not profile.update("c", 35.0, 75.0)
+    assert profile.update("b", 33.0, 80.0)
+
+
+def test_members_without_a_range_do_not_count() -> None:
+    """Missing or empty ranges clear the member's contribution."""
+    profile = profiles.CalibrationProfile()
+    profile.update("a", 20.0, 90.0)
+    assert not profile.update("b", None, None)
+    assert not profile.update("c", 50.0, 50.0)
+    assert profile.count == 1
+    assert profile.update("a", None, 90.0)
+    assert profile.count == 0
+    assert profile.min_raw is None
+
+
+def test_round_trip() -> None:
+    """A restored profile has the same members and pooled limits."""
+    profile = profiles.CalibrationProfile()
+    profile.update("a", 20.0, 90.0)
+    profile.update("b", 24.0, 94.0)
+    restored = profiles.CalibrationProfile()
+    restored.restore(profile.as_dict())
+    assert restored.as_dict() == profile.as_dict()
+    assert (restored.min_raw, restored.max_raw) == (22.0, 92.0)
@@ -0,0 +1,71 @@
+"""Tests for the stale source timer wheel."""
+from __future__ import annotations
+
+import math
+import random
+
+from _component import load_component_module
+import pytest
+
+staleness = load_component_module("staleness")
+
+
+def test_key_goes_stale_once_and_recovers() -> None:
+    """A silent key is reported once; a touch makes it fresh again."""
+    wheel = staleness.TimerWheel(1.0)
+    wheel.add("a", 10.0, 0.0)
+    assert wheel.advance(9.5) == []
+    assert wheel.advance(11.0) == ["a"]
+    assert wheel.is_stale("a")
+    assert wheel.advance(30.0) == []
+    assert wheel.touch("a", 31.0)
+    assert not wheel.is_stale("a")
+    assert not wheel.touch("a", 32.0)
+    assert wheel.advance(41.5) == []
+    assert wheel.advance(43.0) == ["a"]
+
+
+def test_remove_stops_tracking() -> None:
+    """Removed keys are never reported."""
+    wheel = staleness.TimerWheel(1.0)
+    wheel.add("a", 5.0, 0.0)
+    wheel.remove("a")
+    assert len(wheel) == 0
+    assert wheel.advance(100.0) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force(seed: int) -> None:
+    """Random touches and gaps agree with checking every key every time.
+
+    A key is never reported before its deadline, and at the latest by the
+    first ``advance`` that reaches the bucket after its deadline. The small
+    wheel makes deadlines and gaps wrap around it.
+    """
+    rng = random.Random(seed)
+    resolution = 2.0
+    wheel = staleness.TimerWheel(resolution, slots=16)
+    timeouts = {key: rng.choice((5.0, 17.0, 40.0, 100.0)) for key in range(30)}
+    last_seen: dict[int, float] = {}
+    stale: set[int] = set()
+    now = 0.0
+    for key, timeout in timeouts.items():
+        wheel.add(key, timeout, now)
+        last_seen[key] = now
+    for _ in range(3000):
+        now += rng.choice((0.3, 1.0, 2.5, 7.0, 60.0))
+        for key in rng.sample(sorted(timeouts), 3):
+            assert wheel.touch(key, now) == (key in stale)
+            stale.discard(key)
+            last_seen[key] = now
+        expired = wheel.advance(now)
+        assert len(expired) == len(set(expired))
+        for key in expired:
+            assert key not in stale
+            assert last_seen[key] + timeouts[key] <= now
+        stale.update(expired)
+        for key in timeouts:
+            due = math.floor((last_seen[key] + timeouts[key]) / resolution) + 1
+            if due <= math.floor(now / resolution):
+                assert key in stale
+        assert all(wheel.is_stale(key) == (key in stale) for key in timeouts)
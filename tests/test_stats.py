@@ -0,0 +1,51 @@
+"""Tests for the hot-path counters."""
+from __future__ import annotations
+
+from _component import load_component_module
+
+stats = load_component_module("stats")
+
+
+def test_record_callback_fills_log2_histogram() -> None:
+    """Callbacks land in the bucket of their duration in microseconds."""
+    counters = stats.CallbackStats()
+    for elapsed_ns in (500, 1_500, 3_000, 10**12):
+        counters.record_callback(elapsed_ns)
+    assert counters.events == 4
+    assert counters.callback_max_ns == 10**12
+    assert counters.histogram[0] == 1
+    assert counters.histogram[1] == 1
+    assert counters.histogram[2] == 1
+    assert counters.histogram[-1] == 1
+    assert counters.as_dict()["callback_histogram_us"] == {
+        "<1": 1,
+        "<2": 1,
+        "<4": 1,
+        f">={2 ** (stats.HISTOGRAM_BUCKETS - 2)}": 1,
+    }
+
+
+def test_callback_mean() -> None:
+    """The mean is reported in microseconds, and None without events."""
+    counters = stats.CallbackStats()
+    assert counters.callback_mean_us is None
+    counters.record_callback(2_000)
+    counters.record_callback(4_000)
+    assert counters.callback_mean_us == 3.0
+
+
+def test_merge_stats_sums_counters() -> None:
+    """Merged counters are the sums, and the maximum of the maxima."""
+    first = stats.CallbackStats()
+    first.record_callback(1_000)
+    first.record_write(200)
+    first.parse_failures = 2
+    second = stats.CallbackStats()
+    second.record_callback(9_000)
+    second.limit_updates = 3
+    total = stats.merge_stats([first, second])
+    assert (total.events, total.writes) == (2, 1)
+    assert (total.parse_failures, total.limit_updates) == (2, 3)
+    assert total.callback_ns == 10_000
+    assert total.callback_max_ns == 9_000
+    assert sum(total.histogram) == 2
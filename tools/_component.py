@@ -0,0 +1,27 @@
+"""Load the Home Assistant independent modules of the integration.
+
+Shared by the command line tools and the benchmarks.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import types
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENT_DIR = os.path.join(REPO_ROOT, "custom_components", "auto_calibrate")
+
+
+def load_component_module(name: str) -> types.ModuleType:
+    """Import a Home Assistant independent module of the integration.
+
+    The modules are loaded under a stand-in package so the integration's
+    ``__init__.py`` (which needs Home Assistant) is not executed.
+    """
+    package = "_auto_calibrate"
+    if package not in sys.modules:
+        module = types.ModuleType(package)
+        module.__path__ = [COMPONENT_DIR]
+        sys.modules[package] = module
+    return importlib.import_module(f"{package}.{name}")
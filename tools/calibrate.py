@@ -0,0 +1,292 @@
+"""Calibrate many sensors offline from recorder databases or CSV exports.
+
+Streams the recorded states of a Home Assistant recorder SQLite database
+(or of CSV history exports with ``entity_id,state,last_changed`` columns)
+through the integration's own limit trackers, and writes an onboarding
+manifest for ``auto_calibrate.import_manifest`` that seeds every new
+sensor with the learned limits. Optionally also writes the normalized
+series the sensors would have published.
+
+    python tools/calibrate.py --db home-assistant_v2.db --entity 'sensor.soil_*' \\
+        --mode quantile --manifest calibration.json --series series.csv
+
+Memory use is bounded by the chunk size and the number of entities; the
+database is read in one pass along the recorder's index on
+``(metadata_id, last_updated_ts)``, without sorting.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+import contextlib
+import csv
+from datetime import datetime, timezone
+import fnmatch
+import json
+import sqlite3
+import sys
+from typing import Any, TextIO
+
+from _component import load_component_module
+
+Row = tuple[str, str, float]
+
+const = load_component_module("const")
+engine = load_component_module("engine")
+
+
+class EntityFilter:
+    """Match entity ids against glob patterns, caching the answers."""
+
+    def __init__(self, patterns: list[str]) -> None:
+        """Initialize the filter; no patterns selects every sensor."""
+        self._patterns = patterns or ["sensor.*"]
+        self._cache: dict[str, bool] = {}
+
+    def __call__(self, entity_id: str) -> bool:
+        """Return whether an entity is selected."""
+        if (match := self._cache.get(entity_id)) is None:
+            match = self._cache[entity_id] = any(
+                fnmatch.fnmatchcase(entity_id, pattern) for pattern in self._patterns
+            )
+        return match
+
+
+def read_recorder(path: str, selected: EntityFilter, chunk_size: int) -> Iterator[list[Row]]:
+    """Stream (entity_id, state, timestamp) rows from a recorder database.
+
+    Rows are read entity by entity in time order. The recorder's index on
+    ``(metadata_id, last_updated_ts)`` serves that order, so the selected
+    states are scanned once without a sort.
+    """
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        tables = {
+            row[0]
+            for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        if "states_meta" not in tables:
+            raise SystemExit(
+                f"{path}: recorder schema without states_meta is not supported, "
+                "export the history as CSV instead"
+            )
+        entities = {
+            metadata_id: entity_id
+            for metadata_id, entity_id in connection.execute(
+                "SELECT metadata_id, entity_id FROM states_meta"
+            )
+            if selected(entity_id)
+        }
+        if not entities:
+            return
+        placeholders = ",".join("?" * len(entities))
+        cursor = connection.execute(
+            "SELECT metadata_id, state, last_updated_ts FROM states "
+            f"WHERE metadata_id IN ({placeholders}) "
+            "ORDER BY metadata_id, last_updated_ts",
+            list(entities),
+        )
+        while rows := cursor.fetchmany(chunk_size):
+            yield [
+                (entities[metadata_id], state, timestamp)
+                for metadata_id, state, timestamp in rows
+                if state is not None and timestamp is not None
+            ]
+    finally:
+        connection.close()
+
+
+def _parse_time(value: str) -> float:
+    """Parse an ISO 8601 time of a CSV export into a UTC timestamp."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def read_csv(path: str, selected: EntityFilter, chunk_size: int) -> Iterator[list[Row]]:
+    """Stream (entity_id, state, timestamp) rows from a CSV history export."""
+    with open(path, encoding="utf-8", newline="") as csv_file:
+        chunk: list[Row] = []
+        for row in csv.DictReader(csv_file):
+            entity_id = row["entity_id"]
+            if not selected(entity_id):
+                continue
+            try:
+                chunk.append((entity_id, row["state"], _parse_time(row["last_changed"])))
+            except (KeyError, ValueError):
+                continue
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class Calibrator:
+    """Feed rows into one calibration state per entity."""
+
+    def __init__(self, options: dict[str, Any], series: TextIO | None) -> None:
+        """Initialize the calibrator."""
+        self.options = options
+        self.states: dict[str, Any] = {}
+        self.samples: dict[str, int] = {}
+        self._series = csv.writer(series) if series is not None else None
+        if self._series is not None:
+            self._series.writerow(
+                ["entity_id", "timestamp", "raw", "min_raw", "max_raw", "value"]
+            )
+
+    def process(self, rows: list[Row]) -> None:
+        """Learn from one chunk of rows and write its normalized series.
+
+        Limits are learned row by row; the normalized values of the whole
+        chunk are then computed in one vectorized call.
+        """
+        states = self.states
+        samples = self.samples
+        keep = self._series is not None
+        entity_ids: list[str] = []
+        timestamps: list[float] = []
+        raws: list[float] = []
+        mins: list[float | None] = []
+        maxs: list[float | None] = []
+
+        for entity_id, state_str, timestamp in rows:
+            try:
+                value = float(state_str)
+            except ValueError:
+                continue
+            if (state := states.get(entity_id)) is None:
+                state = states[entity_id] = engine.CalibrationState(
+                    engine.create_limits(self.options)
+                )
+                samples[entity_id] = 0
+            state.update(value, timestamp)
+            samples[entity_id] += 1
+            if keep:
+                entity_ids.append(entity_id)
+                timestamps.append(timestamp)
+                raws.append(value)
+                mins.append(state.limits.min_raw)
+                maxs.append(state.limits.max_raw)
+
+        if keep and raws:
+            values = engine.normalize_many(raws, mins, maxs)
+            self._series.writerows(
+                zip(entity_ids, timestamps, raws, mins, maxs, values, strict=True)
+            )
+
+    def manifest(self, min_samples: int) -> dict[str, Any]:
+        """Return an onboarding manifest seeding every calibrated entity."""
+        sources = []
+        for entity_id in sorted(self.states):
+            if self.samples[entity_id] < min_samples:
+                continue
+            limits = self.states[entity_id].limits
+            sources.append(
+                {
+                    const.CONF_SOURCE_ENTITY: entity_id,
+                    "limits": limits.as_dict(),
+                    "min_raw": limits.min_raw,
+                    "max_raw": limits.max_raw,
+                    "samples": self.samples[entity_id],
+                }
+            )
+        return {"defaults": self.options, "sources": sources}
+
+
+def _write_manifest(path: str, manifest: dict[str, Any]) -> None:
+    """Write the manifest as YAML or JSON depending on the file name."""
+    with open(path, "w", encoding="utf-8") as manifest_file:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("PyYAML is required for YAML manifests") from None
+            yaml.safe_dump(manifest, manifest_file, sort_keys=False)
+        else:
+            json.dump(manifest, manifest_file, indent=2)
+
+
+def main() -> None:
+    """Run the offline calibration."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--db", help="recorder SQLite database")
+    source.add_argument("--csv", nargs="+", help="CSV history exports")
+    parser.add_argument(
+        "--entity",
+        action="append",
+        default=[],
+        help="entity id or glob pattern to calibrate (default: sensor.*)",
+    )
+    parser.add_argument(
+        "--mode",
+        default=const.DEFAULT_LEARNING_MODE,
+        choices=["absolute", "quantile", "window", "decay"],
+    )
+    parser.add_argument("--low-quantile", type=float, default=const.DEFAULT_LOW_QUANTILE)
+    parser.add_argument("--high-quantile", type=float, default=const.DEFAULT_HIGH_QUANTILE)
+    parser.add_argument("--window-days", type=float, default=const.DEFAULT_WINDOW_DAYS)
+    parser.add_argument("--half-life-days", type=float, default=const.DEFAULT_HALF_LIFE_DAYS)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument(
+        "--min-samples",
+        type=int,
+        default=2,
+        help="leave out entities with fewer numeric states",
+    )
+    parser.add_argument("--manifest", help="write the onboarding manifest here")
+    parser.add_argument("--series", help="write the normalized series to this CSV file")
+    args = parser.parse_args()
+
+    options: dict[str, Any] = {const.CONF_LEARNING_MODE: args.mode}
+    if args.mode == "quantile":
+        options[const.CONF_LOW_QUANTILE] = args.low_quantile
+        options[const.CONF_HIGH_QUANTILE] = args.high_quantile
+    elif args.mode == "window":
+        options[const.CONF_WINDOW_DAYS] = args.window_days
+    elif args.mode == "decay":
+        options[const.CONF_HALF_LIFE_DAYS] = args.half_life_days
+
+    selected = EntityFilter(args.entity)
+    if args.db:
+        chunks = read_recorder(args.db, selected, args.chunk_size)
+    else:
+        chunks = (
+            chunk
+            for path in args.csv
+            for chunk in read_csv(path, selected, args.chunk_size)
+        )
+
+    with contextlib.ExitStack() as stack:
+        series = (
+            stack.enter_context(open(args.series, "w", encoding="utf-8", newline=""))
+            if args.series
+            else None
+        )
+        calibrator = Calibrator(options, series)
+        rows = 0
+        for chunk in chunks:
+            calibrator.process(chunk)
+            rows += len(chunk)
+
+    manifest = calibrator.manifest(args.min_samples)
+    if args.manifest:
+        _write_manifest(args.manifest, manifest)
+    print(
+        f"Calibrated {len(manifest['sources'])} of {len(calibrator.states)} entities "
+        f"from {rows} states",
+        file=sys.stderr,
+    )
+    if not args.manifest:
+        json.dump(manifest, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
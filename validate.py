@@ -8,11 +8,27 @@ COMPONENT_DIR = "custom_components/auto_calibrate"
 
 REQUIRED_FILES = [
     "__init__.py",
+    "aggregate.py",
+    "binary_sensor.py",
     "config_flow.py",
     "const.py",
+    "curves.py",
+    "diagnostics.py",
+    "engine.py",
+    "fit.py",
+    "flight_recorder.py",
+    "forecast.py",
+    "history.py",
+    "limits.py",
     "manifest.json",
+    "onboarding.py",
+    "profiles.py",
     "sensor.py",
     "services.yaml",
+    "staleness.py",
+    "stats.py",
+    "store.py",
+    "websocket_api.py",
     "translations/en.json",
 ]
 